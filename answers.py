@@ -0,0 +1,382 @@
+"""Reference answers: the accepted Greek sentences for each prompt.
+
+``build_reference_answers`` realizes every role of a prompt through the
+forward form index (the verb in the prompt's tense, voice, person and
+number; article, adjective or participle agreeing with each noun; a PP's
+noun in the case its preposition governs; an object in the case its verb
+takes), arranges the clause constituents in every order
+``grammar.SENTENCE_PATTERNS`` allows, and keeps the sentences the
+grader (``sentences.grade_sentence``) accepts in full, each with its
+parse tree.  Running ``python answers.py`` writes them to a cache file
+keyed by the lexicon and by the prompt, grammar and grader sources.
+
+At run time ``reference_tree`` accepts a sentence, tree included, with
+one dict probe, and ``next_word`` finds a hint with one dict probe on the
+words typed so far.  A missing or stale cache file just means no stored
+answers.  The answers of a prompt the file lacks (a generated one, say)
+are built on a background thread started by ``prepare_answers``, kept
+in memory only; until they are ready ``answers_pending`` is true.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from itertools import permutations, product
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from accentuation import acute_to_grave_on_ultima, normalize_graves
+from cache import CACHE_DIR, file_digest, read_pickle, write_pickle
+from data import (
+    GENDER_NORMALIZE, LEXICON_LOCK, PROMPTS, WORDS, LexiconChange, form_of,
+    on_reload, surface_forms, translate_english,
+)
+from grammar import FlatTree, ParseNode, encode_tree
+
+ANSWERS_CACHE = CACHE_DIR / "answers.pickle"
+ANSWERS_VERSION = 2
+
+# Modules whose behaviour decides which sentences are accepted.
+_SOURCES = ("data.py", "paradigms.py", "grammar.py", "sentences.py",
+            "accentuation.py", "english.py", "answers.py")
+
+ARTICLE = "ὁ"
+
+# A realized constituent: its alternative token sequences.
+Variants = list[tuple[str, ...]]
+
+
+class ReferenceAnswers(NamedTuple):
+    """The accepted sentences for one prompt."""
+
+    sentences: tuple[str, ...]       # space-joined, model answer first
+    trees: dict[str, bytes]          # sentence → ``FlatTree.to_bytes()``
+    # Citation forms of the words typed so far → possible next words.
+    next_words: dict[tuple[str, ...], tuple[str, ...]]
+
+    @property
+    def model(self) -> str:
+        return self.sentences[0]
+
+
+def roles_key(roles: dict) -> str:
+    """Store key of a prompt's ``roles`` dict."""
+    return json.dumps(roles, sort_keys=True, ensure_ascii=False)
+
+
+# ---------------------------------------------------------------------------
+# Realizing roles as Greek
+# ---------------------------------------------------------------------------
+
+def _lemmas(keyword: str | None, pos: str) -> list[str]:
+    """Lemmas of part of speech *pos* glossed by *keyword*, in a fixed order."""
+    if not keyword:
+        return []
+    return sorted(lemma for lemma in translate_english(keyword)
+                  if WORDS[lemma]["pos"] == pos)
+
+
+def _inflect(lemma: str, **features: str) -> list[str]:
+    """Surface forms of *lemma* with *features* (both ν-movable spellings)."""
+    form = form_of(lemma, **features)
+    return surface_forms(form) if form else []
+
+
+def _verb_forms(lemma: str, tense: str, voice: str, **features: str) -> list[str]:
+    """Forms of verb *lemma*; deponents answer an active prompt with
+    middle forms, as the grader allows."""
+    forms = _inflect(lemma, tense=tense, voice=voice, **features)
+    if not forms and voice == "act" and WORDS[lemma].get("deponent"):
+        forms = _inflect(lemma, tense=tense, voice="mid", **features)
+    return forms
+
+
+def _noun_phrases(np: dict, case: str, number: str = "sg") -> Variants:
+    """Token sequences for the noun phrase *np* in *case* and *number*."""
+    variants: Variants = []
+    for noun in _lemmas(np.get("noun"), "noun"):
+        gender = GENDER_NORMALIZE.get(WORDS[noun].get("gender", ""))
+        nouns = _inflect(noun, case=case, number=number)
+        if np.get("indef"):
+            # NP → N is the only article-less noun phrase.
+            if not (np.get("adj") or np.get("participle")):
+                variants.extend((n,) for n in nouns)
+            continue
+        articles = _inflect(ARTICLE, case=case, number=number, gender=gender)
+        modifiers: list[str] = []
+        if np.get("adj"):
+            for adj in _lemmas(np["adj"], "adjective"):
+                modifiers += _inflect(adj, case=case, number=number, gender=gender)
+        part = np.get("participle")
+        if part:
+            for verb in _lemmas(part.get("verb"), "verb"):
+                modifiers += _verb_forms(
+                    verb, part.get("tense") or "pres", part.get("voice") or "act",
+                    mood="ptcp", case=case, number=number, gender=gender)
+        if not (np.get("adj") or part):
+            variants.extend(product(articles, nouns))
+            continue
+        for art, noun_form, modifier in product(articles, nouns, modifiers):
+            variants.append((art, modifier, noun_form))
+            variants.append((art, noun_form, modifier))
+    return variants
+
+
+def _prepositional_phrases(pp: dict) -> Variants:
+    variants: Variants = []
+    for prep in _lemmas(pp.get("prep"), "preposition"):
+        case = WORDS[prep].get("governs") or "acc"
+        np = {"noun": pp.get("noun"), "adj": pp.get("adj")}
+        for prep_form in _inflect(prep):
+            variants.extend((prep_form,) + tokens
+                            for tokens in _noun_phrases(np, case))
+    return variants
+
+
+def _orderings(constituents: list[Variants]) -> Iterator[tuple[str, ...]]:
+    """Every word order of *constituents*, each in every variant; the
+    given order comes first."""
+    for order in permutations(constituents):
+        for parts in product(*order):
+            yield tuple(token for part in parts for token in part)
+
+
+def _infinitive_phrases(inf: dict) -> Variants:
+    variants: Variants = []
+    for verb in _lemmas(inf.get("verb"), "verb"):
+        constituents = [[(form,) for form in _verb_forms(
+            verb, inf.get("tense") or "pres", inf.get("voice") or "act",
+            mood="inf")]]
+        if inf.get("object"):
+            obj_case = WORDS[verb].get("object_case") or "acc"
+            constituents.append(_noun_phrases(inf["object"], obj_case))
+        if inf.get("pp"):
+            constituents.append(_prepositional_phrases(inf["pp"]))
+        variants.extend(_orderings(constituents))
+    return variants
+
+
+def candidate_sentences(roles: dict) -> Iterator[tuple[str, ...]]:
+    """Token lists expressing *roles*, in the citation accent of each word.
+
+    Candidates follow the English word order first.  They are what the
+    grammar can build from the prompt's words, not yet graded.
+    """
+    person = roles.get("person") or "3"
+    number = roles.get("number") or "sg"
+    for verb in _lemmas(roles.get("verb"), "verb"):
+        verbs = _verb_forms(verb, roles.get("tense") or "pres",
+                            roles.get("voice") or "act", mood="ind",
+                            person=person, number=number)
+        constituents = [[(form,) for form in verbs]]
+        if roles.get("subject"):
+            constituents.insert(0, _noun_phrases(roles["subject"], "nom", number))
+        if roles.get("object"):
+            obj_case = WORDS[verb].get("object_case") or "acc"
+            constituents.append(_noun_phrases(roles["object"], obj_case))
+        if roles.get("dative"):
+            constituents.append(_noun_phrases(roles["dative"], "dat"))
+        if roles.get("pp"):
+            constituents.append(_prepositional_phrases(roles["pp"]))
+        if roles.get("infinitive"):
+            constituents.append(_infinitive_phrases(roles["infinitive"]))
+        if all(constituents):
+            yield from _orderings(constituents)
+
+
+def sentential_accents(tokens: Iterable[str]) -> list[str]:
+    """*tokens* with the grave rule applied to every word but the last."""
+    tokens = list(tokens)
+    return [acute_to_grave_on_ultima(t) for t in tokens[:-1]] + tokens[-1:]
+
+
+def _index_answers(trees: dict[str, bytes]) -> ReferenceAnswers:
+    next_words: dict[tuple[str, ...], list[str]] = {}
+    for sentence in trees:
+        words = [normalize_graves(t) for t in sentence.split()]
+        for i, word in enumerate(words):
+            following = next_words.setdefault(tuple(words[:i]), [])
+            if word not in following:
+                following.append(word)
+    return ReferenceAnswers(
+        tuple(trees), trees,
+        {prefix: tuple(words) for prefix, words in next_words.items()},
+    )
+
+
+def build_reference_answers(
+        prompts: Iterable[dict] = PROMPTS,
+        grade: Callable[[list[str], dict], ParseNode | None] | None = None,
+) -> dict[str, ReferenceAnswers]:
+    """Generate and grade the reference answers of *prompts*.
+
+    *grade(tokens, roles)* returns the parse tree of an accepted sentence
+    and None otherwise; it defaults to the full sentence grader.  Prompts
+    with no accepted candidate are left out.  Slow (it parses every
+    candidate); run offline via ``python answers.py``.
+    """
+    if grade is None:
+        from sentences import grade_sentence
+
+        def grade(tokens: list[str], roles: dict) -> ParseNode | None:
+            with LEXICON_LOCK:   # may run beside the learner's session
+                analysis = grade_sentence(tokens, roles)
+            return analysis.tree if analysis.correct else None
+
+    store: dict[str, ReferenceAnswers] = {}
+    for prompt in prompts:
+        roles = prompt.get("roles")
+        if not roles:
+            continue
+        key = roles_key(roles)
+        if key in store:
+            continue
+        trees: dict[str, bytes] = {}
+        for candidate in candidate_sentences(roles):
+            tokens = sentential_accents(candidate)
+            sentence = " ".join(tokens)
+            if sentence in trees:
+                continue
+            tree = grade(tokens, roles)
+            if tree is not None:
+                trees[sentence] = encode_tree(tree).to_bytes()
+        if trees:
+            store[key] = _index_answers(trees)
+    return store
+
+
+# ---------------------------------------------------------------------------
+# Cache file
+# ---------------------------------------------------------------------------
+
+# Roles key → answers; None marks a prompt built at run time with no
+# accepted answer, so it is not built again.
+_ANSWERS: dict[str, ReferenceAnswers | None] | None = None
+_PENDING: set[str] = set()   # roles keys being built in the background
+# Guards _ANSWERS and _PENDING, written by prepare_answers' threads.
+_ANSWERS_LOCK = threading.Lock()
+
+
+def _answers_key() -> str:
+    here = Path(__file__).parent
+    return f"{WORDS.digest}:{file_digest(*(here / name for name in _SOURCES))}"
+
+
+def save_reference_answers(store: dict[str, ReferenceAnswers]) -> None:
+    global _ANSWERS
+    write_pickle(ANSWERS_CACHE, {
+        "version": ANSWERS_VERSION, "key": _answers_key(), "answers": store,
+    })
+    with _ANSWERS_LOCK:
+        _ANSWERS = store
+
+
+def get_reference_answers() -> dict[str, ReferenceAnswers | None]:
+    """Return the stored answers by ``roles_key``; empty if the cache file
+    is missing or was built from other sources.
+
+    Read and write the returned dict under ``_ANSWERS_LOCK``.
+    """
+    global _ANSWERS
+    with _ANSWERS_LOCK:
+        if _ANSWERS is None:
+            cached = read_pickle(ANSWERS_CACHE)
+            if (isinstance(cached, dict)
+                    and cached.get("version") == ANSWERS_VERSION
+                    and cached.get("key") == _answers_key()):
+                _ANSWERS = cached["answers"]
+            else:
+                _ANSWERS = {}
+        return _ANSWERS
+
+
+@on_reload
+def _drop_answers(change: LexiconChange) -> None:
+    global _ANSWERS
+    with _ANSWERS_LOCK:
+        _ANSWERS = None
+
+
+def reference_answers(roles: dict) -> ReferenceAnswers | None:
+    store = get_reference_answers()
+    with _ANSWERS_LOCK:
+        return store.get(roles_key(roles))
+
+
+def prepare_answers(prompt: dict) -> None:
+    """Start building *prompt*'s answers on a background thread unless
+    they are stored or already being built.
+
+    A build grades every candidate (up to about a second in all); the
+    result joins the in-memory store only, None if no candidate passed.
+    """
+    roles = prompt.get("roles")
+    if not roles:
+        return
+    store = get_reference_answers()
+    key = roles_key(roles)
+    with _ANSWERS_LOCK:
+        if key in store or key in _PENDING:
+            return
+        _PENDING.add(key)
+
+    def build() -> None:
+        try:
+            answers = build_reference_answers([prompt]).get(key)
+            with _ANSWERS_LOCK:
+                store[key] = answers
+        finally:
+            with _ANSWERS_LOCK:
+                _PENDING.discard(key)
+
+    threading.Thread(target=build, daemon=True).start()
+
+
+def answers_pending(roles: dict) -> bool:
+    """Whether a ``prepare_answers`` build for *roles* is still running."""
+    with _ANSWERS_LOCK:
+        return roles_key(roles) in _PENDING
+
+
+def reference_tree(roles: dict, tokens: list[str]) -> FlatTree | None:
+    """The parse tree of *tokens* if they are exactly (accents included)
+    a stored answer, else None."""
+    answers = reference_answers(roles)
+    blob = answers and answers.trees.get(" ".join(tokens))
+    return FlatTree.from_bytes(blob) if blob else None
+
+
+def next_word(roles: dict, tokens: list[str]) -> str | None:
+    """Citation form of a word that continues *tokens* towards a stored
+    answer (the model answer's, when *tokens* begin it), or None if no
+    answer begins with *tokens*."""
+    answers = reference_answers(roles)
+    if answers is None:
+        return None
+    following = answers.next_words.get(
+        tuple(normalize_graves(t) for t in tokens))
+    return following[0] if following else None
+
+
+def main() -> int:
+    # Build through the importable module, the one ``sentences`` shares,
+    # not this file's second copy running as ``__main__``.
+    import answers
+
+    start = time.perf_counter()
+    store = answers.build_reference_answers()
+    answers.save_reference_answers(store)
+    roles = {roles_key(p["roles"]) for p in PROMPTS if p.get("roles")}
+    missing = len(roles - store.keys())
+    total = sum(len(a.sentences) for a in store.values())
+    print(f"{total} answers for {len(store)} prompts "
+          f"({missing} without one) in {time.perf_counter() - start:.1f} s "
+          f"→ {answers.ANSWERS_CACHE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
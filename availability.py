@@ -0,0 +1,211 @@
+"""Which sentence prompts the learner can attempt, as bitset tests.
+
+Every prompt in ``PROMPTS`` is compiled once into requirement masks over
+bit ids of the lemmas prompts mention: one bit per English keyword with
+a single Greek equivalent (all must be known) and an OR-group mask per
+keyword with several.  The learner's vocabulary is a mask too, so a
+prompt is available when ``vocab & required == required`` and every
+OR-group intersects ``vocab``.
+
+``Availability`` keeps the available set for one vocabulary list and is
+updated by ``add_to_vocabulary``, which only re-tests the prompts that
+mention the new lemma.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import data
+from data import PROMPTS, LexiconChange, on_reload, translate_english
+
+# Vocabulary lists whose availability is tracked at once.
+MAX_TRACKED = 8
+
+
+def _collect_english_words(roles: dict) -> list[str]:
+    """Extract all English keywords from a roles dict."""
+    words: list[str] = []
+    if "verb" in roles:
+        words.append(roles["verb"])
+    for key in ("subject", "object", "dative"):
+        np = roles.get(key)
+        if isinstance(np, dict):
+            if "noun" in np:
+                words.append(np["noun"])
+            if "adj" in np:
+                words.append(np["adj"])
+            part = np.get("participle")
+            if isinstance(part, dict) and "verb" in part:
+                words.append(part["verb"])
+    pp = roles.get("pp")
+    if isinstance(pp, dict):
+        if "prep" in pp:
+            words.append(pp["prep"])
+        if "noun" in pp:
+            words.append(pp["noun"])
+    inf = roles.get("infinitive")
+    if isinstance(inf, dict):
+        if "verb" in inf:
+            words.append(inf["verb"])
+        inf_obj = inf.get("object")
+        if isinstance(inf_obj, dict) and "noun" in inf_obj:
+            words.append(inf_obj["noun"])
+        inf_pp = inf.get("pp")
+        if isinstance(inf_pp, dict):
+            if "prep" in inf_pp:
+                words.append(inf_pp["prep"])
+            if "noun" in inf_pp:
+                words.append(inf_pp["noun"])
+    return words
+
+
+def _needs_article(roles: dict) -> bool:
+    """Check if any NP in roles is definite (requires the article ὁ)."""
+    for key in ("subject", "object", "dative"):
+        np = roles.get(key)
+        if isinstance(np, dict) and not np.get("indef"):
+            return True
+    pp = roles.get("pp")
+    if isinstance(pp, dict) and "noun" in pp:
+        return True
+    inf = roles.get("infinitive")
+    if isinstance(inf, dict):
+        inf_obj = inf.get("object")
+        if isinstance(inf_obj, dict) and not inf_obj.get("indef"):
+            return True
+        inf_pp = inf.get("pp")
+        if isinstance(inf_pp, dict) and "noun" in inf_pp:
+            return True
+    return False
+
+
+class PromptIndex:
+    """``PROMPTS`` compiled to requirement masks (see the module docstring)."""
+
+    def __init__(self, prompts: list[dict]):
+        self.prompts = [p for p in prompts if p.get("roles")]
+        self.bits: dict[str, int] = {}
+        self.required: list[int] = []
+        self.groups: list[tuple[int, ...]] = []
+        self.possible: list[bool] = []
+        # bit → indexes of the prompts that mention it
+        self.by_bit: dict[int, list[int]] = {}
+        self.english_index = data.get_english_index()
+        for i, prompt in enumerate(self.prompts):
+            roles = prompt["roles"]
+            alternatives = [translate_english(eng)
+                            for eng in _collect_english_words(roles)]
+            if _needs_article(roles):
+                alternatives.append(frozenset(("ὁ",)))
+            required, groups = 0, []
+            for lemmas in alternatives:
+                mask = self.mask(lemmas, assign=True)
+                if len(lemmas) == 1:
+                    required |= mask
+                else:
+                    groups.append(mask)
+                for lemma in lemmas:
+                    self.by_bit.setdefault(self.bits[lemma], []).append(i)
+            self.required.append(required)
+            self.groups.append(tuple(groups))
+            self.possible.append(all(alternatives))
+
+    def mask(self, lemmas: Iterable[str], assign: bool = False) -> int:
+        """Return the bitset of *lemmas*; others are ignored unless
+        *assign* gives them fresh bits."""
+        mask = 0
+        for lemma in lemmas:
+            bit = self.bits.get(lemma)
+            if bit is None:
+                if not assign:
+                    continue
+                bit = self.bits[lemma] = 1 << len(self.bits)
+            mask |= bit
+        return mask
+
+    def satisfied(self, i: int, vocab: int) -> bool:
+        """Whether prompt *i* is available to the vocabulary mask *vocab*."""
+        required = self.required[i]
+        if not self.possible[i] or vocab & required != required:
+            return False
+        return all(vocab & group for group in self.groups[i])
+
+
+class Availability:
+    """The prompts available to one growing vocabulary."""
+
+    def __init__(self, index: PromptIndex, vocab: list[str]):
+        self.index = index
+        self.count = len(vocab)
+        self.vocab = index.mask(vocab)
+        self.available = {i for i in range(len(index.prompts))
+                          if index.satisfied(i, self.vocab)}
+
+    def learn(self, lemma: str) -> None:
+        """Record one lemma appended to the vocabulary."""
+        self.count += 1
+        bit = self.index.bits.get(lemma, 0)
+        if not bit or self.vocab & bit:
+            return
+        self.vocab |= bit
+        for i in self.index.by_bit[bit]:
+            if i not in self.available and self.index.satisfied(i, self.vocab):
+                self.available.add(i)
+
+    def prompts(self) -> list[dict]:
+        """The available prompts, in ``PROMPTS`` order."""
+        return [self.index.prompts[i] for i in sorted(self.available)]
+
+
+_PROMPT_INDEX: PromptIndex | None = None
+# id(vocabulary list) → (the list, its tracker)
+_TRACKERS: dict[int, tuple[list, Availability]] = {}
+
+
+def get_prompt_index() -> PromptIndex:
+    """Return the compiled prompts, recompiling if the English index was
+    replaced."""
+    global _PROMPT_INDEX
+    if (_PROMPT_INDEX is None
+            or _PROMPT_INDEX.english_index is not data.get_english_index()):
+        _PROMPT_INDEX = PromptIndex(PROMPTS)
+        _TRACKERS.clear()
+    return _PROMPT_INDEX
+
+
+@on_reload
+def _recompile_prompts(change: LexiconChange) -> None:
+    global _PROMPT_INDEX
+    if change.glosses:
+        _PROMPT_INDEX = None
+        _TRACKERS.clear()
+
+
+def _tracker(user_vocab: list[str]) -> Availability:
+    index = get_prompt_index()
+    tracked = _TRACKERS.get(id(user_vocab))
+    if (tracked is None or tracked[0] is not user_vocab
+            or tracked[1].count != len(user_vocab)):
+        if len(_TRACKERS) >= MAX_TRACKED:
+            del _TRACKERS[next(iter(_TRACKERS))]
+        tracked = _TRACKERS[id(user_vocab)] = (
+            user_vocab, Availability(index, user_vocab))
+    return tracked[1]
+
+
+def get_available_prompts(user_vocab: list[str]) -> list[dict]:
+    """Return prompts for which the user knows all required lemmas.
+
+    The result for a given list is kept and updated by ``note_learned``;
+    a list changed any other way is re-scanned once.
+    """
+    return _tracker(user_vocab).prompts()
+
+
+def note_learned(user_vocab: list[str], lemma: str) -> None:
+    """Update availability after *lemma* was appended to *user_vocab*."""
+    tracked = _TRACKERS.get(id(user_vocab))
+    if (tracked is not None and tracked[0] is user_vocab
+            and tracked[1].count == len(user_vocab) - 1):
+        tracked[1].learn(lemma)
@@ -0,0 +1,429 @@
+"""Scaling benchmark: index build, lookup and parse cost on large lexicons.
+
+Usage::
+
+    python benchmark.py [--sizes 1000 10000 100000] [-o results.json]
+                        [--baseline old.json]
+
+Each size is a synthetic lexicon: the real entries of ``words.py`` plus
+made-up lemmas cloned from their noun, verb and adjective paradigms
+(same cells, same endings, a fresh stem), so paradigm sizes and the
+within-paradigm syncretism are those of the real data.  A fraction of
+the clones (``--homographs``) reuse an earlier stem with the same
+paradigm, giving whole-paradigm homographs across lemmas.
+
+For every size the lexicon is compiled to a temp file and swapped into
+``data`` in place of the real one; then we measure:
+
+  build     ``_build_english_to_greek``, ``get_english_index``, a
+            ``get_form_index`` build with no cache (form, base and
+            forward indexes plus writing the cache), a cold
+            ``get_form_index`` load from that cache, the reading index
+  memory    peak and retained traced allocations of the uncached
+            ``get_form_index`` build (a separate, slower pass under
+            ``tracemalloc``)
+  lookup    ``lookup_form`` latency percentiles over a mix of known
+            forms, grave-accented variants and misses
+  prompts   ``get_available_prompts`` latency for a vocabulary that
+            grows with the lexicon
+  parse     ``check_sentence`` latency on sentences of real and
+            synthetic words
+
+Results are written as JSON; with ``--baseline`` each timing is compared
+against an earlier run and ratios above ``--threshold`` are reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+import data
+from lexicon import Lexicon, LexiconWriter
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+SIZES = (1_000, 10_000, 100_000)
+HOMOGRAPH_RATE = 0.02
+# Share of open-class lemmas in a real dictionary.
+POS_WEIGHTS = {"noun": 0.5, "verb": 0.3, "adjective": 0.2}
+LOOKUP_SAMPLES = 20_000
+PROMPT_REPEATS = 200
+PARSE_REPEATS = 20
+REGRESSION_THRESHOLD = 1.5
+
+_SYLLABLES = [c + v for c in "βγδθκλμνπρστφχ" for v in "αεοι"]
+_SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+# ---------------------------------------------------------------------------
+# Synthetic lexicons
+# ---------------------------------------------------------------------------
+
+def _stem(i: int) -> str:
+    """A unique, pronounceable stem for clone number *i* (at least 2
+    syllables)."""
+    syllables = []
+    while True:
+        i, digit = divmod(i, len(_SYLLABLES))
+        syllables.append(_SYLLABLES[digit])
+        if i == 0 and len(syllables) >= 2:
+            return "".join(syllables)
+
+
+def _plain_entry(entry) -> dict:
+    """Copy a lexicon entry view into plain dicts and lists."""
+    result = {}
+    for key, value in entry.items():
+        if key == "principal_parts":
+            continue  # the clone stores its full table
+        if key == "forms":
+            value = dict(value)
+        elif isinstance(value, tuple):
+            value = list(value)
+        result[key] = value
+    return result
+
+
+def synthesize_lexicon(size: int, homographs: float = HOMOGRAPH_RATE,
+                       seed: int = 0) -> Iterator[tuple[str, dict]]:
+    """Yield ``(lemma, entry)`` for a lexicon of *size* lemmas.
+
+    The real entries come first, unchanged; the rest are clones of real
+    nouns, verbs and adjectives (see the module docstring).
+    """
+    rng = random.Random(seed)
+    real = [(lemma, _plain_entry(entry)) for lemma, entry in data.WORDS.items()]
+    yield from real[:size]
+
+    by_pos: dict[str, list[dict]] = {}
+    for _, entry in real:
+        if entry["pos"] in POS_WEIGHTS:
+            by_pos.setdefault(entry["pos"], []).append(entry)
+    kinds = list(POS_WEIGHTS)
+    weights = [POS_WEIGHTS[pos] for pos in kinds]
+
+    issued: list[tuple[str, dict]] = []   # (stem, template) for homographs
+    reuse_count: dict[str, int] = {}
+    for i in range(size - len(real)):
+        if issued and rng.random() < homographs:
+            stem, template = rng.choice(issued)
+            n = reuse_count[stem] = reuse_count.get(stem, 1) + 1
+            lemma = stem + template["lemma"] + str(n).translate(_SUPERSCRIPTS)
+        else:
+            template = rng.choice(by_pos[rng.choices(kinds, weights)[0]])
+            stem = _stem(i)
+            issued.append((stem, template))
+            lemma = stem + template["lemma"]
+        entry = dict(template)
+        entry["lemma"] = lemma
+        entry["forms"] = {key: stem + form
+                          for key, form in template["forms"].items()}
+        entry["translations"] = [f"{eng} {i}"
+                                 for eng in template.get("translations", ())]
+        yield lemma, entry
+
+
+def build_synthetic_lexicon(size: int, path: Path,
+                            homographs: float = HOMOGRAPH_RATE,
+                            seed: int = 0) -> Lexicon:
+    """Compile a synthetic lexicon of *size* lemmas to *path* and open it."""
+    digest = hashlib.sha256(f"synthetic:{size}:{homographs}:{seed}".encode())
+    writer = LexiconWriter(digest.hexdigest(), max_interned=1 << 18)
+    for lemma, entry in synthesize_lexicon(size, homographs, seed):
+        writer.add(lemma, entry)
+    with open(path, "wb") as f:
+        writer.write_to(f)
+    return Lexicon.open(path)
+
+
+# ---------------------------------------------------------------------------
+# Swapping a lexicon into ``data``
+# ---------------------------------------------------------------------------
+
+_DATA_STATE = ("WORDS", "_ENGLISH_TO_GREEK", "_ENGLISH_INDEX", "FORM_INDEX_CACHE", "_FORM_INDEX",
+               "_BASE_INDEX", "_FORWARD_INDEX", "_LEMMA_IDS", "_NEXT_LEMMA_ID",
+               "_READING_INDEX")
+
+
+def _reset_indexes() -> None:
+    data._FORM_INDEX = data._BASE_INDEX = data._FORWARD_INDEX = None
+    data._LEMMA_IDS = data._READING_INDEX = None
+
+
+@contextmanager
+def installed(lexicon: Lexicon, cache_dir: Path):
+    """Make *lexicon* the app's lexicon for the duration of the block.
+
+    The form index cache goes to *cache_dir*, so the real cache is left
+    alone; everything is restored on exit.
+    """
+    saved = {name: getattr(data, name) for name in _DATA_STATE}
+    try:
+        data.WORDS = lexicon
+        data.FORM_INDEX_CACHE = cache_dir / "form_index.pickle"
+        data._ENGLISH_TO_GREEK = data._ENGLISH_INDEX = None
+        _reset_indexes()
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(data, name, value)
+
+
+# ---------------------------------------------------------------------------
+# Measurements
+# ---------------------------------------------------------------------------
+
+def _timed(fn: Callable, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def percentiles(samples: list[float], scale: float = 1.0) -> dict[str, float]:
+    """p50/p90/p99/max of *samples* (multiplied by *scale*), rounded."""
+    ordered = sorted(samples)
+    n = len(ordered)
+
+    def at(q: float) -> float:
+        return round(ordered[min(n - 1, int(q * n))] * scale, 3)
+
+    return {"p50": at(0.50), "p90": at(0.90), "p99": at(0.99),
+            "max": round(ordered[-1] * scale, 3)}
+
+
+def _latencies(calls: list[tuple[Callable, tuple]]) -> list[float]:
+    """Time each ``fn(*args)`` call separately, in seconds."""
+    clock = time.perf_counter_ns
+    samples = []
+    for fn, args in calls:
+        start = clock()
+        fn(*args)
+        samples.append((clock() - start) / 1e9)
+    return samples
+
+
+def _with_grave(form: str) -> str:
+    """*form* with its last acute turned grave, as in running text."""
+    nfd = unicodedata.normalize("NFD", form)
+    at = nfd.rfind("\u0301")
+    if at < 0:
+        return form
+    return unicodedata.normalize("NFC", nfd[:at] + "\u0300" + nfd[at + 1:])
+
+
+def _lookup_queries(rng: random.Random, forms: list[str],
+                    n: int) -> list[str]:
+    """70% known forms, 20% grave variants of known forms, 10% misses."""
+    queries = []
+    for _ in range(n):
+        form = rng.choice(forms)
+        roll = rng.random()
+        if roll < 0.2:
+            form = _with_grave(form)
+        elif roll < 0.3:
+            form += "ξ"
+        queries.append(form)
+    return queries
+
+
+def _parse_sentences(rng: random.Random, lemmas: list[str],
+                     count: int = 10) -> list[list[str]]:
+    """Real sentences plus ``Art N V Art N`` sentences of synthetic words."""
+    sentences = [
+        "ὁ ἄνθρωπος λύει τὸν ἵππον".split(),
+        "τὸν ἵππον λύει ὁ ἄνθρωπος".split(),
+        "ὁ θεὸς ἐπιτρέπει τῷ ἀνθρώπῳ λύειν τὸν ἵππον".split(),
+    ]
+    nouns = [l for l in lemmas if data.WORDS[l]["pos"] == "noun"]
+    verbs = [l for l in lemmas if data.WORDS[l]["pos"] == "verb"
+             and data.WORDS[l].get("object_case", "acc") == "acc"]
+    attempts = 0
+    while len(sentences) < 3 + count and nouns and verbs and attempts < 100:
+        attempts += 1
+        subject, obj = rng.choice(nouns), rng.choice(nouns)
+        verb = rng.choice(verbs)
+        words = []
+        for noun, case in ((subject, "nom"), (obj, "acc")):
+            gender = data.GENDER_NORMALIZE.get(data.WORDS[noun].get("gender"))
+            words.append(data.form_of("ὁ", case=case, number="sg",
+                                      gender=gender))
+            words.append(data.form_of(noun, case=case, number="sg"))
+        words.insert(2, data.form_of(verb, tense="pres", voice="act",
+                                     mood="ind", person="3", number="sg"))
+        if None not in words:
+            sentences.append([w.replace("(ν)", "ν") for w in words])
+    return sentences
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux and bytes on macOS.
+    return round(kb / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+def measure(size: int, homographs: float = HOMOGRAPH_RATE, seed: int = 0,
+            trace_memory: bool = True) -> dict:
+    """Run every measurement against a synthetic lexicon of *size* lemmas."""
+    from grammar import check_sentence
+    from sentences import get_available_prompts
+
+    rng = random.Random(seed)
+    real = len(data.WORDS)
+    result: dict = {"size": size}
+    with tempfile.TemporaryDirectory(prefix="grlx-bench.") as tmp:
+        tmp = Path(tmp)
+        lexicon, seconds = _timed(build_synthetic_lexicon, size,
+                                  tmp / "lexicon.bin", homographs, seed)
+        result["compile_s"] = round(seconds, 3)
+        with installed(lexicon, tmp):
+            build = result["build_s"] = {}
+            _, build["english_index"] = _timed(data._build_english_to_greek)
+            _, build["english_keys"] = _timed(data.get_english_index)
+            # The cache directory is fresh, so this builds and persists.
+            index, build["form_index_cold"] = _timed(data.get_form_index)
+            _reset_indexes()
+            _, build["form_index_cache_load"] = _timed(data.get_form_index)
+            _, build["reading_index"] = _timed(data.get_reading_index)
+            for name, value in build.items():
+                build[name] = round(value, 3)
+
+            result["lemmas"] = len(lexicon)
+            result["forms"] = len(index)
+            result["analyses"] = sum(map(len, index.values()))
+            result["homograph_forms"] = sum(
+                1 for analyses in index.values()
+                if len({lemma for lemma, _, _ in analyses}) > 1)
+            del index
+
+            if trace_memory:
+                _reset_indexes()
+                data.FORM_INDEX_CACHE.unlink()
+                tracemalloc.start()
+                data.get_form_index()
+                retained, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                result["form_index_memory_mb"] = {
+                    "peak": round(peak / (1 << 20), 1),
+                    "retained": round(retained / (1 << 20), 1),
+                }
+
+            forms = list(data.get_form_index())
+            queries = _lookup_queries(rng, forms, LOOKUP_SAMPLES)
+            samples = _latencies([(data.lookup_form, (q,)) for q in queries])
+            result["lookup_form_us"] = percentiles(samples, 1e6)
+
+            # The learner knows the real words and every tenth clone.
+            lemmas = list(lexicon)
+            vocab = [l for i, l in enumerate(lemmas)
+                     if i < real or i % 10 == 0]
+            samples = _latencies([(get_available_prompts, (vocab,))]
+                                 * PROMPT_REPEATS)
+            result["available_prompts_ms"] = percentiles(samples, 1e3)
+
+            sentences = _parse_sentences(rng, lemmas)
+            calls = [(check_sentence, (tokens,)) for tokens in sentences]
+            result["parsed"] = sum(check_sentence(t)[0] for t in sentences)
+            result["sentences"] = len(sentences)
+            samples = _latencies(calls * PARSE_REPEATS)
+            result["parse_ms"] = percentiles(samples, 1e3)
+    result["max_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Regression report
+# ---------------------------------------------------------------------------
+
+def _timings(result: dict, prefix: str = "") -> Iterator[tuple[str, float]]:
+    """Flatten a result into ``(name, value)`` pairs of its timings."""
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _timings(value, name + ".")
+        elif key.endswith(("_s", "_ms", "_us")) or prefix.endswith(
+                ("_s.", "_ms.", "_us.")):
+            if isinstance(value, (int, float)):
+                yield name, value
+
+
+def compare(results: list[dict], baseline: list[dict],
+            threshold: float = REGRESSION_THRESHOLD) -> list[str]:
+    """Return a line per timing that grew by more than *threshold*× over
+    the baseline run of the same size."""
+    old_by_size = {r["size"]: dict(_timings(r)) for r in baseline}
+    lines = []
+    for result in results:
+        old = old_by_size.get(result["size"], {})
+        for name, value in _timings(result):
+            before = old.get(name)
+            if before and value / before > threshold:
+                lines.append(f"{result['size']:>7} {name}: {before} → "
+                             f"{value} ({value / before:.1f}×)")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--homographs", type=float, default=HOMOGRAPH_RATE,
+                        help="share of lemmas that repeat another's paradigm")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc pass")
+    parser.add_argument("-o", "--output", type=Path,
+                        default=Path("benchmark.json"))
+    parser.add_argument("--baseline", type=Path,
+                        help="earlier results to compare against")
+    parser.add_argument("--threshold", type=float,
+                        default=REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        print(f"{size} lemmas …", file=sys.stderr)
+        result = measure(size, args.homographs, args.seed,
+                         trace_memory=not args.no_memory)
+        print(json.dumps(result, ensure_ascii=False), file=sys.stderr)
+        results.append(result)
+
+    report = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "homographs": args.homographs,
+        "seed": args.seed,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False)
+                           + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}.")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline["results"], args.threshold)
+        for line in regressions:
+            print(f"  slower: {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
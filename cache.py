@@ -0,0 +1,51 @@
+"""On-disk cache for compiled artifacts (grammar snapshot, indexes)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+def file_digest(*paths: str | Path) -> str:
+    """Return a SHA-256 hex digest over the contents of *paths*."""
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def atomic_write(path: Path, payload: bytes) -> None:
+    """Write *payload* to *path* via a temp file and rename.
+
+    Concurrent processes never observe a half-written file, and a failed
+    write (e.g. read-only checkout) leaves the cache untouched.
+    """
+    import tempfile
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def read_pickle(path: Path):
+    """Load a pickled cache file, or return None if missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, ValueError):
+        return None
+
+
+def write_pickle(path: Path, obj) -> None:
+    atomic_write(path, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
@@ -0,0 +1,136 @@
+"""Tab-completion of Greek surface forms at the ``Greek>`` prompt.
+
+``PrefixIndex`` holds every surface form of the form index, with graves
+normalized, as one sorted string plus an offset array.  Forms that share
+a prefix are contiguous, so a prefix lookup is two binary searches, and
+memory stays close to the size of the text itself (a dict-per-node trie
+costs a few hundred bytes per node, i.e. tens of MB at 100k forms).
+"""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from contextlib import contextmanager
+from typing import Callable, Iterable
+
+from accentuation import normalize_graves
+from data import LexiconChange, get_form_index, on_reload
+
+try:
+    import readline
+except ImportError:  # e.g. Windows without pyreadline
+    readline = None
+
+COMPLETION_LIMIT = 40
+
+
+class PrefixIndex:
+    """Sorted, grave-normalized surface forms packed for prefix search."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, forms: Iterable[str]):
+        unique = sorted({normalize_graves(f) for f in forms})
+        self._blob = "".join(unique)
+        self._offsets = array("I", [0])
+        end = 0
+        for form in unique:
+            end += len(form)
+            self._offsets.append(end)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._blob[self._offsets[i]:self._offsets[i + 1]]
+
+    def prefix_range(self, prefix: str) -> range:
+        """Return the index range of forms starting with *prefix*."""
+        lo = bisect.bisect_left(self, prefix)
+        hi = bisect.bisect_left(self, prefix + "\U0010ffff", lo)
+        return range(lo, hi)
+
+    def complete(self, prefix: str,
+                 rank: Callable[[str], object] | None = None,
+                 limit: int = COMPLETION_LIMIT) -> list[str]:
+        """Return up to *limit* forms starting with *prefix*.
+
+        Forms are alphabetical, or ordered by *rank* (ties stay
+        alphabetical).
+        """
+        prefix = normalize_graves(prefix)
+        forms = [self[i] for i in self.prefix_range(prefix)]
+        if rank is not None:
+            forms.sort(key=rank)
+        return forms[:limit]
+
+
+_PREFIX_INDEX: PrefixIndex | None = None
+
+
+def get_prefix_index() -> PrefixIndex:
+    """Return the prefix index over all known forms, building it once."""
+    global _PREFIX_INDEX
+    if _PREFIX_INDEX is None:
+        _PREFIX_INDEX = PrefixIndex(get_form_index())
+    return _PREFIX_INDEX
+
+
+@on_reload
+def _drop_prefix_index(change: LexiconChange) -> None:
+    """The packed layout cannot take insertions: rebuild lazily, and only
+    when the set of forms changed."""
+    global _PREFIX_INDEX
+    if change.forms_added or change.forms_removed:
+        _PREFIX_INDEX = None
+
+
+def vocabulary_rank(known_lemmas: Iterable[str]) -> Callable[[str], tuple]:
+    """Rank forms of the learner's lemmas first, then shorter forms."""
+    known = set(known_lemmas)
+    index = get_form_index()
+
+    def rank(form: str) -> tuple:
+        learned = any(lemma in known for lemma, _, _ in index.get(form, ()))
+        return (not learned, len(form))
+
+    return rank
+
+
+def line_buffer() -> str:
+    """The text typed so far at the active ``input()`` prompt ('' when
+    ``readline`` is unavailable)."""
+    return readline.get_line_buffer() if readline is not None else ""
+
+
+@contextmanager
+def greek_completion(known_lemmas: Iterable[str]):
+    """Enable Tab-completion of Greek forms for ``input()`` in this block.
+
+    Does nothing when ``readline`` is unavailable.  The previous completer
+    and delimiters are restored on exit.
+    """
+    if readline is None:
+        yield
+        return
+
+    prefix_index = get_prefix_index()
+    rank = vocabulary_rank(known_lemmas)
+    matches: list[str] = []
+
+    def completer(text: str, state: int) -> str | None:
+        if state == 0:
+            matches[:] = prefix_index.complete(text, rank) if text else []
+        return matches[state] if state < len(matches) else None
+
+    old_completer = readline.get_completer()
+    old_delims = readline.get_completer_delims()
+    readline.set_completer(completer)
+    readline.set_completer_delims(" \t\n.,;·")
+    readline.parse_and_bind("tab: complete")
+    try:
+        yield
+    finally:
+        readline.set_completer(old_completer)
+        readline.set_completer_delims(old_delims)
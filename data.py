@@ -1,1432 +1,42 @@
-"""Word database, sentence prompts, and inflection tables for Ancient Greek."""
+"""Word database, sentence prompts, and inflection tables for Ancient Greek.
 
-from __future__ import annotations
-
-# ---------------------------------------------------------------------------
-# Word entries keyed by lemma
-# ---------------------------------------------------------------------------
-
-WORDS: dict[str, dict] = {
-    # ── Articles ──────────────────────────────────────────────────────────
-    "ὁ": {
-        "lemma": "ὁ",
-        "pos": "article",
-        "meaning": "the",
-        "translations": ["the"],
-        "forms": {
-            # masculine
-            "nom_sg_masc": "ὁ",
-            "gen_sg_masc": "τοῦ",
-            "dat_sg_masc": "τῷ",
-            "acc_sg_masc": "τόν",
-            "nom_pl_masc": "οἱ",
-            "gen_pl_masc": "τῶν",
-            "dat_pl_masc": "τοῖς",
-            "acc_pl_masc": "τούς",
-            # feminine
-            "nom_sg_fem": "ἡ",
-            "gen_sg_fem": "τῆς",
-            "dat_sg_fem": "τῇ",
-            "acc_sg_fem": "τήν",
-            "nom_pl_fem": "αἱ",
-            "gen_pl_fem": "τῶν",
-            "dat_pl_fem": "ταῖς",
-            "acc_pl_fem": "τάς",
-            # neuter
-            "nom_sg_neut": "τό",
-            "gen_sg_neut": "τοῦ",
-            "dat_sg_neut": "τῷ",
-            "acc_sg_neut": "τό",
-            "nom_pl_neut": "τά",
-            "gen_pl_neut": "τῶν",
-            "dat_pl_neut": "τοῖς",
-            "acc_pl_neut": "τά",
-        },
-    },
-
-    # ── Nouns ─────────────────────────────────────────────────────────────
-    "ἄνθρωπος": {
-        "lemma": "ἄνθρωπος",
-        "pos": "noun",
-        "meaning": "man, human being",
-        "translations": ["man", "human"],
-        "gender": "masculine",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "ἄνθρωπος", "gen_sg": "ἀνθρώπου",
-            "dat_sg": "ἀνθρώπῳ",  "acc_sg": "ἄνθρωπον",
-            "voc_sg": "ἄνθρωπε",
-            "nom_pl": "ἄνθρωποι", "gen_pl": "ἀνθρώπων",
-            "dat_pl": "ἀνθρώποις", "acc_pl": "ἀνθρώπους",
-        },
-    },
-    "ἵππος": {
-        "lemma": "ἵππος",
-        "pos": "noun",
-        "meaning": "horse",
-        "translations": ["horse"],
-        "gender": "masculine",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "ἵππος", "gen_sg": "ἵππου",
-            "dat_sg": "ἵππῳ",  "acc_sg": "ἵππον",
-            "voc_sg": "ἵππε",
-            "nom_pl": "ἵπποι", "gen_pl": "ἵππων",
-            "dat_pl": "ἵπποις", "acc_pl": "ἵππους",
-        },
-    },
-    "λόγος": {
-        "lemma": "λόγος",
-        "pos": "noun",
-        "meaning": "word, speech, reason",
-        "translations": ["word", "speech", "reason"],
-        "gender": "masculine",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "λόγος", "gen_sg": "λόγου",
-            "dat_sg": "λόγῳ",  "acc_sg": "λόγον",
-            "voc_sg": "λόγε",
-            "nom_pl": "λόγοι", "gen_pl": "λόγων",
-            "dat_pl": "λόγοις", "acc_pl": "λόγους",
-        },
-    },
-    "δῶρον": {
-        "lemma": "δῶρον",
-        "pos": "noun",
-        "meaning": "gift",
-        "translations": ["gift"],
-        "gender": "neuter",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "δῶρον", "gen_sg": "δώρου",
-            "dat_sg": "δώρῳ",  "acc_sg": "δῶρον",
-            "voc_sg": "δῶρον",
-            "nom_pl": "δῶρα",  "gen_pl": "δώρων",
-            "dat_pl": "δώροις", "acc_pl": "δῶρα",
-        },
-    },
-    "θεός": {
-        "lemma": "θεός",
-        "pos": "noun",
-        "meaning": "god",
-        "translations": ["god"],
-        "gender": "masculine",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "θεός", "gen_sg": "θεοῦ",
-            "dat_sg": "θεῷ",  "acc_sg": "θεόν",
-            "voc_sg": "θεέ",
-            "nom_pl": "θεοί", "gen_pl": "θεῶν",
-            "dat_pl": "θεοῖς", "acc_pl": "θεούς",
-        },
-    },
-    "στρατιώτης": {
-        "lemma": "στρατιώτης",
-        "pos": "noun",
-        "meaning": "soldier",
-        "translations": ["soldier"],
-        "gender": "masculine",
-        "declension": 1,
-        "forms": {
-            "nom_sg": "στρατιώτης", "gen_sg": "στρατιώτου",
-            "dat_sg": "στρατιώτῃ",  "acc_sg": "στρατιώτην",
-            "voc_sg": "στρατιῶτα",
-            "nom_pl": "στρατιῶται", "gen_pl": "στρατιωτῶν",
-            "dat_pl": "στρατιώταις", "acc_pl": "στρατιώτας",
-        },
-    },
-    "ψυχή": {
-        "lemma": "ψυχή",
-        "pos": "noun",
-        "meaning": "soul, spirit",
-        "translations": ["soul", "spirit"],
-        "gender": "feminine",
-        "declension": 1,
-        "forms": {
-            "nom_sg": "ψυχή",  "gen_sg": "ψυχῆς",
-            "dat_sg": "ψυχῇ",  "acc_sg": "ψυχήν",
-            "voc_sg": "ψυχή",
-            "nom_pl": "ψυχαί", "gen_pl": "ψυχῶν",
-            "dat_pl": "ψυχαῖς", "acc_pl": "ψυχάς",
-        },
-    },
-    "θάλαττα": {
-        "lemma": "θάλαττα",
-        "pos": "noun",
-        "meaning": "sea",
-        "translations": ["sea"],
-        "gender": "feminine",
-        "declension": 1,
-        "forms": {
-            "nom_sg": "θάλαττα",  "gen_sg": "θαλάττης",
-            "dat_sg": "θαλάττῃ",  "acc_sg": "θάλατταν",
-            "voc_sg": "θάλαττα",
-            "nom_pl": "θάλατται", "gen_pl": "θαλαττῶν",
-            "dat_pl": "θαλάτταις", "acc_pl": "θαλάττας",
-        },
-    },
-    "ἀλήθεια": {
-        "lemma": "ἀλήθεια",
-        "pos": "noun",
-        "meaning": "truth",
-        "translations": ["truth"],
-        "gender": "feminine",
-        "declension": 1,
-        "forms": {
-            "nom_sg": "ἀλήθεια",  "gen_sg": "ἀληθείας",
-            "dat_sg": "ἀληθείᾳ",  "acc_sg": "ἀλήθειαν",
-            "voc_sg": "ἀλήθεια",
-            "nom_pl": "ἀλήθειαι", "gen_pl": "ἀληθειῶν",
-            "dat_pl": "ἀληθείαις", "acc_pl": "ἀληθείας",
-        },
-    },
-    "οἰκία": {
-        "lemma": "οἰκία",
-        "pos": "noun",
-        "meaning": "house",
-        "translations": ["house"],
-        "gender": "feminine",
-        "declension": 1,
-        "forms": {
-            "nom_sg": "οἰκία",  "gen_sg": "οἰκίας",
-            "dat_sg": "οἰκίᾳ",  "acc_sg": "οἰκίαν",
-            "voc_sg": "οἰκία",
-            "nom_pl": "οἰκίαι", "gen_pl": "οἰκιῶν",
-            "dat_pl": "οἰκίαις", "acc_pl": "οἰκίας",
-        },
-    },
-    "παιδίον": {
-        "lemma": "παιδίον",
-        "pos": "noun",
-        "meaning": "child",
-        "translations": ["child"],
-        "gender": "neuter",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "παιδίον", "gen_sg": "παιδίου",
-            "dat_sg": "παιδίῳ",  "acc_sg": "παιδίον",
-            "voc_sg": "παιδίον",
-            "nom_pl": "παιδία",  "gen_pl": "παιδίων",
-            "dat_pl": "παιδίοις", "acc_pl": "παιδία",
-        },
-    },
-    "βιβλίον": {
-        "lemma": "βιβλίον",
-        "pos": "noun",
-        "meaning": "book",
-        "translations": ["book"],
-        "gender": "neuter",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "βιβλίον", "gen_sg": "βιβλίου",
-            "dat_sg": "βιβλίῳ",  "acc_sg": "βιβλίον",
-            "voc_sg": "βιβλίον",
-            "nom_pl": "βιβλία",  "gen_pl": "βιβλίων",
-            "dat_pl": "βιβλίοις", "acc_pl": "βιβλία",
-        },
-    },
-    "πόλεμος": {
-        "lemma": "πόλεμος",
-        "pos": "noun",
-        "meaning": "war",
-        "translations": ["war"],
-        "gender": "masculine",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "πόλεμος", "gen_sg": "πολέμου",
-            "dat_sg": "πολέμῳ",  "acc_sg": "πόλεμον",
-            "voc_sg": "πόλεμε",
-            "nom_pl": "πόλεμοι", "gen_pl": "πολέμων",
-            "dat_pl": "πολέμοις", "acc_pl": "πολέμους",
-        },
-    },
-    "εἰρήνη": {
-        "lemma": "εἰρήνη",
-        "pos": "noun",
-        "meaning": "peace",
-        "translations": ["peace"],
-        "gender": "feminine",
-        "declension": 1,
-        "forms": {
-            "nom_sg": "εἰρήνη",  "gen_sg": "εἰρήνης",
-            "dat_sg": "εἰρήνῃ",  "acc_sg": "εἰρήνην",
-            "voc_sg": "εἰρήνη",
-            "nom_pl": "εἰρῆναι", "gen_pl": "εἰρηνῶν",
-            "dat_pl": "εἰρήναις", "acc_pl": "εἰρήνας",
-        },
-    },
-    "νῆσος": {
-        "lemma": "νῆσος",
-        "pos": "noun",
-        "meaning": "island",
-        "translations": ["island"],
-        "gender": "feminine",
-        "declension": 2,
-        "forms": {
-            "nom_sg": "νῆσος", "gen_sg": "νήσου",
-            "dat_sg": "νήσῳ",  "acc_sg": "νῆσον",
-            "voc_sg": "νῆσε",
-            "nom_pl": "νῆσοι", "gen_pl": "νήσων",
-            "dat_pl": "νήσοις", "acc_pl": "νήσους",
-        },
-    },
-
-    # ── Verbs ─────────────────────────────────────────────────────────────
-    "λύω": {
-        "lemma": "λύω",
-        "pos": "verb",
-        "meaning": "I loosen, release",
-        "translations": ["loosen", "release", "ransom"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "λύω",
-            "pres_act_ind_2sg": "λύεις",
-            "pres_act_ind_3sg": "λύει",
-            "pres_act_ind_1pl": "λύομεν",
-            "pres_act_ind_2pl": "λύετε",
-            "pres_act_ind_3pl": "λύουσι",
-            "impf_act_ind_1sg": "ἔλυον",
-            "impf_act_ind_2sg": "ἔλυες",
-            "impf_act_ind_3sg": "ἔλυε",
-            "impf_act_ind_1pl": "ἐλύομεν",
-            "impf_act_ind_2pl": "ἐλύετε",
-            "impf_act_ind_3pl": "ἔλυον",
-            "fut_act_ind_1sg": "λύσω",
-            "fut_act_ind_2sg": "λύσεις",
-            "fut_act_ind_3sg": "λύσει",
-            "fut_act_ind_1pl": "λύσομεν",
-            "fut_act_ind_2pl": "λύσετε",
-            "fut_act_ind_3pl": "λύσουσι",
-            "aor_act_ind_1sg": "ἔλυσα",
-            "aor_act_ind_2sg": "ἔλυσας",
-            "aor_act_ind_3sg": "ἔλυσε",
-            "aor_act_ind_1pl": "ἐλύσαμεν",
-            "aor_act_ind_2pl": "ἐλύσατε",
-            "aor_act_ind_3pl": "ἔλυσαν",
-            "pres_act_inf": "λύειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "λύομαι",
-            "pres_mid_ind_2sg": "λύῃ",
-            "pres_mid_ind_3sg": "λύεται",
-            "pres_mid_ind_1pl": "λυόμεθα",
-            "pres_mid_ind_2pl": "λύεσθε",
-            "pres_mid_ind_3pl": "λύονται",
-            "impf_mid_ind_1sg": "ἐλυόμην",
-            "impf_mid_ind_2sg": "ἐλύου",
-            "impf_mid_ind_3sg": "ἐλύετο",
-            "impf_mid_ind_1pl": "ἐλυόμεθα",
-            "impf_mid_ind_2pl": "ἐλύεσθε",
-            "impf_mid_ind_3pl": "ἐλύοντο",
-            "fut_mid_ind_1sg": "λύσομαι",
-            "fut_mid_ind_2sg": "λύσῃ",
-            "fut_mid_ind_3sg": "λύσεται",
-            "fut_mid_ind_1pl": "λυσόμεθα",
-            "fut_mid_ind_2pl": "λύσεσθε",
-            "fut_mid_ind_3pl": "λύσονται",
-            "aor_mid_ind_1sg": "ἐλυσάμην",
-            "aor_mid_ind_2sg": "ἐλύσω",
-            "aor_mid_ind_3sg": "ἐλύσατο",
-            "aor_mid_ind_1pl": "ἐλυσάμεθα",
-            "aor_mid_ind_2pl": "ἐλύσασθε",
-            "aor_mid_ind_3pl": "ἐλύσαντο",
-            # Present active participle
-            "pres_act_ptcp_nom_sg_masc": "λύων",
-            "pres_act_ptcp_gen_sg_masc": "λύοντος",
-            "pres_act_ptcp_dat_sg_masc": "λύοντι",
-            "pres_act_ptcp_acc_sg_masc": "λύοντα",
-            "pres_act_ptcp_nom_pl_masc": "λύοντες",
-            "pres_act_ptcp_gen_pl_masc": "λυόντων",
-            "pres_act_ptcp_dat_pl_masc": "λύουσι(ν)",
-            "pres_act_ptcp_acc_pl_masc": "λύοντας",
-            "pres_act_ptcp_nom_sg_fem": "λύουσα",
-            "pres_act_ptcp_gen_sg_fem": "λυούσης",
-            "pres_act_ptcp_dat_sg_fem": "λυούσῃ",
-            "pres_act_ptcp_acc_sg_fem": "λύουσαν",
-            "pres_act_ptcp_nom_pl_fem": "λύουσαι",
-            "pres_act_ptcp_gen_pl_fem": "λυουσῶν",
-            "pres_act_ptcp_dat_pl_fem": "λυούσαις",
-            "pres_act_ptcp_acc_pl_fem": "λυούσας",
-            "pres_act_ptcp_nom_sg_neut": "λῦον",
-            "pres_act_ptcp_gen_sg_neut": "λύοντος",
-            "pres_act_ptcp_dat_sg_neut": "λύοντι",
-            "pres_act_ptcp_acc_sg_neut": "λῦον",
-            "pres_act_ptcp_nom_pl_neut": "λύοντα",
-            "pres_act_ptcp_gen_pl_neut": "λυόντων",
-            "pres_act_ptcp_dat_pl_neut": "λύουσι(ν)",
-            "pres_act_ptcp_acc_pl_neut": "λύοντα",
-        },
-    },
-    "γράφω": {
-        "lemma": "γράφω",
-        "pos": "verb",
-        "meaning": "I write",
-        "translations": ["write"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "γράφω",
-            "pres_act_ind_2sg": "γράφεις",
-            "pres_act_ind_3sg": "γράφει",
-            "pres_act_ind_1pl": "γράφομεν",
-            "pres_act_ind_2pl": "γράφετε",
-            "pres_act_ind_3pl": "γράφουσι",
-            "impf_act_ind_1sg": "ἔγραφον",
-            "impf_act_ind_2sg": "ἔγραφες",
-            "impf_act_ind_3sg": "ἔγραφε",
-            "impf_act_ind_1pl": "ἐγράφομεν",
-            "impf_act_ind_2pl": "ἐγράφετε",
-            "impf_act_ind_3pl": "ἔγραφον",
-            "fut_act_ind_1sg": "γράψω",
-            "fut_act_ind_2sg": "γράψεις",
-            "fut_act_ind_3sg": "γράψει",
-            "fut_act_ind_1pl": "γράψομεν",
-            "fut_act_ind_2pl": "γράψετε",
-            "fut_act_ind_3pl": "γράψουσι",
-            "aor_act_ind_1sg": "ἔγραψα",
-            "aor_act_ind_2sg": "ἔγραψας",
-            "aor_act_ind_3sg": "ἔγραψε",
-            "aor_act_ind_1pl": "ἐγράψαμεν",
-            "aor_act_ind_2pl": "ἐγράψατε",
-            "aor_act_ind_3pl": "ἔγραψαν",
-            "pres_act_inf": "γράφειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "γράφομαι",
-            "pres_mid_ind_2sg": "γράφῃ",
-            "pres_mid_ind_3sg": "γράφεται",
-            "pres_mid_ind_1pl": "γραφόμεθα",
-            "pres_mid_ind_2pl": "γράφεσθε",
-            "pres_mid_ind_3pl": "γράφονται",
-            "impf_mid_ind_1sg": "ἐγραφόμην",
-            "impf_mid_ind_2sg": "ἐγράφου",
-            "impf_mid_ind_3sg": "ἐγράφετο",
-            "impf_mid_ind_1pl": "ἐγραφόμεθα",
-            "impf_mid_ind_2pl": "ἐγράφεσθε",
-            "impf_mid_ind_3pl": "ἐγράφοντο",
-            "fut_mid_ind_1sg": "γράψομαι",
-            "fut_mid_ind_2sg": "γράψῃ",
-            "fut_mid_ind_3sg": "γράψεται",
-            "fut_mid_ind_1pl": "γραψόμεθα",
-            "fut_mid_ind_2pl": "γράψεσθε",
-            "fut_mid_ind_3pl": "γράψονται",
-            "aor_mid_ind_1sg": "ἐγραψάμην",
-            "aor_mid_ind_2sg": "ἐγράψω",
-            "aor_mid_ind_3sg": "ἐγράψατο",
-            "aor_mid_ind_1pl": "ἐγραψάμεθα",
-            "aor_mid_ind_2pl": "ἐγράψασθε",
-            "aor_mid_ind_3pl": "ἐγράψαντο",
-            # Present active participle
-            "pres_act_ptcp_nom_sg_masc": "γράφων",
-            "pres_act_ptcp_gen_sg_masc": "γράφοντος",
-            "pres_act_ptcp_dat_sg_masc": "γράφοντι",
-            "pres_act_ptcp_acc_sg_masc": "γράφοντα",
-            "pres_act_ptcp_nom_pl_masc": "γράφοντες",
-            "pres_act_ptcp_gen_pl_masc": "γραφόντων",
-            "pres_act_ptcp_dat_pl_masc": "γράφουσι(ν)",
-            "pres_act_ptcp_acc_pl_masc": "γράφοντας",
-            "pres_act_ptcp_nom_sg_fem": "γράφουσα",
-            "pres_act_ptcp_gen_sg_fem": "γραφούσης",
-            "pres_act_ptcp_dat_sg_fem": "γραφούσῃ",
-            "pres_act_ptcp_acc_sg_fem": "γράφουσαν",
-            "pres_act_ptcp_nom_pl_fem": "γράφουσαι",
-            "pres_act_ptcp_gen_pl_fem": "γραφουσῶν",
-            "pres_act_ptcp_dat_pl_fem": "γραφούσαις",
-            "pres_act_ptcp_acc_pl_fem": "γραφούσας",
-            "pres_act_ptcp_nom_sg_neut": "γράφον",
-            "pres_act_ptcp_gen_sg_neut": "γράφοντος",
-            "pres_act_ptcp_dat_sg_neut": "γράφοντι",
-            "pres_act_ptcp_acc_sg_neut": "γράφον",
-            "pres_act_ptcp_nom_pl_neut": "γράφοντα",
-            "pres_act_ptcp_gen_pl_neut": "γραφόντων",
-            "pres_act_ptcp_dat_pl_neut": "γράφουσι(ν)",
-            "pres_act_ptcp_acc_pl_neut": "γράφοντα",
-        },
-    },
-    "παιδεύω": {
-        "lemma": "παιδεύω",
-        "pos": "verb",
-        "meaning": "I teach, educate",
-        "translations": ["teach", "educate"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "παιδεύω",
-            "pres_act_ind_2sg": "παιδεύεις",
-            "pres_act_ind_3sg": "παιδεύει",
-            "pres_act_ind_1pl": "παιδεύομεν",
-            "pres_act_ind_2pl": "παιδεύετε",
-            "pres_act_ind_3pl": "παιδεύουσι",
-            "impf_act_ind_1sg": "ἐπαίδευον",
-            "impf_act_ind_2sg": "ἐπαίδευες",
-            "impf_act_ind_3sg": "ἐπαίδευε",
-            "impf_act_ind_1pl": "ἐπαιδεύομεν",
-            "impf_act_ind_2pl": "ἐπαιδεύετε",
-            "impf_act_ind_3pl": "ἐπαίδευον",
-            "fut_act_ind_1sg": "παιδεύσω",
-            "fut_act_ind_2sg": "παιδεύσεις",
-            "fut_act_ind_3sg": "παιδεύσει",
-            "fut_act_ind_1pl": "παιδεύσομεν",
-            "fut_act_ind_2pl": "παιδεύσετε",
-            "fut_act_ind_3pl": "παιδεύσουσι",
-            "aor_act_ind_1sg": "ἐπαίδευσα",
-            "aor_act_ind_2sg": "ἐπαίδευσας",
-            "aor_act_ind_3sg": "ἐπαίδευσε",
-            "aor_act_ind_1pl": "ἐπαιδεύσαμεν",
-            "aor_act_ind_2pl": "ἐπαιδεύσατε",
-            "aor_act_ind_3pl": "ἐπαίδευσαν",
-            "pres_act_inf": "παιδεύειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "παιδεύομαι",
-            "pres_mid_ind_2sg": "παιδεύῃ",
-            "pres_mid_ind_3sg": "παιδεύεται",
-            "pres_mid_ind_1pl": "παιδευόμεθα",
-            "pres_mid_ind_2pl": "παιδεύεσθε",
-            "pres_mid_ind_3pl": "παιδεύονται",
-            "impf_mid_ind_1sg": "ἐπαιδευόμην",
-            "impf_mid_ind_2sg": "ἐπαιδεύου",
-            "impf_mid_ind_3sg": "ἐπαιδεύετο",
-            "impf_mid_ind_1pl": "ἐπαιδευόμεθα",
-            "impf_mid_ind_2pl": "ἐπαιδεύεσθε",
-            "impf_mid_ind_3pl": "ἐπαιδεύοντο",
-            "fut_mid_ind_1sg": "παιδεύσομαι",
-            "fut_mid_ind_2sg": "παιδεύσῃ",
-            "fut_mid_ind_3sg": "παιδεύσεται",
-            "fut_mid_ind_1pl": "παιδευσόμεθα",
-            "fut_mid_ind_2pl": "παιδεύσεσθε",
-            "fut_mid_ind_3pl": "παιδεύσονται",
-            "aor_mid_ind_1sg": "ἐπαιδευσάμην",
-            "aor_mid_ind_2sg": "ἐπαιδεύσω",
-            "aor_mid_ind_3sg": "ἐπαιδεύσατο",
-            "aor_mid_ind_1pl": "ἐπαιδευσάμεθα",
-            "aor_mid_ind_2pl": "ἐπαιδεύσασθε",
-            "aor_mid_ind_3pl": "ἐπαιδεύσαντο",
-        },
-    },
-    "πέμπω": {
-        "lemma": "πέμπω",
-        "pos": "verb",
-        "meaning": "I send",
-        "translations": ["send"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "πέμπω",
-            "pres_act_ind_2sg": "πέμπεις",
-            "pres_act_ind_3sg": "πέμπει",
-            "pres_act_ind_1pl": "πέμπομεν",
-            "pres_act_ind_2pl": "πέμπετε",
-            "pres_act_ind_3pl": "πέμπουσι",
-            "impf_act_ind_1sg": "ἔπεμπον",
-            "impf_act_ind_2sg": "ἔπεμπες",
-            "impf_act_ind_3sg": "ἔπεμπε",
-            "impf_act_ind_1pl": "ἐπέμπομεν",
-            "impf_act_ind_2pl": "ἐπέμπετε",
-            "impf_act_ind_3pl": "ἔπεμπον",
-            "fut_act_ind_1sg": "πέμψω",
-            "fut_act_ind_2sg": "πέμψεις",
-            "fut_act_ind_3sg": "πέμψει",
-            "fut_act_ind_1pl": "πέμψομεν",
-            "fut_act_ind_2pl": "πέμψετε",
-            "fut_act_ind_3pl": "πέμψουσι",
-            "aor_act_ind_1sg": "ἔπεμψα",
-            "aor_act_ind_2sg": "ἔπεμψας",
-            "aor_act_ind_3sg": "ἔπεμψε",
-            "aor_act_ind_1pl": "ἐπέμψαμεν",
-            "aor_act_ind_2pl": "ἐπέμψατε",
-            "aor_act_ind_3pl": "ἔπεμψαν",
-            "pres_act_inf": "πέμπειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "πέμπομαι",
-            "pres_mid_ind_2sg": "πέμπῃ",
-            "pres_mid_ind_3sg": "πέμπεται",
-            "pres_mid_ind_1pl": "πεμπόμεθα",
-            "pres_mid_ind_2pl": "πέμπεσθε",
-            "pres_mid_ind_3pl": "πέμπονται",
-            "impf_mid_ind_1sg": "ἐπεμπόμην",
-            "impf_mid_ind_2sg": "ἐπέμπου",
-            "impf_mid_ind_3sg": "ἐπέμπετο",
-            "impf_mid_ind_1pl": "ἐπεμπόμεθα",
-            "impf_mid_ind_2pl": "ἐπέμπεσθε",
-            "impf_mid_ind_3pl": "ἐπέμποντο",
-            "fut_mid_ind_1sg": "πέμψομαι",
-            "fut_mid_ind_2sg": "πέμψῃ",
-            "fut_mid_ind_3sg": "πέμψεται",
-            "fut_mid_ind_1pl": "πεμψόμεθα",
-            "fut_mid_ind_2pl": "πέμψεσθε",
-            "fut_mid_ind_3pl": "πέμψονται",
-            "aor_mid_ind_1sg": "ἐπεμψάμην",
-            "aor_mid_ind_2sg": "ἐπέμψω",
-            "aor_mid_ind_3sg": "ἐπέμψατο",
-            "aor_mid_ind_1pl": "ἐπεμψάμεθα",
-            "aor_mid_ind_2pl": "ἐπέμψασθε",
-            "aor_mid_ind_3pl": "ἐπέμψαντο",
-            # Present active participle
-            "pres_act_ptcp_nom_sg_masc": "πέμπων",
-            "pres_act_ptcp_gen_sg_masc": "πέμποντος",
-            "pres_act_ptcp_dat_sg_masc": "πέμποντι",
-            "pres_act_ptcp_acc_sg_masc": "πέμποντα",
-            "pres_act_ptcp_nom_pl_masc": "πέμποντες",
-            "pres_act_ptcp_gen_pl_masc": "πεμπόντων",
-            "pres_act_ptcp_dat_pl_masc": "πέμπουσι(ν)",
-            "pres_act_ptcp_acc_pl_masc": "πέμποντας",
-            "pres_act_ptcp_nom_sg_fem": "πέμπουσα",
-            "pres_act_ptcp_gen_sg_fem": "πεμπούσης",
-            "pres_act_ptcp_dat_sg_fem": "πεμπούσῃ",
-            "pres_act_ptcp_acc_sg_fem": "πέμπουσαν",
-            "pres_act_ptcp_nom_pl_fem": "πέμπουσαι",
-            "pres_act_ptcp_gen_pl_fem": "πεμπουσῶν",
-            "pres_act_ptcp_dat_pl_fem": "πεμπούσαις",
-            "pres_act_ptcp_acc_pl_fem": "πεμπούσας",
-            "pres_act_ptcp_nom_sg_neut": "πέμπον",
-            "pres_act_ptcp_gen_sg_neut": "πέμποντος",
-            "pres_act_ptcp_dat_sg_neut": "πέμποντι",
-            "pres_act_ptcp_acc_sg_neut": "πέμπον",
-            "pres_act_ptcp_nom_pl_neut": "πέμποντα",
-            "pres_act_ptcp_gen_pl_neut": "πεμπόντων",
-            "pres_act_ptcp_dat_pl_neut": "πέμπουσι(ν)",
-            "pres_act_ptcp_acc_pl_neut": "πέμποντα",
-        },
-    },
-    "φέρω": {
-        "lemma": "φέρω",
-        "pos": "verb",
-        "meaning": "I carry, bear",
-        "translations": ["carry", "bear"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "φέρω",
-            "pres_act_ind_2sg": "φέρεις",
-            "pres_act_ind_3sg": "φέρει",
-            "pres_act_ind_1pl": "φέρομεν",
-            "pres_act_ind_2pl": "φέρετε",
-            "pres_act_ind_3pl": "φέρουσι",
-            "impf_act_ind_1sg": "ἔφερον",
-            "impf_act_ind_2sg": "ἔφερες",
-            "impf_act_ind_3sg": "ἔφερε",
-            "impf_act_ind_1pl": "ἐφέρομεν",
-            "impf_act_ind_2pl": "ἐφέρετε",
-            "impf_act_ind_3pl": "ἔφερον",
-            "fut_act_ind_1sg": "οἴσω",
-            "fut_act_ind_2sg": "οἴσεις",
-            "fut_act_ind_3sg": "οἴσει",
-            "fut_act_ind_1pl": "οἴσομεν",
-            "fut_act_ind_2pl": "οἴσετε",
-            "fut_act_ind_3pl": "οἴσουσι",
-            "aor_act_ind_1sg": "ἤνεγκα",
-            "aor_act_ind_2sg": "ἤνεγκας",
-            "aor_act_ind_3sg": "ἤνεγκε",
-            "aor_act_ind_1pl": "ἠνέγκαμεν",
-            "aor_act_ind_2pl": "ἠνέγκατε",
-            "aor_act_ind_3pl": "ἤνεγκαν",
-            "pres_act_inf": "φέρειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "φέρομαι",
-            "pres_mid_ind_2sg": "φέρῃ",
-            "pres_mid_ind_3sg": "φέρεται",
-            "pres_mid_ind_1pl": "φερόμεθα",
-            "pres_mid_ind_2pl": "φέρεσθε",
-            "pres_mid_ind_3pl": "φέρονται",
-            "impf_mid_ind_1sg": "ἐφερόμην",
-            "impf_mid_ind_2sg": "ἐφέρου",
-            "impf_mid_ind_3sg": "ἐφέρετο",
-            "impf_mid_ind_1pl": "ἐφερόμεθα",
-            "impf_mid_ind_2pl": "ἐφέρεσθε",
-            "impf_mid_ind_3pl": "ἐφέροντο",
-            "fut_mid_ind_1sg": "οἴσομαι",
-            "fut_mid_ind_2sg": "οἴσῃ",
-            "fut_mid_ind_3sg": "οἴσεται",
-            "fut_mid_ind_1pl": "οἰσόμεθα",
-            "fut_mid_ind_2pl": "οἴσεσθε",
-            "fut_mid_ind_3pl": "οἴσονται",
-            "aor_mid_ind_1sg": "ἠνεγκάμην",
-            "aor_mid_ind_2sg": "ἠνέγκω",
-            "aor_mid_ind_3sg": "ἠνέγκατο",
-            "aor_mid_ind_1pl": "ἠνεγκάμεθα",
-            "aor_mid_ind_2pl": "ἠνέγκασθε",
-            "aor_mid_ind_3pl": "ἠνέγκαντο",
-        },
-    },
-    "ἄγω": {
-        "lemma": "ἄγω",
-        "pos": "verb",
-        "meaning": "I lead",
-        "translations": ["lead"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "ἄγω",
-            "pres_act_ind_2sg": "ἄγεις",
-            "pres_act_ind_3sg": "ἄγει",
-            "pres_act_ind_1pl": "ἄγομεν",
-            "pres_act_ind_2pl": "ἄγετε",
-            "pres_act_ind_3pl": "ἄγουσι",
-            "impf_act_ind_1sg": "ἦγον",
-            "impf_act_ind_2sg": "ἦγες",
-            "impf_act_ind_3sg": "ἦγε",
-            "impf_act_ind_1pl": "ἤγομεν",
-            "impf_act_ind_2pl": "ἤγετε",
-            "impf_act_ind_3pl": "ἦγον",
-            "fut_act_ind_1sg": "ἄξω",
-            "fut_act_ind_2sg": "ἄξεις",
-            "fut_act_ind_3sg": "ἄξει",
-            "fut_act_ind_1pl": "ἄξομεν",
-            "fut_act_ind_2pl": "ἄξετε",
-            "fut_act_ind_3pl": "ἄξουσι",
-            "aor_act_ind_1sg": "ἤγαγον",
-            "aor_act_ind_2sg": "ἤγαγες",
-            "aor_act_ind_3sg": "ἤγαγε",
-            "aor_act_ind_1pl": "ἠγάγομεν",
-            "aor_act_ind_2pl": "ἠγάγετε",
-            "aor_act_ind_3pl": "ἤγαγον",
-            "pres_act_inf": "ἄγειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "ἄγομαι",
-            "pres_mid_ind_2sg": "ἄγῃ",
-            "pres_mid_ind_3sg": "ἄγεται",
-            "pres_mid_ind_1pl": "ἀγόμεθα",
-            "pres_mid_ind_2pl": "ἄγεσθε",
-            "pres_mid_ind_3pl": "ἄγονται",
-            "impf_mid_ind_1sg": "ἠγόμην",
-            "impf_mid_ind_2sg": "ἤγου",
-            "impf_mid_ind_3sg": "ἤγετο",
-            "impf_mid_ind_1pl": "ἠγόμεθα",
-            "impf_mid_ind_2pl": "ἤγεσθε",
-            "impf_mid_ind_3pl": "ἤγοντο",
-            "fut_mid_ind_1sg": "ἄξομαι",
-            "fut_mid_ind_2sg": "ἄξῃ",
-            "fut_mid_ind_3sg": "ἄξεται",
-            "fut_mid_ind_1pl": "ἀξόμεθα",
-            "fut_mid_ind_2pl": "ἄξεσθε",
-            "fut_mid_ind_3pl": "ἄξονται",
-            "aor_mid_ind_1sg": "ἠγαγόμην",
-            "aor_mid_ind_2sg": "ἠγάγου",
-            "aor_mid_ind_3sg": "ἠγάγετο",
-            "aor_mid_ind_1pl": "ἠγαγόμεθα",
-            "aor_mid_ind_2pl": "ἠγάγεσθε",
-            "aor_mid_ind_3pl": "ἠγάγοντο",
-        },
-    },
-    "λέγω": {
-        "lemma": "λέγω",
-        "pos": "verb",
-        "meaning": "I say, speak",
-        "translations": ["say", "speak"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "λέγω",
-            "pres_act_ind_2sg": "λέγεις",
-            "pres_act_ind_3sg": "λέγει",
-            "pres_act_ind_1pl": "λέγομεν",
-            "pres_act_ind_2pl": "λέγετε",
-            "pres_act_ind_3pl": "λέγουσι",
-            "impf_act_ind_1sg": "ἔλεγον",
-            "impf_act_ind_2sg": "ἔλεγες",
-            "impf_act_ind_3sg": "ἔλεγε",
-            "impf_act_ind_1pl": "ἐλέγομεν",
-            "impf_act_ind_2pl": "ἐλέγετε",
-            "impf_act_ind_3pl": "ἔλεγον",
-            "fut_act_ind_1sg": "λέξω",
-            "fut_act_ind_2sg": "λέξεις",
-            "fut_act_ind_3sg": "λέξει",
-            "fut_act_ind_1pl": "λέξομεν",
-            "fut_act_ind_2pl": "λέξετε",
-            "fut_act_ind_3pl": "λέξουσι",
-            "aor_act_ind_1sg": "ἔλεξα",
-            "aor_act_ind_2sg": "ἔλεξας",
-            "aor_act_ind_3sg": "ἔλεξε",
-            "aor_act_ind_1pl": "ἐλέξαμεν",
-            "aor_act_ind_2pl": "ἐλέξατε",
-            "aor_act_ind_3pl": "ἔλεξαν",
-            "pres_act_inf": "λέγειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "λέγομαι",
-            "pres_mid_ind_2sg": "λέγῃ",
-            "pres_mid_ind_3sg": "λέγεται",
-            "pres_mid_ind_1pl": "λεγόμεθα",
-            "pres_mid_ind_2pl": "λέγεσθε",
-            "pres_mid_ind_3pl": "λέγονται",
-            "impf_mid_ind_1sg": "ἐλεγόμην",
-            "impf_mid_ind_2sg": "ἐλέγου",
-            "impf_mid_ind_3sg": "ἐλέγετο",
-            "impf_mid_ind_1pl": "ἐλεγόμεθα",
-            "impf_mid_ind_2pl": "ἐλέγεσθε",
-            "impf_mid_ind_3pl": "ἐλέγοντο",
-            "fut_mid_ind_1sg": "λέξομαι",
-            "fut_mid_ind_2sg": "λέξῃ",
-            "fut_mid_ind_3sg": "λέξεται",
-            "fut_mid_ind_1pl": "λεξόμεθα",
-            "fut_mid_ind_2pl": "λέξεσθε",
-            "fut_mid_ind_3pl": "λέξονται",
-            "aor_mid_ind_1sg": "ἐλεξάμην",
-            "aor_mid_ind_2sg": "ἐλέξω",
-            "aor_mid_ind_3sg": "ἐλέξατο",
-            "aor_mid_ind_1pl": "ἐλεξάμεθα",
-            "aor_mid_ind_2pl": "ἐλέξασθε",
-            "aor_mid_ind_3pl": "ἐλέξαντο",
-        },
-    },
-    "ἔχω": {
-        "lemma": "ἔχω",
-        "pos": "verb",
-        "meaning": "I have, hold",
-        "translations": ["have", "hold"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "ἔχω",
-            "pres_act_ind_2sg": "ἔχεις",
-            "pres_act_ind_3sg": "ἔχει",
-            "pres_act_ind_1pl": "ἔχομεν",
-            "pres_act_ind_2pl": "ἔχετε",
-            "pres_act_ind_3pl": "ἔχουσι",
-            "impf_act_ind_1sg": "εἶχον",
-            "impf_act_ind_2sg": "εἶχες",
-            "impf_act_ind_3sg": "εἶχε",
-            "impf_act_ind_1pl": "εἴχομεν",
-            "impf_act_ind_2pl": "εἴχετε",
-            "impf_act_ind_3pl": "εἶχον",
-            "fut_act_ind_1sg": "ἕξω",
-            "fut_act_ind_2sg": "ἕξεις",
-            "fut_act_ind_3sg": "ἕξει",
-            "fut_act_ind_1pl": "ἕξομεν",
-            "fut_act_ind_2pl": "ἕξετε",
-            "fut_act_ind_3pl": "ἕξουσι",
-            "aor_act_ind_1sg": "ἔσχον",
-            "aor_act_ind_2sg": "ἔσχες",
-            "aor_act_ind_3sg": "ἔσχε",
-            "aor_act_ind_1pl": "ἔσχομεν",
-            "aor_act_ind_2pl": "ἔσχετε",
-            "aor_act_ind_3pl": "ἔσχον",
-            "pres_act_inf": "ἔχειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "ἔχομαι",
-            "pres_mid_ind_2sg": "ἔχῃ",
-            "pres_mid_ind_3sg": "ἔχεται",
-            "pres_mid_ind_1pl": "ἐχόμεθα",
-            "pres_mid_ind_2pl": "ἔχεσθε",
-            "pres_mid_ind_3pl": "ἔχονται",
-            "impf_mid_ind_1sg": "εἰχόμην",
-            "impf_mid_ind_2sg": "εἴχου",
-            "impf_mid_ind_3sg": "εἴχετο",
-            "impf_mid_ind_1pl": "εἰχόμεθα",
-            "impf_mid_ind_2pl": "εἴχεσθε",
-            "impf_mid_ind_3pl": "εἴχοντο",
-            "fut_mid_ind_1sg": "ἕξομαι",
-            "fut_mid_ind_2sg": "ἕξῃ",
-            "fut_mid_ind_3sg": "ἕξεται",
-            "fut_mid_ind_1pl": "ἑξόμεθα",
-            "fut_mid_ind_2pl": "ἕξεσθε",
-            "fut_mid_ind_3pl": "ἕξονται",
-            "aor_mid_ind_1sg": "ἐσχόμην",
-            "aor_mid_ind_2sg": "ἔσχου",
-            "aor_mid_ind_3sg": "ἔσχετο",
-            "aor_mid_ind_1pl": "ἐσχόμεθα",
-            "aor_mid_ind_2pl": "ἔσχεσθε",
-            "aor_mid_ind_3pl": "ἔσχοντο",
-        },
-    },
-    "βλέπω": {
-        "lemma": "βλέπω",
-        "pos": "verb",
-        "meaning": "I see, look",
-        "translations": ["see", "look"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "βλέπω",
-            "pres_act_ind_2sg": "βλέπεις",
-            "pres_act_ind_3sg": "βλέπει",
-            "pres_act_ind_1pl": "βλέπομεν",
-            "pres_act_ind_2pl": "βλέπετε",
-            "pres_act_ind_3pl": "βλέπουσι",
-            "impf_act_ind_1sg": "ἔβλεπον",
-            "impf_act_ind_2sg": "ἔβλεπες",
-            "impf_act_ind_3sg": "ἔβλεπε",
-            "impf_act_ind_1pl": "ἐβλέπομεν",
-            "impf_act_ind_2pl": "ἐβλέπετε",
-            "impf_act_ind_3pl": "ἔβλεπον",
-            "fut_act_ind_1sg": "βλέψω",
-            "fut_act_ind_2sg": "βλέψεις",
-            "fut_act_ind_3sg": "βλέψει",
-            "fut_act_ind_1pl": "βλέψομεν",
-            "fut_act_ind_2pl": "βλέψετε",
-            "fut_act_ind_3pl": "βλέψουσι",
-            "aor_act_ind_1sg": "ἔβλεψα",
-            "aor_act_ind_2sg": "ἔβλεψας",
-            "aor_act_ind_3sg": "ἔβλεψε",
-            "aor_act_ind_1pl": "ἐβλέψαμεν",
-            "aor_act_ind_2pl": "ἐβλέψατε",
-            "aor_act_ind_3pl": "ἔβλεψαν",
-            "pres_act_inf": "βλέπειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "βλέπομαι",
-            "pres_mid_ind_2sg": "βλέπῃ",
-            "pres_mid_ind_3sg": "βλέπεται",
-            "pres_mid_ind_1pl": "βλεπόμεθα",
-            "pres_mid_ind_2pl": "βλέπεσθε",
-            "pres_mid_ind_3pl": "βλέπονται",
-            "impf_mid_ind_1sg": "ἐβλεπόμην",
-            "impf_mid_ind_2sg": "ἐβλέπου",
-            "impf_mid_ind_3sg": "ἐβλέπετο",
-            "impf_mid_ind_1pl": "ἐβλεπόμεθα",
-            "impf_mid_ind_2pl": "ἐβλέπεσθε",
-            "impf_mid_ind_3pl": "ἐβλέποντο",
-            "fut_mid_ind_1sg": "βλέψομαι",
-            "fut_mid_ind_2sg": "βλέψῃ",
-            "fut_mid_ind_3sg": "βλέψεται",
-            "fut_mid_ind_1pl": "βλεψόμεθα",
-            "fut_mid_ind_2pl": "βλέψεσθε",
-            "fut_mid_ind_3pl": "βλέψονται",
-            "aor_mid_ind_1sg": "ἐβλεψάμην",
-            "aor_mid_ind_2sg": "ἐβλέψω",
-            "aor_mid_ind_3sg": "ἐβλέψατο",
-            "aor_mid_ind_1pl": "ἐβλεψάμεθα",
-            "aor_mid_ind_2pl": "ἐβλέψασθε",
-            "aor_mid_ind_3pl": "ἐβλέψαντο",
-        },
-    },
-    "διδάσκω": {
-        "lemma": "διδάσκω",
-        "pos": "verb",
-        "meaning": "I teach",
-        "translations": ["teach"],
-        "conjugation": "thematic",
-        "forms": {
-            "pres_act_ind_1sg": "διδάσκω",
-            "pres_act_ind_2sg": "διδάσκεις",
-            "pres_act_ind_3sg": "διδάσκει",
-            "pres_act_ind_1pl": "διδάσκομεν",
-            "pres_act_ind_2pl": "διδάσκετε",
-            "pres_act_ind_3pl": "διδάσκουσι",
-            "impf_act_ind_1sg": "ἐδίδασκον",
-            "impf_act_ind_2sg": "ἐδίδασκες",
-            "impf_act_ind_3sg": "ἐδίδασκε",
-            "impf_act_ind_1pl": "ἐδιδάσκομεν",
-            "impf_act_ind_2pl": "ἐδιδάσκετε",
-            "impf_act_ind_3pl": "ἐδίδασκον",
-            "fut_act_ind_1sg": "διδάξω",
-            "fut_act_ind_2sg": "διδάξεις",
-            "fut_act_ind_3sg": "διδάξει",
-            "fut_act_ind_1pl": "διδάξομεν",
-            "fut_act_ind_2pl": "διδάξετε",
-            "fut_act_ind_3pl": "διδάξουσι",
-            "aor_act_ind_1sg": "ἐδίδαξα",
-            "aor_act_ind_2sg": "ἐδίδαξας",
-            "aor_act_ind_3sg": "ἐδίδαξε",
-            "aor_act_ind_1pl": "ἐδιδάξαμεν",
-            "aor_act_ind_2pl": "ἐδιδάξατε",
-            "aor_act_ind_3pl": "ἐδίδαξαν",
-            "pres_act_inf": "διδάσκειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "διδάσκομαι",
-            "pres_mid_ind_2sg": "διδάσκῃ",
-            "pres_mid_ind_3sg": "διδάσκεται",
-            "pres_mid_ind_1pl": "διδασκόμεθα",
-            "pres_mid_ind_2pl": "διδάσκεσθε",
-            "pres_mid_ind_3pl": "διδάσκονται",
-            "impf_mid_ind_1sg": "ἐδιδασκόμην",
-            "impf_mid_ind_2sg": "ἐδιδάσκου",
-            "impf_mid_ind_3sg": "ἐδιδάσκετο",
-            "impf_mid_ind_1pl": "ἐδιδασκόμεθα",
-            "impf_mid_ind_2pl": "ἐδιδάσκεσθε",
-            "impf_mid_ind_3pl": "ἐδιδάσκοντο",
-            "fut_mid_ind_1sg": "διδάξομαι",
-            "fut_mid_ind_2sg": "διδάξῃ",
-            "fut_mid_ind_3sg": "διδάξεται",
-            "fut_mid_ind_1pl": "διδαξόμεθα",
-            "fut_mid_ind_2pl": "διδάξεσθε",
-            "fut_mid_ind_3pl": "διδάξονται",
-            "aor_mid_ind_1sg": "ἐδιδαξάμην",
-            "aor_mid_ind_2sg": "ἐδιδάξω",
-            "aor_mid_ind_3sg": "ἐδιδάξατο",
-            "aor_mid_ind_1pl": "ἐδιδαξάμεθα",
-            "aor_mid_ind_2pl": "ἐδιδάξασθε",
-            "aor_mid_ind_3pl": "ἐδιδάξαντο",
-        },
-    },
+``WORDS`` is the compiled lexicon (see ``lexicon``): a read-only mapping of
+lemma → entry view backed by a memory-mapped file.  Edit entries in
+``words.py``; regular paradigms are generated from principal parts (see
+``paradigms``) and the compiled file is rebuilt when that source changes.
 
-    # ── Verbs with non-accusative objects ─────────────────────────────────
-    "ἀκούω": {
-        "lemma": "ἀκούω",
-        "pos": "verb",
-        "meaning": "I hear, listen to",
-        "translations": ["hear", "listen"],
-        "conjugation": "thematic",
-        "object_case": "gen",
-        "forms": {
-            "pres_act_ind_1sg": "ἀκούω",
-            "pres_act_ind_2sg": "ἀκούεις",
-            "pres_act_ind_3sg": "ἀκούει",
-            "pres_act_ind_1pl": "ἀκούομεν",
-            "pres_act_ind_2pl": "ἀκούετε",
-            "pres_act_ind_3pl": "ἀκούουσι",
-            "impf_act_ind_1sg": "ἤκουον",
-            "impf_act_ind_2sg": "ἤκουες",
-            "impf_act_ind_3sg": "ἤκουε",
-            "impf_act_ind_1pl": "ἠκούομεν",
-            "impf_act_ind_2pl": "ἠκούετε",
-            "impf_act_ind_3pl": "ἤκουον",
-            "fut_act_ind_1sg": "ἀκούσω",
-            "fut_act_ind_2sg": "ἀκούσεις",
-            "fut_act_ind_3sg": "ἀκούσει",
-            "fut_act_ind_1pl": "ἀκούσομεν",
-            "fut_act_ind_2pl": "ἀκούσετε",
-            "fut_act_ind_3pl": "ἀκούσουσι",
-            "aor_act_ind_1sg": "ἤκουσα",
-            "aor_act_ind_2sg": "ἤκουσας",
-            "aor_act_ind_3sg": "ἤκουσε",
-            "aor_act_ind_1pl": "ἠκούσαμεν",
-            "aor_act_ind_2pl": "ἠκούσατε",
-            "aor_act_ind_3pl": "ἤκουσαν",
-            "pres_act_inf": "ἀκούειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "ἀκούομαι",
-            "pres_mid_ind_2sg": "ἀκούῃ",
-            "pres_mid_ind_3sg": "ἀκούεται",
-            "pres_mid_ind_1pl": "ἀκουόμεθα",
-            "pres_mid_ind_2pl": "ἀκούεσθε",
-            "pres_mid_ind_3pl": "ἀκούονται",
-            "impf_mid_ind_1sg": "ἠκουόμην",
-            "impf_mid_ind_2sg": "ἠκούου",
-            "impf_mid_ind_3sg": "ἠκούετο",
-            "impf_mid_ind_1pl": "ἠκουόμεθα",
-            "impf_mid_ind_2pl": "ἠκούεσθε",
-            "impf_mid_ind_3pl": "ἠκούοντο",
-            "fut_mid_ind_1sg": "ἀκούσομαι",
-            "fut_mid_ind_2sg": "ἀκούσῃ",
-            "fut_mid_ind_3sg": "ἀκούσεται",
-            "fut_mid_ind_1pl": "ἀκουσόμεθα",
-            "fut_mid_ind_2pl": "ἀκούσεσθε",
-            "fut_mid_ind_3pl": "ἀκούσονται",
-            "aor_mid_ind_1sg": "ἠκουσάμην",
-            "aor_mid_ind_2sg": "ἠκούσω",
-            "aor_mid_ind_3sg": "ἠκούσατο",
-            "aor_mid_ind_1pl": "ἠκουσάμεθα",
-            "aor_mid_ind_2pl": "ἠκούσασθε",
-            "aor_mid_ind_3pl": "ἠκούσαντο",
-        },
-    },
-    "ἐπιτρέπω": {
-        "lemma": "ἐπιτρέπω",
-        "pos": "verb",
-        "meaning": "I permit, allow",
-        "translations": ["permit", "allow"],
-        "conjugation": "thematic",
-        "object_case": "dat",
-        "forms": {
-            "pres_act_ind_1sg": "ἐπιτρέπω",
-            "pres_act_ind_2sg": "ἐπιτρέπεις",
-            "pres_act_ind_3sg": "ἐπιτρέπει",
-            "pres_act_ind_1pl": "ἐπιτρέπομεν",
-            "pres_act_ind_2pl": "ἐπιτρέπετε",
-            "pres_act_ind_3pl": "ἐπιτρέπουσι",
-            "impf_act_ind_1sg": "ἐπέτρεπον",
-            "impf_act_ind_2sg": "ἐπέτρεπες",
-            "impf_act_ind_3sg": "ἐπέτρεπε",
-            "impf_act_ind_1pl": "ἐπετρέπομεν",
-            "impf_act_ind_2pl": "ἐπετρέπετε",
-            "impf_act_ind_3pl": "ἐπέτρεπον",
-            "fut_act_ind_1sg": "ἐπιτρέψω",
-            "fut_act_ind_2sg": "ἐπιτρέψεις",
-            "fut_act_ind_3sg": "ἐπιτρέψει",
-            "fut_act_ind_1pl": "ἐπιτρέψομεν",
-            "fut_act_ind_2pl": "ἐπιτρέψετε",
-            "fut_act_ind_3pl": "ἐπιτρέψουσι",
-            "aor_act_ind_1sg": "ἐπέτρεψα",
-            "aor_act_ind_2sg": "ἐπέτρεψας",
-            "aor_act_ind_3sg": "ἐπέτρεψε",
-            "aor_act_ind_1pl": "ἐπετρέψαμεν",
-            "aor_act_ind_2pl": "ἐπετρέψατε",
-            "aor_act_ind_3pl": "ἐπέτρεψαν",
-            "pres_act_inf": "ἐπιτρέπειν",
-            # Middle voice
-            "pres_mid_ind_1sg": "ἐπιτρέπομαι",
-            "pres_mid_ind_2sg": "ἐπιτρέπῃ",
-            "pres_mid_ind_3sg": "ἐπιτρέπεται",
-            "pres_mid_ind_1pl": "ἐπιτρεπόμεθα",
-            "pres_mid_ind_2pl": "ἐπιτρέπεσθε",
-            "pres_mid_ind_3pl": "ἐπιτρέπονται",
-            "impf_mid_ind_1sg": "ἐπετρεπόμην",
-            "impf_mid_ind_2sg": "ἐπετρέπου",
-            "impf_mid_ind_3sg": "ἐπετρέπετο",
-            "impf_mid_ind_1pl": "ἐπετρεπόμεθα",
-            "impf_mid_ind_2pl": "ἐπετρέπεσθε",
-            "impf_mid_ind_3pl": "ἐπετρέποντο",
-            "fut_mid_ind_1sg": "ἐπιτρέψομαι",
-            "fut_mid_ind_2sg": "ἐπιτρέψῃ",
-            "fut_mid_ind_3sg": "ἐπιτρέψεται",
-            "fut_mid_ind_1pl": "ἐπιτρεψόμεθα",
-            "fut_mid_ind_2pl": "ἐπιτρέψεσθε",
-            "fut_mid_ind_3pl": "ἐπιτρέψονται",
-            "aor_mid_ind_1sg": "ἐπετρεψάμην",
-            "aor_mid_ind_2sg": "ἐπετρέψω",
-            "aor_mid_ind_3sg": "ἐπετρέψατο",
-            "aor_mid_ind_1pl": "ἐπετρεψάμεθα",
-            "aor_mid_ind_2pl": "ἐπετρέψασθε",
-            "aor_mid_ind_3pl": "ἐπετρέψαντο",
-        },
-    },
+Nothing is decoded at import.  ``WORDS.partition("noun", "article")``
+selects entries by part of speech, and the gloss, form and reading
+indexes below are each built on first use.
+"""
 
-    # ── Deponent verbs ───────────────────────────────────────────────────
-    "ἔρχομαι": {
-        "lemma": "ἔρχομαι",
-        "pos": "verb",
-        "meaning": "I go, come",
-        "translations": ["go", "come"],
-        "conjugation": "thematic",
-        "deponent": True,
-        "forms": {
-            "pres_mid_ind_1sg": "ἔρχομαι",
-            "pres_mid_ind_2sg": "ἔρχῃ",
-            "pres_mid_ind_3sg": "ἔρχεται",
-            "pres_mid_ind_1pl": "ἐρχόμεθα",
-            "pres_mid_ind_2pl": "ἔρχεσθε",
-            "pres_mid_ind_3pl": "ἔρχονται",
-            "impf_mid_ind_1sg": "ἠρχόμην",
-            "impf_mid_ind_2sg": "ἤρχου",
-            "impf_mid_ind_3sg": "ἤρχετο",
-            "impf_mid_ind_1pl": "ἠρχόμεθα",
-            "impf_mid_ind_2pl": "ἤρχεσθε",
-            "impf_mid_ind_3pl": "ἤρχοντο",
-            "fut_mid_ind_1sg": "ἐλεύσομαι",
-            "fut_mid_ind_2sg": "ἐλεύσῃ",
-            "fut_mid_ind_3sg": "ἐλεύσεται",
-            "fut_mid_ind_1pl": "ἐλευσόμεθα",
-            "fut_mid_ind_2pl": "ἐλεύσεσθε",
-            "fut_mid_ind_3pl": "ἐλεύσονται",
-            "aor_mid_ind_1sg": "ἦλθον",
-            "aor_mid_ind_2sg": "ἦλθες",
-            "aor_mid_ind_3sg": "ἦλθε",
-            "aor_mid_ind_1pl": "ἤλθομεν",
-            "aor_mid_ind_2pl": "ἤλθετε",
-            "aor_mid_ind_3pl": "ἦλθον",
-        },
-    },
-    "γίγνομαι": {
-        "lemma": "γίγνομαι",
-        "pos": "verb",
-        "meaning": "I become",
-        "translations": ["become"],
-        "conjugation": "thematic",
-        "deponent": True,
-        "forms": {
-            "pres_mid_ind_1sg": "γίγνομαι",
-            "pres_mid_ind_2sg": "γίγνῃ",
-            "pres_mid_ind_3sg": "γίγνεται",
-            "pres_mid_ind_1pl": "γιγνόμεθα",
-            "pres_mid_ind_2pl": "γίγνεσθε",
-            "pres_mid_ind_3pl": "γίγνονται",
-            "impf_mid_ind_1sg": "ἐγιγνόμην",
-            "impf_mid_ind_2sg": "ἐγίγνου",
-            "impf_mid_ind_3sg": "ἐγίγνετο",
-            "impf_mid_ind_1pl": "ἐγιγνόμεθα",
-            "impf_mid_ind_2pl": "ἐγίγνεσθε",
-            "impf_mid_ind_3pl": "ἐγίγνοντο",
-            "fut_mid_ind_1sg": "γενήσομαι",
-            "fut_mid_ind_2sg": "γενήσῃ",
-            "fut_mid_ind_3sg": "γενήσεται",
-            "fut_mid_ind_1pl": "γενησόμεθα",
-            "fut_mid_ind_2pl": "γενήσεσθε",
-            "fut_mid_ind_3pl": "γενήσονται",
-            "aor_mid_ind_1sg": "ἐγενόμην",
-            "aor_mid_ind_2sg": "ἐγένου",
-            "aor_mid_ind_3sg": "ἐγένετο",
-            "aor_mid_ind_1pl": "ἐγενόμεθα",
-            "aor_mid_ind_2pl": "ἐγένεσθε",
-            "aor_mid_ind_3pl": "ἐγένοντο",
-        },
-    },
-    "βούλομαι": {
-        "lemma": "βούλομαι",
-        "pos": "verb",
-        "meaning": "I wish, want",
-        "translations": ["wish", "want"],
-        "conjugation": "thematic",
-        "deponent": True,
-        "forms": {
-            "pres_mid_ind_1sg": "βούλομαι",
-            "pres_mid_ind_2sg": "βούλῃ",
-            "pres_mid_ind_3sg": "βούλεται",
-            "pres_mid_ind_1pl": "βουλόμεθα",
-            "pres_mid_ind_2pl": "βούλεσθε",
-            "pres_mid_ind_3pl": "βούλονται",
-            "impf_mid_ind_1sg": "ἐβουλόμην",
-            "impf_mid_ind_2sg": "ἐβούλου",
-            "impf_mid_ind_3sg": "ἐβούλετο",
-            "impf_mid_ind_1pl": "ἐβουλόμεθα",
-            "impf_mid_ind_2pl": "ἐβούλεσθε",
-            "impf_mid_ind_3pl": "ἐβούλοντο",
-            "fut_mid_ind_1sg": "βουλήσομαι",
-            "fut_mid_ind_2sg": "βουλήσῃ",
-            "fut_mid_ind_3sg": "βουλήσεται",
-            "fut_mid_ind_1pl": "βουλησόμεθα",
-            "fut_mid_ind_2pl": "βουλήσεσθε",
-            "fut_mid_ind_3pl": "βουλήσονται",
-            "aor_mid_ind_1sg": "ἐβουλήθην",
-            "aor_mid_ind_2sg": "ἐβουλήθης",
-            "aor_mid_ind_3sg": "ἐβουλήθη",
-            "aor_mid_ind_1pl": "ἐβουλήθημεν",
-            "aor_mid_ind_2pl": "ἐβουλήθητε",
-            "aor_mid_ind_3pl": "ἐβουλήθησαν",
-        },
-    },
-    "δέχομαι": {
-        "lemma": "δέχομαι",
-        "pos": "verb",
-        "meaning": "I receive",
-        "translations": ["receive"],
-        "conjugation": "thematic",
-        "deponent": True,
-        "forms": {
-            "pres_mid_ind_1sg": "δέχομαι",
-            "pres_mid_ind_2sg": "δέχῃ",
-            "pres_mid_ind_3sg": "δέχεται",
-            "pres_mid_ind_1pl": "δεχόμεθα",
-            "pres_mid_ind_2pl": "δέχεσθε",
-            "pres_mid_ind_3pl": "δέχονται",
-            "impf_mid_ind_1sg": "ἐδεχόμην",
-            "impf_mid_ind_2sg": "ἐδέχου",
-            "impf_mid_ind_3sg": "ἐδέχετο",
-            "impf_mid_ind_1pl": "ἐδεχόμεθα",
-            "impf_mid_ind_2pl": "ἐδέχεσθε",
-            "impf_mid_ind_3pl": "ἐδέχοντο",
-            "fut_mid_ind_1sg": "δέξομαι",
-            "fut_mid_ind_2sg": "δέξῃ",
-            "fut_mid_ind_3sg": "δέξεται",
-            "fut_mid_ind_1pl": "δεξόμεθα",
-            "fut_mid_ind_2pl": "δέξεσθε",
-            "fut_mid_ind_3pl": "δέξονται",
-            "aor_mid_ind_1sg": "ἐδεξάμην",
-            "aor_mid_ind_2sg": "ἐδέξω",
-            "aor_mid_ind_3sg": "ἐδέξατο",
-            "aor_mid_ind_1pl": "ἐδεξάμεθα",
-            "aor_mid_ind_2pl": "ἐδέξασθε",
-            "aor_mid_ind_3pl": "ἐδέξαντο",
-        },
-    },
+from __future__ import annotations
 
-    # ── Adjectives ────────────────────────────────────────────────────────
-    "ἀγαθός": {
-        "lemma": "ἀγαθός",
-        "pos": "adjective",
-        "meaning": "good, noble",
-        "translations": ["good", "noble"],
-        "forms": {
-            # masculine
-            "nom_sg_masc": "ἀγαθός", "gen_sg_masc": "ἀγαθοῦ",
-            "dat_sg_masc": "ἀγαθῷ",  "acc_sg_masc": "ἀγαθόν",
-            "nom_pl_masc": "ἀγαθοί", "gen_pl_masc": "ἀγαθῶν",
-            "dat_pl_masc": "ἀγαθοῖς", "acc_pl_masc": "ἀγαθούς",
-            # feminine
-            "nom_sg_fem": "ἀγαθή",  "gen_sg_fem": "ἀγαθῆς",
-            "dat_sg_fem": "ἀγαθῇ",  "acc_sg_fem": "ἀγαθήν",
-            "nom_pl_fem": "ἀγαθαί", "gen_pl_fem": "ἀγαθῶν",
-            "dat_pl_fem": "ἀγαθαῖς", "acc_pl_fem": "ἀγαθάς",
-            # neuter
-            "nom_sg_neut": "ἀγαθόν", "gen_sg_neut": "ἀγαθοῦ",
-            "dat_sg_neut": "ἀγαθῷ",  "acc_sg_neut": "ἀγαθόν",
-            "nom_pl_neut": "ἀγαθά",  "gen_pl_neut": "ἀγαθῶν",
-            "dat_pl_neut": "ἀγαθοῖς", "acc_pl_neut": "ἀγαθά",
-        },
-    },
-    "κακός": {
-        "lemma": "κακός",
-        "pos": "adjective",
-        "meaning": "bad, evil",
-        "translations": ["bad", "evil"],
-        "forms": {
-            "nom_sg_masc": "κακός", "gen_sg_masc": "κακοῦ",
-            "dat_sg_masc": "κακῷ",  "acc_sg_masc": "κακόν",
-            "nom_pl_masc": "κακοί", "gen_pl_masc": "κακῶν",
-            "dat_pl_masc": "κακοῖς", "acc_pl_masc": "κακούς",
-            "nom_sg_fem": "κακή",  "gen_sg_fem": "κακῆς",
-            "dat_sg_fem": "κακῇ",  "acc_sg_fem": "κακήν",
-            "nom_pl_fem": "κακαί", "gen_pl_fem": "κακῶν",
-            "dat_pl_fem": "κακαῖς", "acc_pl_fem": "κακάς",
-            "nom_sg_neut": "κακόν", "gen_sg_neut": "κακοῦ",
-            "dat_sg_neut": "κακῷ",  "acc_sg_neut": "κακόν",
-            "nom_pl_neut": "κακά",  "gen_pl_neut": "κακῶν",
-            "dat_pl_neut": "κακοῖς", "acc_pl_neut": "κακά",
-        },
-    },
-    "καλός": {
-        "lemma": "καλός",
-        "pos": "adjective",
-        "meaning": "beautiful, fine",
-        "translations": ["beautiful", "fine"],
-        "forms": {
-            "nom_sg_masc": "καλός", "gen_sg_masc": "καλοῦ",
-            "dat_sg_masc": "καλῷ",  "acc_sg_masc": "καλόν",
-            "nom_pl_masc": "καλοί", "gen_pl_masc": "καλῶν",
-            "dat_pl_masc": "καλοῖς", "acc_pl_masc": "καλούς",
-            "nom_sg_fem": "καλή",  "gen_sg_fem": "καλῆς",
-            "dat_sg_fem": "καλῇ",  "acc_sg_fem": "καλήν",
-            "nom_pl_fem": "καλαί", "gen_pl_fem": "καλῶν",
-            "dat_pl_fem": "καλαῖς", "acc_pl_fem": "καλάς",
-            "nom_sg_neut": "καλόν", "gen_sg_neut": "καλοῦ",
-            "dat_sg_neut": "καλῷ",  "acc_sg_neut": "καλόν",
-            "nom_pl_neut": "καλά",  "gen_pl_neut": "καλῶν",
-            "dat_pl_neut": "καλοῖς", "acc_pl_neut": "καλά",
-        },
-    },
-    "σοφός": {
-        "lemma": "σοφός",
-        "pos": "adjective",
-        "meaning": "wise",
-        "translations": ["wise"],
-        "forms": {
-            "nom_sg_masc": "σοφός", "gen_sg_masc": "σοφοῦ",
-            "dat_sg_masc": "σοφῷ",  "acc_sg_masc": "σοφόν",
-            "nom_pl_masc": "σοφοί", "gen_pl_masc": "σοφῶν",
-            "dat_pl_masc": "σοφοῖς", "acc_pl_masc": "σοφούς",
-            "nom_sg_fem": "σοφή",  "gen_sg_fem": "σοφῆς",
-            "dat_sg_fem": "σοφῇ",  "acc_sg_fem": "σοφήν",
-            "nom_pl_fem": "σοφαί", "gen_pl_fem": "σοφῶν",
-            "dat_pl_fem": "σοφαῖς", "acc_pl_fem": "σοφάς",
-            "nom_sg_neut": "σοφόν", "gen_sg_neut": "σοφοῦ",
-            "dat_sg_neut": "σοφῷ",  "acc_sg_neut": "σοφόν",
-            "nom_pl_neut": "σοφά",  "gen_pl_neut": "σοφῶν",
-            "dat_pl_neut": "σοφοῖς", "acc_pl_neut": "σοφά",
-        },
-    },
-    "μικρός": {
-        "lemma": "μικρός",
-        "pos": "adjective",
-        "meaning": "small, little",
-        "translations": ["small", "little"],
-        "forms": {
-            "nom_sg_masc": "μικρός", "gen_sg_masc": "μικροῦ",
-            "dat_sg_masc": "μικρῷ",  "acc_sg_masc": "μικρόν",
-            "nom_pl_masc": "μικροί", "gen_pl_masc": "μικρῶν",
-            "dat_pl_masc": "μικροῖς", "acc_pl_masc": "μικρούς",
-            "nom_sg_fem": "μικρά",  "gen_sg_fem": "μικρᾶς",
-            "dat_sg_fem": "μικρᾷ",  "acc_sg_fem": "μικράν",
-            "nom_pl_fem": "μικραί", "gen_pl_fem": "μικρῶν",
-            "dat_pl_fem": "μικραῖς", "acc_pl_fem": "μικράς",
-            "nom_sg_neut": "μικρόν", "gen_sg_neut": "μικροῦ",
-            "dat_sg_neut": "μικρῷ",  "acc_sg_neut": "μικρόν",
-            "nom_pl_neut": "μικρά",  "gen_pl_neut": "μικρῶν",
-            "dat_pl_neut": "μικροῖς", "acc_pl_neut": "μικρά",
-        },
-    },
-    "μέγας": {
-        "lemma": "μέγας",
-        "pos": "adjective",
-        "meaning": "great, large",
-        "translations": ["great", "large"],
-        "forms": {
-            "nom_sg_masc": "μέγας",  "gen_sg_masc": "μεγάλου",
-            "dat_sg_masc": "μεγάλῳ", "acc_sg_masc": "μέγαν",
-            "nom_pl_masc": "μεγάλοι", "gen_pl_masc": "μεγάλων",
-            "dat_pl_masc": "μεγάλοις", "acc_pl_masc": "μεγάλους",
-            "nom_sg_fem": "μεγάλη",  "gen_sg_fem": "μεγάλης",
-            "dat_sg_fem": "μεγάλῃ",  "acc_sg_fem": "μεγάλην",
-            "nom_pl_fem": "μεγάλαι", "gen_pl_fem": "μεγάλων",
-            "dat_pl_fem": "μεγάλαις", "acc_pl_fem": "μεγάλας",
-            "nom_sg_neut": "μέγα",   "gen_sg_neut": "μεγάλου",
-            "dat_sg_neut": "μεγάλῳ", "acc_sg_neut": "μέγα",
-            "nom_pl_neut": "μεγάλα", "gen_pl_neut": "μεγάλων",
-            "dat_pl_neut": "μεγάλοις", "acc_pl_neut": "μεγάλα",
-        },
-    },
-    "δίκαιος": {
-        "lemma": "δίκαιος",
-        "pos": "adjective",
-        "meaning": "just, righteous",
-        "translations": ["just", "righteous"],
-        "forms": {
-            "nom_sg_masc": "δίκαιος", "gen_sg_masc": "δικαίου",
-            "dat_sg_masc": "δικαίῳ",  "acc_sg_masc": "δίκαιον",
-            "nom_pl_masc": "δίκαιοι", "gen_pl_masc": "δικαίων",
-            "dat_pl_masc": "δικαίοις", "acc_pl_masc": "δικαίους",
-            "nom_sg_fem": "δικαία",  "gen_sg_fem": "δικαίας",
-            "dat_sg_fem": "δικαίᾳ",  "acc_sg_fem": "δικαίαν",
-            "nom_pl_fem": "δίκαιαι", "gen_pl_fem": "δικαίων",
-            "dat_pl_fem": "δικαίαις", "acc_pl_fem": "δικαίας",
-            "nom_sg_neut": "δίκαιον", "gen_sg_neut": "δικαίου",
-            "dat_sg_neut": "δικαίῳ",  "acc_sg_neut": "δίκαιον",
-            "nom_pl_neut": "δίκαια",  "gen_pl_neut": "δικαίων",
-            "dat_pl_neut": "δικαίοις", "acc_pl_neut": "δίκαια",
-        },
-    },
-    "ἄξιος": {
-        "lemma": "ἄξιος",
-        "pos": "adjective",
-        "meaning": "worthy, deserving",
-        "translations": ["worthy", "deserving"],
-        "forms": {
-            "nom_sg_masc": "ἄξιος", "gen_sg_masc": "ἀξίου",
-            "dat_sg_masc": "ἀξίῳ",  "acc_sg_masc": "ἄξιον",
-            "nom_pl_masc": "ἄξιοι", "gen_pl_masc": "ἀξίων",
-            "dat_pl_masc": "ἀξίοις", "acc_pl_masc": "ἀξίους",
-            "nom_sg_fem": "ἀξία",  "gen_sg_fem": "ἀξίας",
-            "dat_sg_fem": "ἀξίᾳ",  "acc_sg_fem": "ἀξίαν",
-            "nom_pl_fem": "ἄξιαι", "gen_pl_fem": "ἀξίων",
-            "dat_pl_fem": "ἀξίαις", "acc_pl_fem": "ἀξίας",
-            "nom_sg_neut": "ἄξιον", "gen_sg_neut": "ἀξίου",
-            "dat_sg_neut": "ἀξίῳ",  "acc_sg_neut": "ἄξιον",
-            "nom_pl_neut": "ἄξια",  "gen_pl_neut": "ἀξίων",
-            "dat_pl_neut": "ἀξίοις", "acc_pl_neut": "ἄξια",
-        },
-    },
+import functools
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Mapping, NamedTuple, TypeVar
 
-    # ── Prepositions ──────────────────────────────────────────────────────
-    "ἐν": {
-        "lemma": "ἐν",
-        "pos": "preposition",
-        "meaning": "in (+ dative)",
-        "translations": ["in"],
-        "governs": "dat",
-        "forms": {"base": "ἐν"},
-    },
-    "εἰς": {
-        "lemma": "εἰς",
-        "pos": "preposition",
-        "meaning": "into, to (+ accusative)",
-        "translations": ["into"],
-        "governs": "acc",
-        "forms": {"base": "εἰς"},
-    },
-    "ἐκ": {
-        "lemma": "ἐκ",
-        "pos": "preposition",
-        "meaning": "out of, from (+ genitive)",
-        "translations": ["out of"],
-        "governs": "gen",
-        "forms": {"base": "ἐκ"},
-    },
-    "πρός": {
-        "lemma": "πρός",
-        "pos": "preposition",
-        "meaning": "to, toward (+ accusative)",
-        "translations": ["toward"],
-        "governs": "acc",
-        "forms": {"base": "πρός"},
-    },
-    "ἀπό": {
-        "lemma": "ἀπό",
-        "pos": "preposition",
-        "meaning": "from, away from (+ genitive)",
-        "translations": ["away from"],
-        "governs": "gen",
-        "forms": {"base": "ἀπό"},
-    },
+import paradigms
+from accentuation import normalize_graves, strip_diacritics
+from english import english_key, gloss_keys
+from cache import CACHE_DIR, file_digest, read_pickle, write_pickle
+from lexicon import Lexicon, diff_lexicons, load_lexicon
 
-    # ── Conjunctions ──────────────────────────────────────────────────────
-    "καί": {
-        "lemma": "καί",
-        "pos": "conjunction",
-        "meaning": "and",
-        "translations": ["and"],
-        "forms": {"base": "καί"},
-    },
-    "ἀλλά": {
-        "lemma": "ἀλλά",
-        "pos": "conjunction",
-        "meaning": "but",
-        "translations": ["but"],
-        "forms": {"base": "ἀλλά"},
-    },
-}
+WORDS = load_lexicon()
 
 
 # ---------------------------------------------------------------------------
 # English → Greek reverse mapping
 # ---------------------------------------------------------------------------
 
+_ENGLISH_TO_GREEK: dict[str, list[str]] | None = None
+_ENGLISH_INDEX: dict[str, frozenset[str]] | None = None
+_ENGLISH_SOURCES: dict[str, set[str]] = {}   # key → glosses filed under it
+_NO_LEMMAS: frozenset[str] = frozenset()
+
+
 def _build_english_to_greek() -> dict[str, list[str]]:
     mapping: dict[str, list[str]] = {}
     for lemma, entry in WORDS.items():
@@ -1434,11 +44,89 @@ def _build_english_to_greek() -> dict[str, list[str]]:
             mapping.setdefault(eng, []).append(lemma)
     return mapping
 
-ENGLISH_TO_GREEK = _build_english_to_greek()
 
-def translate_english(eng_keyword: str) -> list[str]:
-    """Return Greek lemmas for an English keyword."""
-    return ENGLISH_TO_GREEK.get(eng_keyword, [])
+def get_english_to_greek() -> dict[str, list[str]]:
+    """Return the English → Greek mapping, built on first use.
+
+    Only the ``translations`` field of each entry is decoded, so a
+    process that never checks glosses never pays for them.
+    """
+    global _ENGLISH_TO_GREEK
+    if _ENGLISH_TO_GREEK is None:
+        _ENGLISH_TO_GREEK = _build_english_to_greek()
+    return _ENGLISH_TO_GREEK
+
+
+def _english_lemmas(key: str) -> frozenset[str]:
+    mapping = _ENGLISH_TO_GREEK
+    return frozenset(lemma for gloss in _ENGLISH_SOURCES[key]
+                     for lemma in mapping[gloss])
+
+
+def get_english_index() -> dict[str, frozenset[str]]:
+    """Return English key → Greek lemmas, built on first use.
+
+    Every gloss is filed under each of its ``english.gloss_keys``, so
+    inflected and phrasal queries resolve with one dict probe.
+    """
+    global _ENGLISH_INDEX
+    if _ENGLISH_INDEX is None:
+        _ENGLISH_SOURCES.clear()
+        for gloss in get_english_to_greek():
+            for key in gloss_keys(gloss):
+                _ENGLISH_SOURCES.setdefault(key, set()).add(gloss)
+        _ENGLISH_INDEX = {key: _english_lemmas(key) for key in _ENGLISH_SOURCES}
+    return _ENGLISH_INDEX
+
+
+def translate_english(eng_keyword: str) -> frozenset[str]:
+    """Return the Greek lemmas glossed by an English word or phrase.
+
+    Plurals, verb inflections, a leading "to" or article and case are
+    normalized away: "horses", "releases", "The man" and "to look at"
+    all match.  The result is a shared frozenset.
+    """
+    return get_english_index().get(english_key(eng_keyword), _NO_LEMMAS)
+
+
+# ---------------------------------------------------------------------------
+# Feature bundles: one shared, read-only dict per distinct set of features
+# ---------------------------------------------------------------------------
+
+class FeatureBundle(dict):
+    """A read-only feature dict, shared by every analysis that has it.
+
+    Built by ``intern_features``: equal bundles are the same object and
+    their keys and values are interned strings, so comparisons between
+    them reduce to identity checks.  Pickling goes back through
+    ``intern_features``, so bundles stay shared across the disk cache.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("feature bundles are shared and read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return intern_features, (dict(self),)
+
+
+_FEATURE_BUNDLES: dict[tuple, FeatureBundle] = {}
+
+
+def intern_features(features: Mapping[str, str]) -> FeatureBundle:
+    """Return the shared read-only bundle equal to *features*."""
+    key = tuple(features.items())
+    bundle = _FEATURE_BUNDLES.get(key)
+    if bundle is None:
+        bundle = _FEATURE_BUNDLES[key] = FeatureBundle(
+            (sys.intern(k), sys.intern(v) if isinstance(v, str) else v)
+            for k, v in key
+        )
+    return bundle
 
 
 # ---------------------------------------------------------------------------
@@ -1446,6 +134,11 @@ def translate_english(eng_keyword: str) -> list[str]:
 # ---------------------------------------------------------------------------
 
 _FORM_INDEX: dict[str, list[tuple[str, str, dict]]] | None = None
+_BASE_INDEX: dict[str, tuple[str, ...]] | None = None
+_FORWARD_INDEX: dict[tuple[int, tuple], str] | None = None
+_LEMMA_IDS: dict[str, int] | None = None
+_NEXT_LEMMA_ID = 0
+FORM_INDEX_CACHE = CACHE_DIR / "form_index.pickle"
 
 
 GENDER_NORMALIZE = {
@@ -1497,64 +190,538 @@ def _parse_verb_key(key: str) -> dict:
     return {}
 
 
-def _build_form_index() -> dict[str, list[tuple[str, str, dict]]]:
-    """Build a reverse index from surface form → (lemma, pos, features)."""
-    index: dict[str, list[tuple[str, str, dict]]] = {}
-    for lemma, entry in WORDS.items():
-        entry_pos = entry["pos"]
-        for key, form in entry["forms"].items():
-            pos = entry_pos
-            # Handle ν-movable forms like "λύουσι(ν)"
-            forms_to_add = [form]
-            if "(ν)" in form:
-                base = form.replace("(ν)", "")
-                forms_to_add = [base, base + "ν"]
-
-            if pos == "noun":
-                features = _parse_noun_key(key, entry)
-            elif pos in ("article", "adjective"):
-                features = _parse_article_or_adj_key(key)
-            elif pos == "verb":
-                features = _parse_verb_key(key)
-                obj_case = entry.get("object_case")
-                if obj_case:
-                    features["object_case"] = obj_case
-                if features.get("mood") == "ptcp":
-                    pos = "participle"
-            elif pos == "preposition":
-                features = {"governs": entry.get("governs", "")}
-            elif pos == "conjunction":
-                features = {}
-            else:
-                features = {}
+def _entry_cells(entry: Mapping) -> Iterator[tuple[str, str, dict]]:
+    """Yield ``(form, pos, features)`` for every cell of *entry*.
+
+    *form* is as in the paradigm table, ``(ν)`` markers included.
+    """
+    entry_pos = entry["pos"]
+    for key, form in entry["forms"].items():
+        pos = entry_pos
+        if pos == "noun":
+            features = _parse_noun_key(key, entry)
+        elif pos in ("article", "adjective"):
+            features = _parse_article_or_adj_key(key)
+        elif pos == "verb":
+            features = _parse_verb_key(key)
+            obj_case = entry.get("object_case")
+            if obj_case:
+                features["object_case"] = obj_case
+            if features.get("mood") == "ptcp":
+                pos = "participle"
+        elif pos == "preposition":
+            features = {"governs": entry.get("governs", "")}
+        elif pos == "conjunction":
+            features = {}
+        else:
+            features = {}
+        yield form, pos, intern_features(features)
+
+
+def surface_forms(form: str) -> list[str]:
+    """Spell out a ν-movable form like "λύουσι(ν)" both ways."""
+    if "(ν)" in form:
+        base = form.replace("(ν)", "")
+        return [base, base + "ν"]
+    return [form]
+
+
+def _forward_keys(lemma_id: int, pos: str, features: dict) -> list[tuple]:
+    """Forward index keys of one cell; nouns are filed both with and
+    without their (lexical) gender."""
+    keys = [(lemma_id, pack_features(features))]
+    if pos == "noun":
+        lexical = {k: v for k, v in features.items() if k != "gender"}
+        keys.append((lemma_id, pack_features(lexical)))
+    return keys
+
 
-            for f in forms_to_add:
+def _build_form_index(forward: dict | None = None,
+                      ) -> dict[str, list[tuple[str, str, dict]]]:
+    """Build a reverse index from surface form → (lemma, pos, features).
+
+    When *forward* is given it is filled in the same pass with
+    ``(lemma id, pack_features(features)) → form``.
+    """
+    index: dict[str, list[tuple[str, str, dict]]] = {}
+    for lemma_id, (lemma, entry) in enumerate(WORDS.items()):
+        for form, pos, features in _entry_cells(entry):
+            for f in surface_forms(form):
                 if f not in index:
                     index[f] = []
                 index[f].append((lemma, pos, features))
+
+            if forward is not None:
+                for key in _forward_keys(lemma_id, pos, features):
+                    forward.setdefault(key, form)
     return index
 
 
+def _build_base_index(index: Mapping[str, list]) -> dict[str, tuple[str, ...]]:
+    """Group surface forms by their base letters (diacritics stripped)."""
+    groups: dict[str, list[str]] = {}
+    for form in index:
+        groups.setdefault(strip_diacritics(form), []).append(form)
+    return {base: tuple(forms) for base, forms in groups.items()}
+
+
+def _form_index_key() -> str:
+    """Cache key: the lexicon source hash plus this module's and the
+    paradigm engine's, since generated forms feed the index."""
+    return f"{WORDS.digest}:{file_digest(__file__, paradigms.__file__)}"
+
+
 def get_form_index() -> dict[str, list[tuple[str, str, dict]]]:
-    """Return the (lazily built) form index."""
-    global _FORM_INDEX
+    """Return the form index, loading it from the on-disk cache if fresh.
+
+    The cache is rebuilt only when the lexicon content (or the indexing
+    code in this module) changes.  The base-letter and forward indexes
+    are built and cached alongside it.
+    """
+    global _FORM_INDEX, _BASE_INDEX, _FORWARD_INDEX, _LEMMA_IDS, _NEXT_LEMMA_ID
     if _FORM_INDEX is None:
-        _FORM_INDEX = _build_form_index()
+        key = _form_index_key()
+        cached = read_pickle(FORM_INDEX_CACHE)
+        if isinstance(cached, dict) and cached.get("key") == key:
+            _FORM_INDEX, _BASE_INDEX = cached["index"], cached["base"]
+            _FORWARD_INDEX = cached["forward"]
+            _LEMMA_IDS, _NEXT_LEMMA_ID = cached["lemma_ids"], cached["next_id"]
+        else:
+            _FORWARD_INDEX = {}
+            _FORM_INDEX = _build_form_index(_FORWARD_INDEX)
+            _BASE_INDEX = _build_base_index(_FORM_INDEX)
+            _LEMMA_IDS = {lemma: i for i, lemma in enumerate(WORDS)}
+            _NEXT_LEMMA_ID = len(_LEMMA_IDS)
+            _save_form_index(key)
     return _FORM_INDEX
 
 
+def _save_form_index(key: str) -> None:
+    write_pickle(FORM_INDEX_CACHE, {
+        "key": key, "index": _FORM_INDEX, "base": _BASE_INDEX,
+        "forward": _FORWARD_INDEX, "lemma_ids": _LEMMA_IDS,
+        "next_id": _NEXT_LEMMA_ID,
+    })
+
+
 def lookup_form(form_string: str) -> list[tuple[str, str, dict]]:
     """Look up an inflected form and return all possible analyses.
 
     Normalizes graves to acutes before lookup so that sentential forms
     (e.g. ἀγαθὸν with grave) still match citation forms (ἀγαθόν with acute).
 
-    Returns list of (lemma, pos, features) tuples.
+    Returns list of (lemma, pos, features) tuples; they are the index's
+    own lists and must not be mutated.
+
+    Once the index is loaded a lookup is ``normalize_graves`` (about
+    0.2 µs for a token with no grave) plus one dict probe; see
+    ``benchmark.py`` for measured percentiles.
+    """
+    idx = _FORM_INDEX if _FORM_INDEX is not None else get_form_index()
+    return idx.get(normalize_graves(form_string), [])
+
+
+_T = TypeVar("_T")
+
+# Distinct tokens remembered by one batch lookup before its memo is reset.
+BATCH_MEMO_SIZE = 1 << 16
+
+
+def _iter_batch(index: Mapping[str, _T], tokens: Iterable[str], empty: _T,
+                freeze: Callable | None = None) -> Iterator[_T]:
+    """Yield ``index[normalize_graves(token)]`` (or *empty*) per token.
+
+    Each distinct token is normalized, looked up and passed through
+    *freeze* once; repeats get the same result object.
+    """
+    memo: dict[str, _T] = {}
+    get = index.get
+    for token in tokens:
+        result = memo.get(token)
+        if result is None:
+            if len(memo) >= BATCH_MEMO_SIZE:
+                memo.clear()
+            result = get(normalize_graves(token), empty)
+            if freeze is not None:
+                result = freeze(result)
+            memo[token] = result
+        yield result
+
+
+def iter_lookup_forms(tokens: Iterable[str]) -> Iterator[tuple]:
+    """Yield the analyses of each token, as ``lookup_form`` would, lazily.
+
+    Suits corpora: *tokens* may be any iterator, and memory stays bounded
+    by ``BATCH_MEMO_SIZE`` distinct tokens.  Each result is a tuple of
+    (lemma, pos, features) shared by every occurrence of the token; the
+    feature dicts belong to the index and must not be mutated.
     """
-    from accentuation import normalize_graves
-    idx = get_form_index()
+    return _iter_batch(get_form_index(), tokens, (), tuple)
+
+
+def lookup_forms(tokens: Iterable[str]) -> list[tuple]:
+    """Return the analyses of every token (see ``iter_lookup_forms``).
+
+    ``lookup_forms("ὁ ἄνθρωπος λύει τὸν ἵππον".split())`` looks ``ὁ``
+    and ``τὸν`` up once each however often they recur.
+    """
+    return list(iter_lookup_forms(tokens))
+
+
+# ---------------------------------------------------------------------------
+# Forward index: (lemma id, packed features) → surface form
+# ---------------------------------------------------------------------------
+
+FORM_FEATURES = ("tense", "voice", "mood", "person", "number", "case", "gender")
+
+
+def pack_features(features: Mapping[str, str]) -> tuple:
+    """Pack inflectional features into the forward index's key order.
+
+    Other keys (``lemma``, ``object_case``, …) are ignored.
+    """
+    return tuple(features.get(name) for name in FORM_FEATURES)
+
+
+def lemma_id(lemma: str) -> int | None:
+    """Return the forward-index id of *lemma*.
+
+    Ids are positions in WORDS when the index is built; lemmas added by
+    ``reload_lexicon`` get fresh ids, so existing ids never change.
+    """
+    get_form_index()
+    return _LEMMA_IDS.get(lemma)
+
+
+def form_of(lemma: str, **features: str) -> str | None:
+    """Return the form of *lemma* with *features*, or None if it has none.
+
+    ``form_of("λύω", tense="pres", voice="act", mood="ind", person="3",
+    number="sg")`` → ``"λύει"``.  Forms come back exactly as in the
+    paradigm table, including ``(ν)`` markers; uninflected words use no
+    features.
+    """
+    lid = lemma_id(lemma)
+    if lid is None:
+        return None
+    return _FORWARD_INDEX.get((lid, pack_features(features)))
+
+
+def lemma_forms(lemma: str) -> dict[tuple, str]:
+    """Return ``pack_features(features) → form`` for *lemma* alone.
+
+    The same cells :func:`form_of` finds, read from the entry itself, so
+    showing one word does not build the form index.
+    """
+    entry = WORDS.get(lemma)
+    if entry is None:
+        return {}
+    table: dict[tuple, str] = {}
+    for form, pos, features in _entry_cells(entry):
+        for _, packed in _forward_keys(0, pos, features):
+            table.setdefault(packed, form)
+    return table
+
+
+def lookup_diacritic_variants(form_string: str) -> tuple[str, ...]:
+    """Return known forms spelled like *form_string* up to diacritics.
+
+    The input itself is excluded, so a non-empty result for an unknown
+    word means its letters are right but its accents, breathings, iota
+    subscripts or diaereses are not.
+    """
+    get_form_index()
     normalized = normalize_graves(form_string)
-    return idx.get(normalized, [])
+    variants = _BASE_INDEX.get(strip_diacritics(normalized), ())
+    return tuple(f for f in variants if f != normalized)
+
+
+# ---------------------------------------------------------------------------
+# Parser-ready readings: form → (grammar symbol, interned features + lemma)
+# ---------------------------------------------------------------------------
+
+# Map POS tags to grammar symbols
+POS_TO_SYMBOL = {
+    "article": "Art",
+    "noun": "N",
+    "verb": "V",
+    "adjective": "Adj",
+    "preposition": "Prep",
+    "conjunction": "Conj",
+    "participle": "Part",
+}
+
+SYMBOL_TO_POS = {symbol: pos for pos, symbol in POS_TO_SYMBOL.items()}
+
+
+class Reading(NamedTuple):
+    """One analysis of a surface form, ready for the parser.
+
+    ``features`` is a shared read-only mapping that includes ``lemma``;
+    it must not be mutated.  Unpacks as ``(symbol, features)``.
+    """
+
+    symbol: str
+    features: Mapping[str, str]
+
+    @property
+    def lemma(self) -> str:
+        return self.features["lemma"]
+
+    @property
+    def pos(self) -> str:
+        return SYMBOL_TO_POS[self.symbol]
+
+
+_READING_INDEX: dict[str, tuple[Reading, ...]] | None = None
+
+
+def _readings(analyses: list[tuple[str, str, dict]]) -> tuple[Reading, ...]:
+    """Turn one form's analyses into immutable parser readings."""
+    readings = []
+    for lemma, pos, feats in analyses:
+        symbol = POS_TO_SYMBOL.get(pos)
+        if symbol:
+            readings.append(
+                Reading(symbol, intern_features({**feats, "lemma": lemma}))
+            )
+    return tuple(readings)
+
+
+def _build_reading_index() -> dict[str, tuple[Reading, ...]]:
+    """Turn every form index entry into immutable parser readings."""
+    return {form: _readings(analyses)
+            for form, analyses in get_form_index().items()}
+
+
+def get_reading_index() -> dict[str, tuple[Reading, ...]]:
+    """Return the (lazily built) reading index."""
+    global _READING_INDEX
+    if _READING_INDEX is None:
+        _READING_INDEX = _build_reading_index()
+    return _READING_INDEX
+
+
+def lookup_readings(form_string: str) -> tuple[Reading, ...]:
+    """Return the parser readings of a form (graves normalized, no copies)."""
+    return get_reading_index().get(normalize_graves(form_string), ())
+
+
+def iter_lookup_readings(tokens: Iterable[str]) -> Iterator[tuple[Reading, ...]]:
+    """Yield ``lookup_readings`` of each token, each distinct token once."""
+    return _iter_batch(get_reading_index(), tokens, ())
+
+
+# ---------------------------------------------------------------------------
+# Hot reload: apply a recompiled lexicon to the live indexes
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class LexiconChange:
+    """What a ``reload_lexicon`` call changed.
+
+    ``forms_added`` and ``forms_removed`` are surface forms that entered
+    or left the form index; ``forms_changed`` is every form whose
+    analyses changed (a superset of both).  ``glosses`` are the English
+    keywords whose lemma lists changed.
+    """
+
+    added: tuple[str, ...] = ()
+    changed: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    forms_added: frozenset[str] = frozenset()
+    forms_removed: frozenset[str] = frozenset()
+    forms_changed: frozenset[str] = frozenset()
+    glosses: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+_RELOAD_LISTENERS: list[Callable[[LexiconChange], None]] = []
+
+# Held by ``reload_lexicon`` from the first read of the new lexicon until
+# the listeners return.  A thread reading ``WORDS`` or the indexes while
+# another may reload holds it too (see ``sentences.AnalysisWorker``).
+LEXICON_LOCK = threading.RLock()
+
+
+def on_reload(listener: Callable[[LexiconChange], None]):
+    """Register *listener* to be called with each non-empty
+    ``LexiconChange``; returns it, so it can be used as a decorator."""
+    _RELOAD_LISTENERS.append(listener)
+    return listener
+
+
+def _reindex_lemmas(old: Mapping[str, Mapping], new: Mapping[str, Mapping],
+                    position: Callable[[str], int],
+                    ) -> tuple[set[str], set[str], set[str]]:
+    """Swap the form, forward and base index entries of the lemmas in
+    *old* for those in *new*.
+
+    Returns the surface forms ``(added, removed, touched)``.
+
+    Touched forms get new analysis lists, so lists already handed out by
+    ``lookup_form`` are never mutated.  Each list is put back in lemma
+    order (*position* gives a lemma's place in the new lexicon), as a
+    fresh ``_build_form_index`` would have it.
+    """
+    global _NEXT_LEMMA_ID
+    touched: dict[str, list] = {}
+
+    def analyses(form: str) -> list:
+        if form not in touched:
+            touched[form] = list(_FORM_INDEX.get(form, ()))
+        return touched[form]
+
+    for lemma, entry in old.items():
+        lemma_id = _LEMMA_IDS[lemma] if lemma in new else _LEMMA_IDS.pop(lemma)
+        for form, pos, features in _entry_cells(entry):
+            for f in surface_forms(form):
+                analyses(f)[:] = [a for a in analyses(f) if a[0] != lemma]
+            for key in _forward_keys(lemma_id, pos, features):
+                _FORWARD_INDEX.pop(key, None)
+
+    for lemma, entry in new.items():
+        lemma_id = _LEMMA_IDS.get(lemma)
+        if lemma_id is None:
+            lemma_id = _LEMMA_IDS[lemma] = _NEXT_LEMMA_ID
+            _NEXT_LEMMA_ID += 1
+        for form, pos, features in _entry_cells(entry):
+            for f in surface_forms(form):
+                analyses(f).append((lemma, pos, features))
+            for key in _forward_keys(lemma_id, pos, features):
+                _FORWARD_INDEX.setdefault(key, form)
+
+    added: set[str] = set()
+    removed: set[str] = set()
+    for form, new_analyses in touched.items():
+        existed = form in _FORM_INDEX
+        if new_analyses:
+            new_analyses.sort(key=lambda a: position(a[0]))
+            _FORM_INDEX[form] = new_analyses
+            if not existed:
+                added.add(form)
+                base = strip_diacritics(form)
+                _BASE_INDEX[base] = _BASE_INDEX.get(base, ()) + (form,)
+        elif existed:
+            removed.add(form)
+            del _FORM_INDEX[form]
+            base = strip_diacritics(form)
+            rest = tuple(f for f in _BASE_INDEX[base] if f != form)
+            if rest:
+                _BASE_INDEX[base] = rest
+            else:
+                del _BASE_INDEX[base]
+    return added, removed, set(touched)
+
+
+def _regloss_lemmas(old: Mapping[str, Mapping], new: Mapping[str, Mapping],
+                    position: Callable[[str], int]) -> set[str]:
+    """Swap the English → Greek entries of *old* for *new*'s, keeping each
+    lemma list in lemma order; return the English keywords touched."""
+    mapping = _ENGLISH_TO_GREEK
+    touched: set[str] = set()
+    for lemma, entry in old.items():
+        for eng in entry.get("translations", ()):
+            lemmas = [g for g in mapping.get(eng, ()) if g != lemma]
+            if lemmas:
+                mapping[eng] = lemmas
+            else:
+                mapping.pop(eng, None)
+            touched.add(eng)
+    for lemma, entry in new.items():
+        for eng in entry.get("translations", ()):
+            mapping[eng] = mapping.get(eng, []) + [lemma]
+            touched.add(eng)
+    for eng in touched:
+        if eng in mapping:
+            mapping[eng] = sorted(mapping[eng], key=position)
+    return touched
+
+
+def _rekey_glosses(glosses: set[str]) -> None:
+    """Refresh the English index entries of *glosses* after a regloss."""
+    keys: set[str] = set()
+    for gloss in glosses:
+        present = gloss in _ENGLISH_TO_GREEK
+        for key in gloss_keys(gloss):
+            sources = _ENGLISH_SOURCES.setdefault(key, set())
+            if present:
+                sources.add(gloss)
+            else:
+                sources.discard(gloss)
+            keys.add(key)
+    for key in keys:
+        if _ENGLISH_SOURCES[key]:
+            _ENGLISH_INDEX[key] = _english_lemmas(key)
+        else:
+            del _ENGLISH_SOURCES[key]
+            _ENGLISH_INDEX.pop(key, None)
+
+
+def reload_lexicon(lexicon: Lexicon | None = None,
+                   persist: bool = False) -> LexiconChange:
+    """Pick up edits to the lexicon without a restart.
+
+    *lexicon* defaults to ``load_lexicon()``, which recompiles
+    ``words.py`` if it changed.  The new lexicon is diffed against
+    ``WORDS`` by entry fingerprint, and only the added, changed and
+    removed lemmas are re-indexed in whichever of the form, forward,
+    base-letter, reading and English indexes are loaded; indexes not yet
+    built simply build from the new lexicon later.  ``WORDS`` is then
+    updated in place, and listeners registered with ``on_reload`` are
+    called with the change so they can update their own indexes, all
+    under ``LEXICON_LOCK``.  Entry views taken before the reload raise
+    ``lexicon.StaleViewError`` when read.
+
+    With *persist* the updated form index is written to the on-disk
+    cache, so a restart starts warm; that write costs time proportional
+    to the whole index.
+    """
+    new_lexicon = load_lexicon() if lexicon is None else lexicon
+    with LEXICON_LOCK:
+        return _swap_lexicon(new_lexicon, persist)
+
+
+def _swap_lexicon(new_lexicon: Lexicon, persist: bool) -> LexiconChange:
+    if new_lexicon.digest == WORDS.digest:
+        return LexiconChange()
+    added, changed, removed = diff_lexicons(WORDS, new_lexicon)
+    # Views of the current entries must be read before the swap.
+    old = {lemma: WORDS[lemma] for lemma in (*changed, *removed)}
+    new = {lemma: new_lexicon[lemma] for lemma in (*added, *changed)}
+    position = functools.lru_cache(maxsize=None)(new_lexicon.position)
+
+    forms_added: set[str] = set()
+    forms_removed: set[str] = set()
+    forms: set[str] = set()
+    if _FORM_INDEX is not None:
+        forms_added, forms_removed, forms = _reindex_lemmas(old, new, position)
+        if _READING_INDEX is not None:
+            for form in forms:
+                if form in _FORM_INDEX:
+                    _READING_INDEX[form] = _readings(_FORM_INDEX[form])
+                else:
+                    _READING_INDEX.pop(form, None)
+    glosses: set[str] = set()
+    if _ENGLISH_TO_GREEK is not None:
+        glosses = _regloss_lemmas(old, new, position)
+        if _ENGLISH_INDEX is not None:
+            _rekey_glosses(glosses)
+    WORDS.swap(new_lexicon)
+    if persist and _FORM_INDEX is not None:
+        _save_form_index(_form_index_key())
+
+    change = LexiconChange(
+        tuple(added), tuple(changed), tuple(removed),
+        frozenset(forms_added), frozenset(forms_removed), frozenset(forms),
+        frozenset(glosses),
+    )
+    if change:
+        for listener in _RELOAD_LISTENERS:
+            listener(change)
+    return change
 
 
 # ---------------------------------------------------------------------------
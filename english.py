@@ -0,0 +1,160 @@
+"""English keys for glosses and queries.
+
+Prompts and searches name words in running English ("the horses",
+"releases", "to look at"), while ``translations`` hold base forms
+("horse", "release", "look at").  ``english_key`` reduces a query to a
+canonical key by lower-casing and dropping a leading infinitive "to" or
+article.  ``gloss_keys`` lists every key a gloss should answer to: the
+gloss itself plus the plural, third-person, past and -ing forms of its
+first and last words (the head of a phrasal verb or a noun phrase).
+Inflecting the glosses once, instead of lemmatizing every query, keeps
+a lookup to one normalization and one dict probe.
+
+``plural``, ``third_person``, ``past_tense`` and ``present_participle``
+give the one form a generated English sentence needs.
+
+The rules are deliberately generous: a spurious key ("permited") costs
+a dict entry, a missing one a failed match.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+_WORD = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+_LEADING = ("to", "the", "a", "an")
+_VOWELS = set("aeiou")
+
+IRREGULAR_PLURALS = {
+    "man": ("men",), "woman": ("women",), "child": ("children",),
+    "person": ("people",), "foot": ("feet",), "tooth": ("teeth",),
+    "mouse": ("mice",), "ox": ("oxen",), "life": ("lives",),
+    "wife": ("wives",), "knife": ("knives",), "leaf": ("leaves",),
+}
+
+# Past tense first.
+IRREGULAR_VERBS = {
+    "be": ("was", "were", "am", "is", "are", "been"),
+    "have": ("had", "has"), "do": ("did", "does", "done"),
+    "go": ("went", "goes", "gone"), "come": ("came",),
+    "become": ("became",), "say": ("said",), "speak": ("spoke", "spoken"),
+    "hold": ("held",), "see": ("saw", "seen"), "lead": ("led",),
+    "bear": ("bore", "borne"), "write": ("wrote", "written"),
+    "teach": ("taught",), "send": ("sent",), "hear": ("heard",),
+    "bring": ("brought",), "take": ("took", "taken"),
+    "give": ("gave", "given"), "make": ("made",), "know": ("knew", "known"),
+    "find": ("found",), "think": ("thought",), "tell": ("told",),
+    "stand": ("stood",), "flee": ("fled",), "run": ("ran",),
+    "seek": ("sought",), "fall": ("fell", "fallen"), "throw": ("threw", "thrown"),
+    "eat": ("ate", "eaten"), "drink": ("drank", "drunk"), "fight": ("fought",),
+}
+IRREGULAR_PRESENT = {"be": "is", "have": "has"}
+
+# Endings of longer verbs stressed on the last syllable, which double
+# their final consonant like monosyllables (permit → permitted).
+_STRESSED_ENDINGS = ("mit", "fer", "cur", "pel", "gin", "get", "gret", "trol")
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+
+
+@lru_cache(maxsize=4096)
+def english_key(text: str) -> str:
+    """Canonical key of an English word or phrase.
+
+    ``english_key("To Look  at")`` → ``"look at"``; ``"the horses"`` →
+    ``"horses"`` (which ``gloss_keys("horse")`` includes).
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) > 1 and words[0] in _LEADING:
+        words = words[1:]
+    return " ".join(words)
+
+
+def _s_form(word: str) -> str:
+    """Plural noun / third-person singular verb."""
+    if word.endswith(("s", "x", "z", "ch", "sh", "o")):
+        return word + "es"
+    if word.endswith("y") and len(word) > 1 and word[-2] not in _VOWELS:
+        return word[:-1] + "ies"
+    return word + "s"
+
+
+def _doubled(word: str) -> str | None:
+    """*word* with its final consonant doubled (permit → permitt), if it
+    ends consonant-vowel-consonant."""
+    if (len(word) >= 3 and word[-1] not in _VOWELS | {"w", "x", "y"}
+            and word[-2] in _VOWELS and word[-3] not in _VOWELS):
+        return word + word[-1]
+    return None
+
+
+def _doubles(word: str) -> bool:
+    """Whether *word* doubles its final consonant before -ed and -ing
+    (stop → stopped, permit → permitted, but open → opened)."""
+    return _doubled(word) is not None and (
+        len(_VOWEL_GROUP.findall(word)) == 1 or word.endswith(_STRESSED_ENDINGS))
+
+
+def plural(word: str) -> str:
+    return IRREGULAR_PLURALS[word][0] if word in IRREGULAR_PLURALS else _s_form(word)
+
+
+def third_person(word: str) -> str:
+    return IRREGULAR_PRESENT.get(word) or _s_form(word)
+
+
+def past_tense(word: str) -> str:
+    if word in IRREGULAR_VERBS:
+        return IRREGULAR_VERBS[word][0]
+    if word.endswith("e"):
+        return word + "d"
+    if word.endswith("y") and len(word) > 1 and word[-2] not in _VOWELS:
+        return word[:-1] + "ied"
+    return (word + word[-1] if _doubles(word) else word) + "ed"
+
+
+def present_participle(word: str) -> str:
+    if word.endswith("ie"):
+        return word[:-2] + "ying"
+    if word.endswith("e") and not word.endswith(("ee", "ye", "oe")) and len(word) > 2:
+        return word[:-1] + "ing"
+    return (word + word[-1] if _doubles(word) else word) + "ing"
+
+
+def inflect_head(phrase: str, inflect) -> str:
+    """Apply *inflect* to the first word of *phrase* ("look at" → "looks at")."""
+    head, _, rest = phrase.partition(" ")
+    return f"{inflect(head)} {rest}" if rest else inflect(head)
+
+
+def inflections(word: str) -> set[str]:
+    """Regular and irregular inflected forms of *word*, itself included."""
+    forms = {word, _s_form(word)}
+    forms.update(IRREGULAR_PLURALS.get(word, ()))
+    forms.update(IRREGULAR_VERBS.get(word, ()))
+    if word.endswith("e"):
+        forms.add(word + "d")
+        forms.add((word[:-2] + "y" if word.endswith("ie") else word[:-1]) + "ing")
+        if word.endswith("ee"):
+            forms.add(word + "ing")
+    elif word.endswith("y") and len(word) > 1 and word[-2] not in _VOWELS:
+        forms.update((word[:-1] + "ied", word + "ing"))
+    else:
+        forms.update((word + "ed", word + "ing"))
+        doubled = _doubled(word)
+        if doubled:
+            forms.update((doubled + "ed", doubled + "ing"))
+    return forms
+
+
+def gloss_keys(gloss: str) -> set[str]:
+    """Every key under which *gloss* is found (see the module docstring)."""
+    key = english_key(gloss)
+    words = key.split()
+    if not words:
+        return set()
+    keys = {key}
+    for at in {0, len(words) - 1}:
+        for form in inflections(words[at]):
+            keys.add(" ".join(words[:at] + [form] + words[at + 1:]))
+    return keys
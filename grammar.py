@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import struct
+from array import array
+from dataclasses import dataclass
+from functools import partial
 from itertools import permutations as _permutations
-from typing import Any
+from typing import Callable
 
-from data import lookup_form, WORDS
+from cache import CACHE_DIR, file_digest, read_pickle, write_pickle
+from data import (
+    Reading, form_of, iter_lookup_readings, lookup_diacritic_variants,
+)
+from spelling import suggest_forms
+from transliteration import is_ascii_word, transliteration_candidates
 
 
 # ---------------------------------------------------------------------------
@@ -33,17 +41,217 @@ class ParseNode:
         return f"{self.symbol}[{child_str}]"
 
 
-# Map POS tags to grammar symbols
-POS_TO_SYMBOL = {
-    "article": "Art",
-    "noun": "N",
-    "verb": "V",
-    "adjective": "Adj",
-    "preposition": "Prep",
-    "conjunction": "Conj",
-    "participle": "Part",
-}
+# ---------------------------------------------------------------------------
+# Flat parse tree encoding
+# ---------------------------------------------------------------------------
+
+SYMBOLS = ("S", "NP", "PP", "InfP", "Art", "N", "V", "Adj", "Prep", "Conj", "Part")
+SYMBOL_IDS = {s: i for i, s in enumerate(SYMBOLS)}
+
+_FLAT_MAGIC = b"FT\x01"
+_FLAT_HEADER = struct.Struct("<3sHHHH")
+
+
+@dataclass(eq=False)
+class FlatTree:
+    """A parse tree stored as parallel preorder arrays.
+
+    Node *i* has symbol ``SYMBOLS[symbols[i]]``, covers tokens
+    ``[starts[i], ends[i])``, owns ``sizes[i]`` nodes in its subtree
+    (itself included) and carries ``feature_table[feature_ids[i]]``
+    (string-valued items).  A node with subtree size 1 is a leaf; its
+    token is ``tokens[starts[i]]``.  Identical feature bundles are stored
+    once in ``feature_table``.
+
+    Trees compare and hash by identity, since the arrays are unhashable;
+    compare ``to_bytes()`` for equal content.
+    """
+
+    tokens: tuple[str, ...]
+    symbols: array
+    starts: array
+    ends: array
+    sizes: array
+    feature_ids: array
+    feature_table: tuple[tuple[tuple[str, str], ...], ...]
+
+    def __post_init__(self):
+        # Decoded feature dicts, one per bundle; filled by ``features``.
+        self._feature_dicts: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def features(self, i: int) -> dict:
+        """Return the feature dict of node *i* (decoded once per bundle)."""
+        if not self._feature_dicts:
+            self._feature_dicts.extend(dict(items) for items in self.feature_table)
+        return self._feature_dicts[self.feature_ids[i]]
+
+    def children(self, i: int) -> list[int]:
+        """Return the preorder indices of the children of node *i*."""
+        result = []
+        child = i + 1
+        stop = i + self.sizes[i]
+        while child < stop:
+            result.append(child)
+            child += self.sizes[child]
+        return result
+
+    def root(self) -> FlatNode:
+        return FlatNode(self, 0)
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact byte string (see :meth:`from_bytes`).
+
+        Tokens, feature names and feature values share one string table,
+        so the payload is a handful of integer arrays plus each distinct
+        string once.  Raises ValueError for a feature that is not a pair
+        of strings, or a string containing NUL (the table separator).
+        """
+        for items in self.feature_table:
+            for key, value in items:
+                if not (isinstance(key, str) and isinstance(value, str)):
+                    raise ValueError(
+                        f"feature {key!r}={value!r} is not a pair of strings")
+        strings: dict[str, int] = {}
+        token_ids = array("H", (strings.setdefault(t, len(strings))
+                                for t in self.tokens))
+        bundle_sizes = array("H")
+        bundle_items = array("H")
+        for items in self.feature_table:
+            bundle_sizes.append(len(items))
+            for key, value in items:
+                bundle_items.append(strings.setdefault(key, len(strings)))
+                bundle_items.append(strings.setdefault(value, len(strings)))
+        if any("\0" in s for s in strings):
+            raise ValueError("string with a NUL character in parse tree")
+        return b"".join([
+            _FLAT_HEADER.pack(_FLAT_MAGIC, len(self.symbols), len(self.tokens),
+                              len(self.feature_table), len(bundle_items)),
+            self.symbols.tobytes(), self.starts.tobytes(), self.ends.tobytes(),
+            self.sizes.tobytes(), self.feature_ids.tobytes(),
+            token_ids.tobytes(), bundle_sizes.tobytes(), bundle_items.tobytes(),
+            "\0".join(strings).encode("utf-8"),
+        ])
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> FlatTree:
+        magic, n, n_tokens, n_bundles, n_items = _FLAT_HEADER.unpack_from(blob)
+        if magic != _FLAT_MAGIC:
+            raise ValueError("Not a flat parse tree")
+        offset = _FLAT_HEADER.size
+        arrays = []
+        for typecode, count in (("B", n), ("H", n), ("H", n), ("H", n), ("H", n),
+                                ("H", n_tokens), ("H", n_bundles), ("H", n_items)):
+            arr = array(typecode)
+            size = count * arr.itemsize
+            arr.frombytes(blob[offset:offset + size])
+            arrays.append(arr)
+            offset += size
+        symbols, starts, ends, sizes, feature_ids, token_ids, bundle_sizes, items = arrays
+        strings = blob[offset:].decode("utf-8").split("\0")
+        table = []
+        pos = 0
+        for size in bundle_sizes:
+            table.append(tuple(
+                (strings[items[k]], strings[items[k + 1]])
+                for k in range(pos, pos + 2 * size, 2)
+            ))
+            pos += 2 * size
+        return cls(tuple(strings[t] for t in token_ids),
+                   symbols, starts, ends, sizes, feature_ids, tuple(table))
+
+
+class FlatNode:
+    """Read-only view of one node of a :class:`FlatTree`.
+
+    Exposes the same attributes as :class:`ParseNode`, so renderers and
+    role extraction can walk a flat tree without decoding it.
+    """
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree: FlatTree, index: int):
+        self.tree = tree
+        self.index = index
 
+    @property
+    def symbol(self) -> str:
+        return SYMBOLS[self.tree.symbols[self.index]]
+
+    @property
+    def features(self) -> dict:
+        return self.tree.features(self.index)
+
+    @property
+    def children(self) -> list[FlatNode]:
+        return [FlatNode(self.tree, c) for c in self.tree.children(self.index)]
+
+    @property
+    def token(self) -> str | None:
+        if self.tree.sizes[self.index] == 1:
+            return self.tree.tokens[self.tree.starts[self.index]]
+        return None
+
+    @property
+    def span(self) -> tuple[int, int]:
+        return self.tree.starts[self.index], self.tree.ends[self.index]
+
+    def is_leaf(self) -> bool:
+        return self.tree.sizes[self.index] == 1
+
+    def __repr__(self):
+        if self.is_leaf():
+            return f"{self.symbol}({self.token})"
+        child_str = " ".join(repr(c) for c in self.children)
+        return f"{self.symbol}[{child_str}]"
+
+
+def encode_tree(tree: ParseNode) -> FlatTree:
+    """Encode a parse tree into its flat preorder form."""
+    tokens: list[str] = []
+    symbols = array("B")
+    starts = array("H")
+    ends = array("H")
+    sizes = array("H")
+    feature_ids = array("H")
+    table: dict[tuple, int] = {}
+
+    def visit(node: ParseNode):
+        i = len(symbols)
+        symbols.append(SYMBOL_IDS[node.symbol])
+        starts.append(len(tokens))
+        ends.append(0)
+        sizes.append(0)
+        items = tuple(node.features.items())
+        feature_ids.append(table.setdefault(items, len(table)))
+        if node.is_leaf():
+            tokens.append(node.token)
+        for child in node.children:
+            visit(child)
+        ends[i] = len(tokens)
+        sizes[i] = len(symbols) - i
+
+    visit(tree)
+    return FlatTree(tuple(tokens), symbols, starts, ends, sizes, feature_ids,
+                    tuple(table))
+
+
+def decode_tree(flat: FlatTree) -> ParseNode:
+    """Rebuild :class:`ParseNode` objects from a flat tree."""
+    def build(i: int) -> ParseNode:
+        feats = dict(flat.feature_table[flat.feature_ids[i]])
+        if flat.sizes[i] == 1:
+            return ParseNode(SYMBOLS[flat.symbols[i]], feats,
+                             token=flat.tokens[flat.starts[i]])
+        return ParseNode(SYMBOLS[flat.symbols[i]], feats,
+                         [build(c) for c in flat.children(i)])
+
+    return build(0)
+
+
+# POS_TO_SYMBOL lives in data so the form index can store ready readings.
 TERMINALS = {"Art", "N", "V", "Adj", "Prep", "Conj", "Part"}
 
 
@@ -51,20 +259,13 @@ TERMINALS = {"Art", "N", "V", "Adj", "Prep", "Conj", "Part"}
 # Token analysis
 # ---------------------------------------------------------------------------
 
-def analyze_tokens(tokens: list[str]) -> list[list[tuple[str, dict]]]:
-    """For each token, return all possible (grammar_symbol, features) readings."""
-    result = []
-    for token in tokens:
-        analyses = lookup_form(token)
-        readings = []
-        for lemma, pos, feats in analyses:
-            symbol = POS_TO_SYMBOL.get(pos)
-            if symbol:
-                f = dict(feats)
-                f["lemma"] = lemma
-                readings.append((symbol, f))
-        result.append(readings)
-    return result
+def analyze_tokens(tokens: list[str]) -> list[tuple[Reading, ...]]:
+    """For each token, return all possible (grammar_symbol, features) readings.
+
+    Readings come straight from the reading index and are shared: their
+    feature mappings are read-only.  Repeated tokens are looked up once.
+    """
+    return list(iter_lookup_readings(tokens))
 
 
 # ---------------------------------------------------------------------------
@@ -103,70 +304,47 @@ def _get_feat(sym_feats: list[dict], idx: int, key: str) -> str | None:
 # clause-level constituents (NP-nom, V, NP-acc, PP).
 # ---------------------------------------------------------------------------
 
-def _make_flat_s_constraint(roles: list[str]):
-    """Return a constraint function for a flat S rule.
+def _flat_s_constraint(roles: tuple[str, ...], v_idx: int,
+                       subj_idx: int | None, feats):
+    """Constraint for a flat S rule.
 
     *roles* maps each RHS position to its grammatical role:
     "subj" (NP-nom), "verb" (V), "obj" (NP-acc), "iobj" (NP-dat), "pp" (PP).
+    *v_idx* and *subj_idx* are the positions of the verb and subject.
     """
-    v_idx = roles.index("verb")
-    subj_idx = roles.index("subj") if "subj" in roles else None
+    if _get_feat(feats, v_idx, "mood") == "inf":
+        return None
+    obj_case = _get_feat(feats, v_idx, "object_case") or "acc"
+    for idx, role in enumerate(roles):
+        if role == "subj" and _get_feat(feats, idx, "case") != "nom":
+            return None
+        if role == "obj" and _get_feat(feats, idx, "case") != obj_case:
+            return None
+        if role == "iobj" and _get_feat(feats, idx, "case") != "dat":
+            return None
 
-    def constraint(feats):
-        if _get_feat(feats, v_idx, "mood") == "inf":
+    if subj_idx is not None:
+        if not _agree(feats, [subj_idx, v_idx], ["number"]):
+            return None
+        vp_person = _get_feat(feats, v_idx, "person")
+        if vp_person and vp_person != "3":
             return None
-        obj_case = _get_feat(feats, v_idx, "object_case") or "acc"
-        for idx, role in enumerate(roles):
-            if role == "subj" and _get_feat(feats, idx, "case") != "nom":
-                return None
-            if role == "obj" and _get_feat(feats, idx, "case") != obj_case:
-                return None
-            if role == "iobj" and _get_feat(feats, idx, "case") != "dat":
-                return None
-
-        if subj_idx is not None:
-            if not _agree(feats, [subj_idx, v_idx], ["number"]):
-                return None
-            vp_person = _get_feat(feats, v_idx, "person")
-            if vp_person and vp_person != "3":
-                return None
-
-        result = {}
-        num = _get_feat(feats, v_idx, "number")
-        person = _get_feat(feats, v_idx, "person")
-        if num:
-            result["number"] = num
-        if person:
-            result["person"] = person
-        return result
 
-    return constraint
+    result = {}
+    num = _get_feat(feats, v_idx, "number")
+    person = _get_feat(feats, v_idx, "person")
+    if num:
+        result["number"] = num
+    if person:
+        result["person"] = person
+    return result
 
 
-def _add_sentence_rules(rules: list):
-    """Add flat S → … rules for every word-order permutation."""
-    patterns = [
-        # pro-drop
-        [("V", "verb")],
-        [("V", "verb"), ("NP", "obj")],
-        [("V", "verb"), ("PP", "pp")],
-        [("V", "verb"), ("NP", "obj"), ("PP", "pp")],
-        [("V", "verb"), ("NP", "iobj")],
-        [("V", "verb"), ("NP", "obj"), ("NP", "iobj")],
-        # with overt subject
-        [("NP", "subj"), ("V", "verb")],
-        [("NP", "subj"), ("V", "verb"), ("NP", "obj")],
-        [("NP", "subj"), ("V", "verb"), ("PP", "pp")],
-        [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("PP", "pp")],
-        [("NP", "subj"), ("V", "verb"), ("NP", "iobj")],
-        [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("NP", "iobj")],
-        [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("NP", "iobj"), ("PP", "pp")],
-        # with infinitive phrase
-        [("V", "verb"), ("InfP", "infp")],
-        [("V", "verb"), ("NP", "obj"), ("InfP", "infp")],
-        [("NP", "subj"), ("V", "verb"), ("InfP", "infp")],
-        [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("InfP", "infp")],
-    ]
+def _add_permuted_rules(rules: list, lhs: str, patterns: list, constraint):
+    """Add ``lhs → …`` rules for every word-order permutation of *patterns*.
+
+    *constraint(roles)* returns the constraint for one ordering.
+    """
     for pattern in patterns:
         seen: set[tuple] = set()
         for perm in _permutations(range(len(pattern))):
@@ -176,200 +354,354 @@ def _add_sentence_rules(rules: list):
             if key in seen:
                 continue
             seen.add(key)
-            rules.append(("S", rhs, _make_flat_s_constraint(perm_roles)))
+            rules.append((lhs, rhs, constraint(tuple(perm_roles))))
+
+
+# Clause-level constituents of a flat S, as (symbol, role); each pattern
+# is accepted in every word order.
+SENTENCE_PATTERNS = [
+    # pro-drop
+    [("V", "verb")],
+    [("V", "verb"), ("NP", "obj")],
+    [("V", "verb"), ("PP", "pp")],
+    [("V", "verb"), ("NP", "obj"), ("PP", "pp")],
+    [("V", "verb"), ("NP", "iobj")],
+    [("V", "verb"), ("NP", "obj"), ("NP", "iobj")],
+    # with overt subject
+    [("NP", "subj"), ("V", "verb")],
+    [("NP", "subj"), ("V", "verb"), ("NP", "obj")],
+    [("NP", "subj"), ("V", "verb"), ("PP", "pp")],
+    [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("PP", "pp")],
+    [("NP", "subj"), ("V", "verb"), ("NP", "iobj")],
+    [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("NP", "iobj")],
+    [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("NP", "iobj"), ("PP", "pp")],
+    # with infinitive phrase
+    [("V", "verb"), ("InfP", "infp")],
+    [("V", "verb"), ("NP", "obj"), ("InfP", "infp")],
+    [("NP", "subj"), ("V", "verb"), ("InfP", "infp")],
+    [("NP", "subj"), ("V", "verb"), ("NP", "obj"), ("InfP", "infp")],
+]
+
+# Constituents of an infinitive phrase, likewise in any order.
+INFP_PATTERNS = [
+    [("V", "verb")],
+    [("V", "verb"), ("NP", "obj")],
+    [("V", "verb"), ("PP", "pp")],
+    [("V", "verb"), ("NP", "obj"), ("PP", "pp")],
+]
 
 
-# Rule definitions as (lhs, rhs, constraint_function)
-def _make_rules():
-    rules = []
+def _add_sentence_rules(rules: list):
+    """Add flat S → … rules for every word-order permutation."""
+    _add_permuted_rules(rules, "S", SENTENCE_PATTERNS, lambda roles: partial(
+        _flat_s_constraint, roles, roles.index("verb"),
+        roles.index("subj") if "subj" in roles else None,
+    ))
 
-    # -- NP rules (word order within NP is fixed in Greek) ---------------
 
-    # NP → Art N  (article + noun, must agree)
-    def np_art_n(feats):
-        if not _agree(feats, [0, 1], ["case", "number", "gender"]):
-            return None
-        return {
-            "case": _get_feat(feats, 0, "case") or _get_feat(feats, 1, "case"),
-            "number": _get_feat(feats, 0, "number") or _get_feat(feats, 1, "number"),
-            "gender": _get_feat(feats, 0, "gender") or _get_feat(feats, 1, "gender"),
-        }
-    rules.append(("NP", ["Art", "N"], np_art_n))
+# -- NP rules (word order within NP is fixed in Greek) ---------------------
 
-    # NP → Art Adj N  (article + adjective + noun, all agree)
-    def np_art_adj_n(feats):
-        if not _agree(feats, [0, 1, 2], ["case", "number", "gender"]):
-            return None
-        return {
-            "case": _get_feat(feats, 0, "case") or _get_feat(feats, 2, "case"),
-            "number": _get_feat(feats, 0, "number") or _get_feat(feats, 2, "number"),
-            "gender": _get_feat(feats, 0, "gender") or _get_feat(feats, 2, "gender"),
-        }
-    rules.append(("NP", ["Art", "Adj", "N"], np_art_adj_n))
+def _np_constraint(indices: tuple[int, ...], head: int, feats):
+    """NP agreement: the symbols at *indices* agree in case, number and
+    gender; missing article features fall back to the *head* noun's."""
+    if not _agree(feats, list(indices), ["case", "number", "gender"]):
+        return None
+    return {
+        "case": _get_feat(feats, 0, "case") or _get_feat(feats, head, "case"),
+        "number": _get_feat(feats, 0, "number") or _get_feat(feats, head, "number"),
+        "gender": _get_feat(feats, 0, "gender") or _get_feat(feats, head, "gender"),
+    }
 
-    # NP → Art N Adj  (article + noun + adjective, all agree)
-    def np_art_n_adj(feats):
-        if not _agree(feats, [0, 1, 2], ["case", "number", "gender"]):
-            return None
-        return {
-            "case": _get_feat(feats, 0, "case") or _get_feat(feats, 1, "case"),
-            "number": _get_feat(feats, 0, "number") or _get_feat(feats, 1, "number"),
-            "gender": _get_feat(feats, 0, "gender") or _get_feat(feats, 1, "gender"),
-        }
-    rules.append(("NP", ["Art", "N", "Adj"], np_art_n_adj))
 
-    # NP → Art Part N  (article + participle + noun, all agree)
-    def np_art_part_n(feats):
-        if not _agree(feats, [0, 1, 2], ["case", "number", "gender"]):
-            return None
-        return {
-            "case": _get_feat(feats, 0, "case") or _get_feat(feats, 2, "case"),
-            "number": _get_feat(feats, 0, "number") or _get_feat(feats, 2, "number"),
-            "gender": _get_feat(feats, 0, "gender") or _get_feat(feats, 2, "gender"),
-        }
-    rules.append(("NP", ["Art", "Part", "N"], np_art_part_n))
+# -- PP rule (preposition precedes NP in Greek) ----------------------------
 
-    # NP → Art N Part  (article + noun + participle, all agree)
-    def np_art_n_part(feats):
-        if not _agree(feats, [0, 1, 2], ["case", "number", "gender"]):
+def _pp_constraint(feats):
+    """PP → Prep NP: the preposition governs the NP's case."""
+    gov = _get_feat(feats, 0, "governs")
+    np_case = _get_feat(feats, 1, "case")
+    if gov and np_case and gov != np_case:
+        return None
+    return {}
+
+
+# -- InfP rules (infinitive phrase — free word order) ----------------------
+
+def _infp_constraint(roles: tuple[str, ...], v_idx: int, feats):
+    if _get_feat(feats, v_idx, "mood") != "inf":
+        return None
+    obj_case = _get_feat(feats, v_idx, "object_case") or "acc"
+    for idx, role in enumerate(roles):
+        if role == "obj" and _get_feat(feats, idx, "case") != obj_case:
             return None
-        return {
-            "case": _get_feat(feats, 0, "case") or _get_feat(feats, 1, "case"),
-            "number": _get_feat(feats, 0, "number") or _get_feat(feats, 1, "number"),
-            "gender": _get_feat(feats, 0, "gender") or _get_feat(feats, 1, "gender"),
-        }
-    rules.append(("NP", ["Art", "N", "Part"], np_art_n_part))
+    return {}
 
-    # NP → N  (bare noun)
-    def np_n(feats):
-        return {
-            "case": _get_feat(feats, 0, "case"),
-            "number": _get_feat(feats, 0, "number"),
-            "gender": _get_feat(feats, 0, "gender"),
-        }
-    rules.append(("NP", ["N"], np_n))
 
-    # -- PP rule (preposition precedes NP in Greek) ----------------------
+def _s_conj_s(feats):
+    return {}
+
+
+# Rule definitions as (lhs, rhs, constraint_function).  Constraints are
+# ``functools.partial`` objects over module-level functions, so the whole
+# rule table pickles by reference into the grammar snapshot.
+def _make_rules():
+    rules = []
+
+    # NP → Art N  (article + noun, must agree)
+    rules.append(("NP", ["Art", "N"], partial(_np_constraint, (0, 1), 1)))
+    # NP → Art Adj N  (article + adjective + noun, all agree)
+    rules.append(("NP", ["Art", "Adj", "N"], partial(_np_constraint, (0, 1, 2), 2)))
+    # NP → Art N Adj  (article + noun + adjective, all agree)
+    rules.append(("NP", ["Art", "N", "Adj"], partial(_np_constraint, (0, 1, 2), 1)))
+    # NP → Art Part N  (article + participle + noun, all agree)
+    rules.append(("NP", ["Art", "Part", "N"], partial(_np_constraint, (0, 1, 2), 2)))
+    # NP → Art N Part  (article + noun + participle, all agree)
+    rules.append(("NP", ["Art", "N", "Part"], partial(_np_constraint, (0, 1, 2), 1)))
+    # NP → N  (bare noun)
+    rules.append(("NP", ["N"], partial(_np_constraint, (0,), 0)))
 
     # PP → Prep NP  (preposition governs NP case)
-    def pp_prep_np(feats):
-        gov = _get_feat(feats, 0, "governs")
-        np_case = _get_feat(feats, 1, "case")
-        if gov and np_case and gov != np_case:
-            return None
-        return {}
-    rules.append(("PP", ["Prep", "NP"], pp_prep_np))
-
-    # -- InfP rules (infinitive phrase — free word order) ----------------
-
-    def _make_infp_constraint(roles):
-        v_idx = roles.index("verb")
-        def constraint(feats):
-            if _get_feat(feats, v_idx, "mood") != "inf":
-                return None
-            obj_case = _get_feat(feats, v_idx, "object_case") or "acc"
-            for idx, role in enumerate(roles):
-                if role == "obj" and _get_feat(feats, idx, "case") != obj_case:
-                    return None
-            return {}
-        return constraint
-
-    infp_patterns = [
-        [("V", "verb")],
-        [("V", "verb"), ("NP", "obj")],
-        [("V", "verb"), ("PP", "pp")],
-        [("V", "verb"), ("NP", "obj"), ("PP", "pp")],
-    ]
-    for pattern in infp_patterns:
-        seen: set[tuple] = set()
-        for perm in _permutations(range(len(pattern))):
-            rhs = [pattern[i][0] for i in perm]
-            perm_roles = [pattern[i][1] for i in perm]
-            key = (tuple(rhs), tuple(perm_roles))
-            if key in seen:
-                continue
-            seen.add(key)
-            rules.append(("InfP", rhs, _make_infp_constraint(perm_roles)))
+    rules.append(("PP", ["Prep", "NP"], _pp_constraint))
+
+    _add_permuted_rules(rules, "InfP", INFP_PATTERNS, lambda roles: partial(
+        _infp_constraint, roles, roles.index("verb")))
 
     # -- Flat sentence rules (all word-order permutations) ---------------
 
     _add_sentence_rules(rules)
 
     # S → S Conj S
-    def s_conj_s(feats):
-        return {}
-    rules.append(("S", ["S", "Conj", "S"], s_conj_s))
+    rules.append(("S", ["S", "Conj", "S"], _s_conj_s))
 
     return rules
 
 
-RULES = _make_rules()
+# ---------------------------------------------------------------------------
+# Grammar snapshot — the expanded rule table, symbol ids and rule indexes
+# are compiled once and pickled to disk, keyed by the hash of this file.
+# The snapshot is read on the first parse, not at import: its constraints
+# unpickle as references into this module, which must be fully loaded
+# (and loaded as ``grammar``) by then.
+# ---------------------------------------------------------------------------
+
+GRAMMAR_SNAPSHOT_VERSION = 1
+GRAMMAR_SNAPSHOT = CACHE_DIR / "grammar.snapshot"
+
+
+def compile_grammar() -> dict:
+    """Expand the rules and build the lookup indexes stored in a snapshot."""
+    rules = _make_rules()
+    by_lhs: dict[str, list[int]] = {}
+    by_first: dict[str, list[int]] = {}
+    for i, (lhs, rhs, _) in enumerate(rules):
+        by_lhs.setdefault(lhs, []).append(i)
+        by_first.setdefault(rhs[0], []).append(i)
+    return {
+        "version": GRAMMAR_SNAPSHOT_VERSION,
+        "source": file_digest(__file__),
+        "symbols": SYMBOL_IDS,
+        "rules": rules,
+        "by_lhs": {k: tuple(v) for k, v in by_lhs.items()},
+        "by_first": {k: tuple(v) for k, v in by_first.items()},
+    }
+
+
+def load_grammar() -> dict:
+    """Load the grammar snapshot, recompiling it if missing or stale.
+
+    Under any module name but ``grammar`` (e.g. run as a script) the
+    snapshot would resolve its constraints in a second copy of this
+    module, so the grammar is compiled in memory instead.
+    """
+    if __name__ != "grammar":
+        return compile_grammar()
+    digest = file_digest(__file__)
+    snapshot = read_pickle(GRAMMAR_SNAPSHOT)
+    if (snapshot is None
+            or snapshot.get("version") != GRAMMAR_SNAPSHOT_VERSION
+            or snapshot.get("source") != digest
+            or snapshot.get("symbols") != SYMBOL_IDS):
+        snapshot = compile_grammar()
+        write_pickle(GRAMMAR_SNAPSHOT, snapshot)
+    return snapshot
+
+
+_GRAMMAR: dict | None = None
+
+
+def get_grammar() -> dict:
+    """Return the compiled grammar, loading it on first use."""
+    global _GRAMMAR
+    if _GRAMMAR is None:
+        _GRAMMAR = load_grammar()
+    return _GRAMMAR
+
+
+def _unknown_word_message(token: str) -> str:
+    """Error text for an unrecognized token, with spelling suggestions.
+
+    Tokens whose letters match a known form are reported as diacritic
+    errors rather than unknown words; a transliterated token that
+    ``to_greek`` left unresolved lists the forms it could be.
+    """
+    if is_ascii_word(token):
+        candidates = transliteration_candidates(token)
+        if candidates:
+            return (f"'{token}' could be {' or '.join(candidates)}: "
+                    f"type it in Greek or Beta Code")
+    variants = lookup_diacritic_variants(token)
+    if variants:
+        return (f"Check the diacritics on '{token}' "
+                f"(did you mean {', '.join(variants)}?)")
+    message = f"Unknown word: '{token}'"
+    suggestions = suggest_forms(token)
+    if suggestions:
+        message += f" (did you mean {', '.join(suggestions)}?)"
+    return message
+
+
+def _agreeing_article_hint(article: dict, head: dict) -> str:
+    """Suggest the article form agreeing with *head*'s case/number/gender."""
+    form = form_of(article.get("lemma", "ὁ"), case=head.get("case"),
+                   number=head.get("number"), gender=head.get("gender"))
+    return f" (use '{form}')" if form else ""
 
 
 class ChartParser:
     """CYK-style chart parser extended for arbitrary rule lengths."""
 
     def __init__(self):
-        self.rules = RULES
-
-    def parse(self, tokens: list[str]) -> tuple[bool, ParseNode | None, list[str]]:
+        grammar = get_grammar()
+        self.rules = grammar["rules"]
+        self.rules_by_first = grammar["by_first"]
+
+    def parse(self, tokens: list[str],
+              cancelled: Callable[[], bool] | None = None,
+              token_readings: list[tuple[Reading, ...]] | None = None,
+              ) -> tuple[bool, ParseNode | None, list[str]]:
+        """Parse *tokens*; *cancelled* is polled between chart spans and,
+        when it returns True, the parse is abandoned early.
+
+        *token_readings* may pass in an existing ``analyze_tokens`` result
+        so callers that already displayed the tokens don't look them up again.
+        """
         n = len(tokens)
         if n == 0:
             return False, None, ["Empty input"]
 
-        token_readings = analyze_tokens(tokens)
+        if token_readings is None:
+            token_readings = analyze_tokens(tokens)
 
         # Check for unrecognized tokens
         for i, readings in enumerate(token_readings):
             if not readings:
-                return False, None, [f"Unknown word: '{tokens[i]}'"]
+                return False, None, [_unknown_word_message(tokens[i])]
+
+        chart = self._fill_chart(tokens, token_readings, cancelled)
+        if chart is None:
+            return False, None, ["Analysis cancelled"]
+
+        # Look for S spanning the whole input
+        for symbol, feats, node in chart[0][n]:
+            if symbol == "S":
+                return True, node, []
+
+        # No complete parse - diagnose errors
+        errors = self._diagnose(chart, tokens, token_readings, n)
+        return False, None, errors
+
+    def recognize(self, tokens: list[str],
+                  token_readings: list[tuple[Reading, ...]] | None = None,
+                  ) -> tuple[bool, dict[str, int]]:
+        """Decide whether *tokens* form a complete sentence, without trees.
 
-        # Chart: chart[i][j] = list of (symbol, features, ParseNode)
-        # for spans from token i to token j (exclusive)
-        chart: list[list[list[tuple[str, dict, ParseNode]]]] = [
+        Builds no ``ParseNode`` objects and stops as soon as an S covering
+        the whole input enters the chart.  Returns ``(recognized, counters)``
+        with counters "passes", "spans", "constraint_calls" and "items".
+        """
+        stats = {"passes": 0, "spans": 0, "constraint_calls": 0, "items": 0}
+        n = len(tokens)
+        if n == 0:
+            return False, stats
+        if token_readings is None:
+            token_readings = analyze_tokens(tokens)
+        if not all(token_readings):
+            return False, stats
+        chart = self._fill_chart(tokens, token_readings, stats=stats,
+                                 build_nodes=False, stop_at_goal=True)
+        return any(s == "S" for s, _, _ in chart[0][n]), stats
+
+    def _fill_chart(self, tokens, token_readings, cancelled=None, stats=None,
+                    build_nodes: bool = True, stop_at_goal: bool = False):
+        """Run the chart to a fixed point and return it.
+
+        chart[i][j] holds (symbol, features, ParseNode) entries for the span
+        from token i to token j (exclusive); the node is None when
+        *build_nodes* is false.  With *stop_at_goal* the fill ends as soon
+        as an S over the whole input is added.  Returns None if
+        *cancelled* fires.
+        """
+        n = len(tokens)
+        if stats is None:
+            stats = {"passes": 0, "spans": 0, "constraint_calls": 0, "items": 0}
+        chart: list[list[list[tuple[str, dict, ParseNode | None]]]] = [
             [[] for _ in range(n + 1)] for _ in range(n + 1)
         ]
+        # (symbol, sorted features) keys already in each cell
+        seen: list[list[set]] = [[set() for _ in range(n + 1)] for _ in range(n + 1)]
 
         # Fill in terminals (length-1 spans)
         for i in range(n):
             for symbol, feats in token_readings[i]:
-                node = ParseNode(symbol, feats, token=tokens[i])
+                node = ParseNode(symbol, feats, token=tokens[i]) if build_nodes else None
                 chart[i][i + 1].append((symbol, feats, node))
+                stats["items"] += 1
 
         # Fill in longer spans
         changed = True
         while changed:
             changed = False
+            stats["passes"] += 1
             for length in range(1, n + 1):
                 for start in range(n - length + 1):
+                    if cancelled is not None and cancelled():
+                        return None
+                    stats["spans"] += 1
                     end = start + length
-                    for lhs, rhs, constraint_fn in self.rules:
+                    # Only rules whose first RHS symbol occurs at `start`
+                    # can match; keep grammar order for stable results.
+                    present = {s for mid in range(start + 1, end + 1)
+                               for s, _, _ in chart[start][mid]}
+                    rule_ids = sorted(i for sym in present
+                                      for i in self.rules_by_first.get(sym, ()))
+                    cell = chart[start][end]
+                    cell_keys = seen[start][end]
+                    for rule_id in rule_ids:
+                        lhs, rhs, constraint_fn = self.rules[rule_id]
                         # Try all ways to split [start, end) according to rhs
                         for split_result in self._splits(chart, rhs, start, end):
                             # split_result: list of (symbol, features, node) for each rhs symbol
                             feat_list = [item[1] for item in split_result]
+                            stats["constraint_calls"] += 1
                             lhs_feats = constraint_fn(feat_list)
-                            if lhs_feats is not None:
+                            if lhs_feats is None:
+                                continue
+                            # Clean up None values in features
+                            clean_feats = {k: v for k, v in lhs_feats.items() if v is not None}
+                            # Check if we already have this
+                            key = (lhs, tuple(sorted(clean_feats.items())))
+                            if key in cell_keys:
+                                continue
+                            cell_keys.add(key)
+                            new_node = None
+                            if build_nodes:
                                 children = [item[2] for item in split_result]
-                                # Clean up None values in features
-                                clean_feats = {k: v for k, v in lhs_feats.items() if v is not None}
                                 new_node = ParseNode(lhs, clean_feats, children)
-                                # Check if we already have this
-                                key = (lhs, tuple(sorted(clean_feats.items())))
-                                existing = [(s, tuple(sorted(f.items())))
-                                            for s, f, _ in chart[start][end]]
-                                if key not in existing:
-                                    chart[start][end].append((lhs, clean_feats, new_node))
-                                    changed = True
-
-        # Look for S spanning the whole input
-        for symbol, feats, node in chart[0][n]:
-            if symbol == "S":
-                return True, node, []
-
-        # No complete parse - diagnose errors
-        errors = self._diagnose(chart, tokens, token_readings, n)
-        return False, None, errors
+                            cell.append((lhs, clean_feats, new_node))
+                            stats["items"] += 1
+                            changed = True
+                            if stop_at_goal and lhs == "S" and start == 0 and end == n:
+                                return chart
+        return chart
 
     def _splits(self, chart, rhs: list[str], start: int, end: int):
         """Generate all ways to split [start, end) into len(rhs) contiguous spans,
@@ -485,6 +817,7 @@ class ChartParser:
                                 errors.append(
                                     f"Agreement error between '{tokens[i]}' and "
                                     f"'{tokens[i + 1]}': {'; '.join(mismatches)}"
+                                    f"{_agreeing_article_hint(af, nf)}"
                                 )
                                 return
 
@@ -514,6 +847,7 @@ class ChartParser:
                                 errors.append(
                                     f"Agreement error between '{tokens[i]}' and "
                                     f"'{tokens[i + 1]}': {'; '.join(mismatches)}"
+                                    f"{_agreeing_article_hint(af, jf)}"
                                 )
                                 return
 
@@ -546,7 +880,15 @@ class ChartParser:
                 )
 
 
-def check_sentence(tokens: list[str]) -> tuple[bool, ParseNode | None, list[str]]:
+def recognize_sentence(tokens: list[str]) -> tuple[bool, dict[str, int]]:
+    """Return whether *tokens* parse as a sentence, plus parser counters."""
+    return ChartParser().recognize(tokens)
+
+
+def check_sentence(tokens: list[str],
+                   cancelled: Callable[[], bool] | None = None,
+                   token_readings: list[tuple[Reading, ...]] | None = None,
+                   ) -> tuple[bool, ParseNode | None, list[str]]:
     """Parse a token list and return (success, tree, errors)."""
     parser = ChartParser()
-    return parser.parse(tokens)
+    return parser.parse(tokens, cancelled, token_readings)
@@ -0,0 +1,408 @@
+"""Bulk lexicon importer: stream large lexicon files into a compiled lexicon.
+
+Usage::
+
+    python importer.py lexicon.jsonl -o big.lexicon [--workers N]
+    python main.py --lexicon big.lexicon
+
+Input formats:
+
+  JSONL  one entry per line::
+
+             {"lemma": "λύω", "pos": "verb", "gloss": "loosen, release",
+              "forms": {"pres_act_ind_1sg": "λύω", ...}}
+
+         ``forms`` may also be a list of ``[form, tag]`` pairs.  Other
+         fields (gender, declension, governs, object_case, deponent, …)
+         are kept as they are.
+  TSV    one form per line, the rows of a lemma consecutive::
+
+             lemma <TAB> pos <TAB> gloss <TAB> form <TAB> tag
+
+         Blank lines and lines starting with ``#`` are ignored.
+
+Tags are either the cell keys used in ``words.py`` (``pres_act_ind_3sg``,
+``gen_pl``, ``nom_sg_fem``) or 9-character Perseus/AGDT postags
+(``v3spia---``, ``n-s---mg-``); both are mapped onto the feature schema
+of ``data._parse_verb_key`` and friends.  Forms the schema cannot express
+(duals, unknown codes) are rejected and reported.
+
+The file is read once, in chunks; validation runs in a process pool with
+a bounded number of chunks in flight, and entries are written through
+``lexicon.LexiconWriter``, which spools to disk.  Memory therefore grows
+with the number of lemmas (their names and offsets), not with the size
+of the input.
+
+The output carries the digest of its source file, not of ``words.py``;
+``lexicon.load_lexicon`` opens it as it is, and ``main.py --lexicon``
+swaps it in for the ``words.py`` build at start-up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from cache import file_digest
+from data import (
+    GENDER_NORMALIZE, POS_TO_SYMBOL, _parse_article_or_adj_key,
+    _parse_noun_key, _parse_verb_key,
+)
+from lexicon import LexiconWriter, check_entry
+
+CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 50
+
+LEXICAL_POS = {pos for pos in POS_TO_SYMBOL if pos != "participle"}
+TENSES = {"pres", "impf", "fut", "aor", "perf", "plupf", "futperf"}
+VOICES = {"act", "mid", "pass"}
+MOODS = {"ind", "subj", "opt", "imp"}
+CASES = {"nom", "gen", "dat", "acc", "voc"}
+NUMBERS = {"sg", "pl"}
+GENDERS = {"masc", "fem", "neut"}
+
+# Perseus/AGDT postag positions: pos, person, number, tense, mood, voice,
+# gender, case, degree.
+POSTAG_POS = {
+    "n": "noun", "v": "verb", "t": "verb", "a": "adjective",
+    "l": "article", "r": "preposition", "c": "conjunction",
+}
+POSTAG_NUMBER = {"s": "sg", "p": "pl"}
+POSTAG_TENSE = {"p": "pres", "i": "impf", "f": "fut", "a": "aor",
+                "r": "perf", "l": "plupf", "t": "futperf"}
+POSTAG_MOOD = {"i": "ind", "s": "subj", "o": "opt", "m": "imp",
+               "n": "inf", "p": "ptcp"}
+POSTAG_VOICE = {"a": "act", "m": "mid", "e": "mid", "p": "pass"}
+POSTAG_GENDER = {"m": "masc", "f": "fem", "n": "neut"}
+POSTAG_CASE = {"n": "nom", "g": "gen", "d": "dat", "a": "acc", "v": "voc"}
+
+_POSTAG = re.compile(r"[a-z1-3-]{9}")
+
+
+# ---------------------------------------------------------------------------
+# Tag mapping and validation (runs in worker processes)
+# ---------------------------------------------------------------------------
+
+def postag_to_key(tag: str, pos: str) -> str:
+    """Map a Perseus/AGDT postag onto a ``words.py`` cell key.
+
+    Raises ValueError when the tag has no place in the schema.
+    """
+    _, person, number, tense, mood, voice, gender, case, _ = tag
+
+    def pick(table: dict, code: str, what: str) -> str:
+        if code not in table:
+            raise ValueError(f"unsupported {what} {code!r} in tag {tag!r}")
+        return table[code]
+
+    if pos in ("preposition", "conjunction"):
+        return "base"
+    if pos == "noun":
+        return f"{pick(POSTAG_CASE, case, 'case')}_{pick(POSTAG_NUMBER, number, 'number')}"
+    if pos in ("article", "adjective"):
+        return (f"{pick(POSTAG_CASE, case, 'case')}_"
+                f"{pick(POSTAG_NUMBER, number, 'number')}_"
+                f"{pick(POSTAG_GENDER, gender, 'gender')}")
+    tense = pick(POSTAG_TENSE, tense, "tense")
+    voice = pick(POSTAG_VOICE, voice, "voice")
+    mood = pick(POSTAG_MOOD, mood, "mood")
+    if mood == "inf":
+        return f"{tense}_{voice}_inf"
+    if mood == "ptcp":
+        return (f"{tense}_{voice}_ptcp_{pick(POSTAG_CASE, case, 'case')}_"
+                f"{pick(POSTAG_NUMBER, number, 'number')}_"
+                f"{pick(POSTAG_GENDER, gender, 'gender')}")
+    if person not in "123":
+        raise ValueError(f"unsupported person {person!r} in tag {tag!r}")
+    return f"{tense}_{voice}_{mood}_{person}{pick(POSTAG_NUMBER, number, 'number')}"
+
+
+def _check_key(key: str, entry: dict) -> None:
+    """Raise ValueError unless *key* parses into valid schema features."""
+    pos = entry["pos"]
+    if pos in ("preposition", "conjunction"):
+        if key != "base":
+            raise ValueError(f"uninflected word with cell {key!r}")
+        return
+    if pos == "noun":
+        features = _parse_noun_key(key, entry)
+    elif pos in ("article", "adjective"):
+        features = _parse_article_or_adj_key(key)
+    else:
+        features = _parse_verb_key(key)
+    if not features:
+        raise ValueError(f"cell {key!r} does not fit the {pos} schema")
+    allowed = {"tense": TENSES, "voice": VOICES, "case": CASES,
+               "number": NUMBERS, "gender": GENDERS,
+               "person": {"1", "2", "3"},
+               "mood": MOODS | {"inf", "ptcp"}}
+    for name, value in features.items():
+        if name in allowed and value not in allowed[name]:
+            raise ValueError(f"cell {key!r}: unknown {name} {value!r}")
+
+
+def _translations(gloss: str) -> list[str]:
+    words = [w.strip() for w in re.split(r"[,;]", gloss)]
+    return [re.sub(r"^I\s+", "", w) for w in words if w]
+
+
+def validate_record(record: dict) -> tuple[tuple[str, dict] | None, list[str], int]:
+    """Normalize and validate one raw record.
+
+    Returns ``((lemma, entry) or None, errors, rejected form count)``.
+    Bad forms are dropped with an error; an entry is rejected only when
+    its required fields are missing, no forms survive, or a field holds
+    a value the lexicon cannot store (``lexicon.check_entry``).
+    """
+    lemma = unicodedata.normalize("NFC", str(record.get("lemma", "")).strip())
+    where = lemma or "?"
+    pos = record.get("pos", "")
+    pos = POSTAG_POS.get(pos, pos) if len(pos) == 1 else pos
+    gloss = str(record.get("gloss") or record.get("meaning") or "").strip()
+    if record.get("_error"):
+        return None, [f"{where}: {record['_error']}"], 0
+    if not lemma:
+        return None, [f"{where}: missing lemma"], 0
+    if pos not in LEXICAL_POS:
+        return None, [f"{where}: unknown part of speech {pos!r}"], 0
+    if not gloss:
+        return None, [f"{where}: missing gloss"], 0
+
+    entry = {k: v for k, v in record.items()
+             if k not in ("gloss", "forms") and v is not None}
+    entry.update(lemma=lemma, pos=pos, meaning=gloss)
+    entry.setdefault("translations", _translations(gloss))
+
+    raw_forms = record.get("forms") or {}
+    pairs = (raw_forms.items() if isinstance(raw_forms, dict)
+             else ((tag, form) for form, tag in raw_forms))
+    errors: list[str] = []
+    forms: dict[str, str] = {}
+    rejected = 0
+    for tag, form in pairs:
+        try:
+            form = unicodedata.normalize("NFC", str(form).strip())
+            if not form or any(c.isspace() for c in form):
+                raise ValueError(f"bad form {form!r}")
+            if _POSTAG.fullmatch(tag):
+                if pos == "noun" and "gender" not in entry and tag[6] in POSTAG_GENDER:
+                    entry["gender"] = {"m": "masculine", "f": "feminine",
+                                       "n": "neuter"}[tag[6]]
+                key = postag_to_key(tag, pos)
+            else:
+                key = tag
+            if pos == "noun" and entry.get("gender") not in GENDER_NORMALIZE:
+                raise ValueError("noun without a valid gender")
+            _check_key(key, entry)
+        except ValueError as e:
+            rejected += 1
+            errors.append(f"{where}: {e}")
+            continue
+        forms.setdefault(key, form)
+    if pos in ("preposition", "conjunction") and not forms:
+        forms["base"] = lemma
+    if not forms:
+        return None, errors + [f"{where}: no valid forms"], rejected
+    entry["forms"] = forms
+    try:
+        check_entry(where, entry)
+    except ValueError as e:
+        return None, errors + [str(e)], rejected
+    return (lemma, entry), errors, rejected
+
+
+def validate_chunk(chunk: list) -> list[tuple[tuple[str, dict] | None, list[str], int]]:
+    """Validate a chunk of raw records (JSONL lines or TSV record dicts)."""
+    results = []
+    for raw in chunk:
+        if isinstance(raw, str):
+            try:
+                raw = json.loads(raw)
+            except json.JSONDecodeError as e:
+                results.append((None, [f"bad JSON: {e}"], 0))
+                continue
+            if not isinstance(raw, dict):
+                results.append((None, ["JSON line is not an object"], 0))
+                continue
+        results.append(validate_record(raw))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Streaming readers
+# ---------------------------------------------------------------------------
+
+def read_jsonl(path: Path) -> Iterator[str]:
+    """Yield the non-blank lines of a JSONL file (parsed in the workers)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def read_tsv(path: Path) -> Iterator[dict]:
+    """Group consecutive TSV rows of the same lemma into raw records."""
+    current: dict | None = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) != 5:
+                yield {"lemma": cols[0], "pos": "", "gloss": "",
+                       "forms": [], "_error": f"expected 5 columns, got {len(cols)}"}
+                continue
+            lemma, pos, gloss, form, tag = cols
+            if current is None or current["lemma"] != lemma:
+                if current is not None:
+                    yield current
+                current = {"lemma": lemma, "pos": pos, "gloss": gloss,
+                           "forms": []}
+            current["forms"].append((form, tag))
+    if current is not None:
+        yield current
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _bounded_map(executor: Executor | None, fn, chunks: Iterable[list],
+                 window: int) -> Iterator:
+    """Like ``executor.map`` but with at most *window* chunks in flight."""
+    if executor is None:
+        for chunk in chunks:
+            yield fn(chunk)
+        return
+    pending: deque = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(fn, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# ---------------------------------------------------------------------------
+# Import driver
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ImportReport:
+    entries: int = 0
+    forms: int = 0
+    rejected_entries: int = 0
+    rejected_forms: int = 0
+    errors: list[str] = field(default_factory=list)
+    error_count: int = 0
+    seconds: float = 0.0
+
+    def note(self, errors: list[str]) -> None:
+        self.error_count += len(errors)
+        room = MAX_REPORTED_ERRORS - len(self.errors)
+        if room > 0:
+            self.errors.extend(errors[:room])
+
+
+def import_lexicon(source: Path, out: Path, workers: int | None = None,
+                   chunk_size: int = CHUNK_SIZE) -> ImportReport:
+    """Stream *source* (``.jsonl`` or ``.tsv``) into a compiled lexicon.
+
+    *workers* is the validation pool size (default: CPU count; 0 runs
+    everything in this process).  The output is written to a temp file
+    next to *out* and renamed into place only if the import finishes.
+    """
+    start = time.perf_counter()
+    source, out = Path(source), Path(out)
+    if source.suffix == ".tsv":
+        records: Iterable = read_tsv(source)
+    else:
+        records = read_jsonl(source)
+    writer = LexiconWriter(file_digest(source), max_interned=1 << 18)
+    report = ImportReport()
+    seen: set[str] = set()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(workers) if workers > 0 else None
+    try:
+        results = _bounded_map(executor, validate_chunk,
+                               _chunks(records, chunk_size),
+                               window=2 * max(workers, 1))
+        for chunk_results in results:
+            for item, errors, rejected in chunk_results:
+                report.rejected_forms += rejected
+                report.note(errors)
+                if item is None:
+                    report.rejected_entries += 1
+                    continue
+                lemma, entry = item
+                if lemma in seen:
+                    report.rejected_entries += 1
+                    report.note([f"{lemma}: duplicate lemma"])
+                    continue
+                seen.add(lemma)
+                writer.add(lemma, entry)
+                report.entries += 1
+                report.forms += len(entry["forms"])
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=out.parent, prefix=out.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer.write_to(f)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, out)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="input .jsonl or .tsv file")
+    parser.add_argument("-o", "--output", type=Path, required=True,
+                        help="compiled lexicon to write")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="validation processes (0 = no pool)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    report = import_lexicon(args.source, args.output, args.workers,
+                            args.chunk_size)
+    for err in report.errors:
+        print(f"  {err}", file=sys.stderr)
+    if report.error_count > len(report.errors):
+        print(f"  … {report.error_count - len(report.errors)} more",
+              file=sys.stderr)
+    print(f"Imported {report.entries} entries ({report.forms} forms) in "
+          f"{report.seconds:.1f}s; rejected {report.rejected_entries} "
+          f"entries and {report.rejected_forms} forms.")
+    return 0 if report.entries else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,603 @@
+"""Compiled binary lexicon, memory-mapped and read through lazy views.
+
+``words.WORDS`` is the editable source.  ``compile_lexicon`` turns it into
+a compact binary file that ``load_lexicon`` memory-maps; every process
+reading the file shares the same pages, and entries are decoded only when
+touched.
+
+File layout (integers are little-endian uint32 unless noted)::
+
+    header     magic "GRLX", format version (u16), reserved (u16),
+               entry count, string count, record word count,
+               SHA-256 hex digest of the source (64 bytes)
+    strings    string count + 1 byte offsets into the blob
+    lemmas     string id of each entry's lemma, in source order
+    entries    word offset of each entry's record, in source order
+    pos        string id of each entry's ``pos`` (0xFFFFFFFF if none)
+    prints     64-bit content fingerprint of each entry (two words,
+               low first), for diffing two compiles
+    by_lemma   entry numbers sorted by lemma, for binary search
+    records    per entry: field count, then per field
+               (key string id, type tag, payload)
+    blob       UTF-8 string data
+
+Payloads by type tag: string → string id; int and bool → value;
+list of strings → count, string ids; forms dict → count, (key, value)
+string id pairs.
+
+Entries with ``principal_parts`` store only those (plus any irregular
+``forms``); the full paradigm is generated by ``paradigms`` on access.
+
+The ``pos`` column lets ``Lexicon.partition`` select the nouns, verbs, …
+without touching any other entry's record; within an entry each field
+(glosses, forms, metadata) is decoded only when read.  The fingerprints
+let ``diff_lexicons`` find added, changed and removed lemmas without
+decoding any record.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import mmap
+import struct
+from array import array
+from collections.abc import ItemsView, Mapping, ValuesView
+from pathlib import Path
+
+from cache import CACHE_DIR, atomic_write, file_digest
+from paradigms import forms_of
+
+LEXICON_VERSION = 3
+LEXICON_FILE = CACHE_DIR / "lexicon.bin"
+SOURCE_FILE = Path(__file__).parent / "words.py"
+
+_MAGIC = b"GRLX"
+_HEADER = struct.Struct("<4sHHIII64s")
+
+T_STR, T_INT, T_BOOL, T_LIST, T_FORMS = range(5)
+_NO_POS = 0xFFFFFFFF
+_GENERATED = -1   # view-only tag: forms generated from principal parts
+
+# Every Lexicon gets a fresh generation; views remember their lexicon's.
+_GENERATIONS = itertools.count(1)
+
+
+class StaleViewError(RuntimeError):
+    """A view was read after its lexicon was swapped (see ``Lexicon.swap``)."""
+
+
+# ---------------------------------------------------------------------------
+# Compiler
+# ---------------------------------------------------------------------------
+
+def entry_fingerprint(entry: Mapping) -> int:
+    """Return a 64-bit hash of an entry's fields, in field order."""
+    h = hashlib.blake2b(digest_size=8)
+    for key, value in entry.items():
+        if isinstance(value, Mapping):
+            value = tuple(value.items())
+        elif isinstance(value, list):
+            value = tuple(value)
+        h.update(repr((key, value)).encode("utf-8"))
+    return int.from_bytes(h.digest(), "little")
+
+
+def check_entry(lemma: str, entry: Mapping) -> None:
+    """Raise ValueError unless every field value of *entry* can be stored:
+    a bool, a non-negative int, a string, a list of strings, or a
+    mapping of strings to strings."""
+    for key, value in entry.items():
+        if not isinstance(key, str):
+            raise ValueError(f"{lemma}: field name {key!r} is not a string")
+        if isinstance(value, (bool, str)):
+            continue
+        if isinstance(value, int):
+            if value < 0:
+                raise ValueError(f"{lemma}: negative int in field {key!r}")
+        elif isinstance(value, (list, tuple)):
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError(f"{lemma}: non-string item in field {key!r}")
+        elif isinstance(value, Mapping):
+            if not all(isinstance(k, str) and isinstance(v, str)
+                       for k, v in value.items()):
+                raise ValueError(f"{lemma}: non-string form in field {key!r}")
+        else:
+            raise ValueError(
+                f"{lemma}: unsupported value type for field {key!r}"
+            )
+
+
+class LexiconWriter:
+    """Compile entries one at a time into the binary lexicon format.
+
+    Records and string data are spooled to temporary files, so memory
+    holds only the lemma table, the per-entry offsets and the interned
+    strings.  At most *max_interned* distinct strings are deduplicated
+    (field keys, POS and cell names come first and stay shared); later
+    strings are stored as they come.  ``None`` interns everything.
+    """
+
+    def __init__(self, source_digest: str, max_interned: int | None = None):
+        import tempfile
+        self.source_digest = source_digest
+        self.max_interned = max_interned
+        self._strings: dict[str, int] = {}
+        self._offsets = array("I", [0])
+        self._blob = tempfile.SpooledTemporaryFile(max_size=1 << 24)
+        self._records = tempfile.SpooledTemporaryFile(max_size=1 << 24)
+        self._n_records = 0
+        self._lemmas = array("I")
+        self._lemma_names: list[str] = []
+        self._entries = array("I")
+        self._pos = array("I")
+        self._prints = array("I")
+
+    def __len__(self) -> int:
+        return len(self._lemmas)
+
+    def _sid(self, s: str) -> int:
+        sid = self._strings.get(s)
+        if sid is None:
+            sid = len(self._offsets) - 1
+            data = s.encode("utf-8")
+            self._blob.write(data)
+            self._offsets.append(self._offsets[-1] + len(data))
+            if self.max_interned is None or len(self._strings) < self.max_interned:
+                self._strings[s] = sid
+        return sid
+
+    def add(self, lemma: str, entry: Mapping) -> None:
+        """Append one entry; raises ValueError for unsupported field values
+        (see ``check_entry``), leaving the writer unchanged."""
+        check_entry(lemma, entry)
+        sid = self._sid
+        self._lemmas.append(sid(lemma))
+        self._lemma_names.append(lemma)
+        self._entries.append(self._n_records)
+        pos = entry.get("pos")
+        self._pos.append(sid(pos) if isinstance(pos, str) else _NO_POS)
+        fingerprint = entry_fingerprint(entry)
+        self._prints.extend((fingerprint & 0xFFFFFFFF, fingerprint >> 32))
+        record = array("I", [len(entry)])
+        for key, value in entry.items():
+            record.append(sid(key))
+            if isinstance(value, bool):
+                record.extend((T_BOOL, int(value)))
+            elif isinstance(value, int):
+                record.extend((T_INT, value))
+            elif isinstance(value, str):
+                record.extend((T_STR, sid(value)))
+            elif isinstance(value, (list, tuple)):
+                record.extend((T_LIST, len(value)))
+                record.extend(sid(v) for v in value)
+            else:
+                record.extend((T_FORMS, len(value)))
+                for form_key, form in value.items():
+                    record.extend((sid(form_key), sid(form)))
+        self._records.write(record.tobytes())
+        self._n_records += len(record)
+
+    def write_to(self, out) -> None:
+        """Write the finished lexicon to binary file object *out*."""
+        names = self._lemma_names
+        by_lemma = array("I", sorted(range(len(names)), key=names.__getitem__))
+        n_strings = len(self._offsets) - 1
+        out.write(_HEADER.pack(_MAGIC, LEXICON_VERSION, 0, len(self._lemmas),
+                               n_strings, self._n_records,
+                               self.source_digest.encode("ascii")))
+        for table in (self._offsets, self._lemmas, self._entries, self._pos,
+                      self._prints, by_lemma):
+            out.write(table.tobytes())
+        for spool in (self._records, self._blob):
+            spool.seek(0)
+            while chunk := spool.read(1 << 20):
+                out.write(chunk)
+
+    def getvalue(self) -> bytes:
+        import io
+        out = io.BytesIO()
+        self.write_to(out)
+        return out.getvalue()
+
+
+def compile_lexicon(words: Mapping[str, Mapping], source_digest: str) -> bytes:
+    """Encode a lemma → entry mapping into the binary lexicon format."""
+    writer = LexiconWriter(source_digest)
+    for lemma, entry in words.items():
+        writer.add(lemma, entry)
+    return writer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Read-only views
+# ---------------------------------------------------------------------------
+
+def _check_generation(lex: Lexicon, generation: int) -> None:
+    """Raise ``StaleViewError`` if *lex* was swapped since *generation*.
+
+    Views call this after decoding, so a value read while a swap was in
+    progress on another thread is never returned.
+    """
+    if lex._generation != generation:
+        raise StaleViewError("lexicon entry read after a reload")
+
+
+class FormsView(Mapping):
+    """Read-only ``forms`` dict of one entry, decoded on first access.
+
+    *forms*, when given, is the content already (a generated paradigm);
+    the view still checks its lexicon's generation on every read.
+    """
+
+    __slots__ = ("_lex", "_pos", "_generation", "_map")
+
+    def __init__(self, lex: Lexicon, pos: int, generation: int,
+                 forms: dict[str, str] | None = None):
+        self._lex = lex
+        self._pos = pos
+        self._generation = generation
+        self._map = forms
+
+    def _decoded(self) -> dict[str, str]:
+        if self._map is None:
+            words, string = self._lex._words, self._lex.string
+            count = words[self._pos]
+            start = self._pos + 1
+            decoded = {
+                string(words[i]): string(words[i + 1])
+                for i in range(start, start + 2 * count, 2)
+            }
+            _check_generation(self._lex, self._generation)
+            self._map = decoded
+        else:
+            _check_generation(self._lex, self._generation)
+        return self._map
+
+    def __getitem__(self, key: str) -> str:
+        return self._decoded()[key]
+
+    def __iter__(self):
+        return iter(self._decoded())
+
+    def __len__(self) -> int:
+        return len(self._decoded())
+
+    def __repr__(self):
+        return f"FormsView({self._decoded()!r})"
+
+
+class EntryView(Mapping):
+    """Read-only view of one lexicon entry.
+
+    Supports the same access patterns as the source dicts
+    (``entry["pos"]``, ``entry.get("forms", {})``, …); values are decoded
+    lazily and cached for the lifetime of the view.  For entries with
+    ``principal_parts``, ``forms`` is the generated paradigm with any
+    stored forms applied as overrides.
+
+    A view belongs to one generation of its lexicon: once the lexicon is
+    swapped (a hot reload), every read raises ``StaleViewError``.
+    """
+
+    __slots__ = ("_lex", "_pos", "_generation", "_fields", "_values")
+
+    def __init__(self, lex: Lexicon, pos: int, generation: int):
+        self._lex = lex
+        self._pos = pos
+        self._generation = generation
+        self._fields: dict[str, tuple[int, int]] | None = None
+        self._values: dict[str, object] = {}
+
+    def _directory(self) -> dict[str, tuple[int, int]]:
+        """Map field name → (type tag, payload word offset)."""
+        if self._fields is None:
+            words, string = self._lex._words, self._lex.string
+            fields = {}
+            i = self._pos + 1
+            for _ in range(words[self._pos]):
+                key, tag = string(words[i]), words[i + 1]
+                fields[key] = (tag, i + 2)
+                if tag == T_LIST:
+                    i += 3 + words[i + 2]
+                elif tag == T_FORMS:
+                    i += 3 + 2 * words[i + 2]
+                else:
+                    i += 3
+            if "principal_parts" in fields:
+                stored = fields.get("forms", (T_FORMS, -1))[1]
+                fields["forms"] = (_GENERATED, stored)
+            _check_generation(self._lex, self._generation)
+            self._fields = fields
+        return self._fields
+
+    def __getitem__(self, key: str):
+        if key in self._values:
+            _check_generation(self._lex, self._generation)
+            return self._values[key]
+        tag, pos = self._directory()[key]
+        words = self._lex._words
+        if tag == T_STR:
+            value = self._lex.string(words[pos])
+        elif tag == T_INT:
+            value = words[pos]
+        elif tag == T_BOOL:
+            value = bool(words[pos])
+        elif tag == T_LIST:
+            value = tuple(self._lex.string(words[i])
+                          for i in range(pos + 1, pos + 1 + words[pos]))
+        elif tag == _GENERATED:
+            overrides = (FormsView(self._lex, pos, self._generation)
+                         if pos >= 0 else {})
+            value = FormsView(self._lex, pos, self._generation,
+                              forms_of(self, overrides))
+        else:
+            value = FormsView(self._lex, pos, self._generation)
+        _check_generation(self._lex, self._generation)
+        self._values[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._directory())
+
+    def __len__(self) -> int:
+        return len(self._directory())
+
+    def __repr__(self):
+        return f"EntryView({dict(self)!r})"
+
+
+class _LexiconItems(ItemsView):
+    def __iter__(self):
+        lex = self._mapping
+        for i in range(len(lex)):
+            yield lex.lemma(i), lex.entry(i)
+
+
+class _LexiconValues(ValuesView):
+    def __iter__(self):
+        lex = self._mapping
+        for i in range(len(lex)):
+            yield lex.entry(i)
+
+
+class Lexicon(Mapping):
+    """Memory-mapped lexicon: lemma → :class:`EntryView`, in source order."""
+
+    def __init__(self, buf):
+        self._mm = buf
+        magic, version, _, n, n_strings, n_records, digest = \
+            _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or version != LEXICON_VERSION:
+            raise ValueError(f"not a version {LEXICON_VERSION} lexicon")
+        self.digest = digest.decode("ascii")
+        n_words = (n_strings + 1) + 6 * n + n_records
+        self._words = memoryview(self._mm)[
+            _HEADER.size:_HEADER.size + 4 * n_words].cast("I")
+        self._n = n
+        self._lemmas = n_strings + 1
+        self._entries = self._lemmas + n
+        self._pos_column = self._entries + n
+        self._prints = self._pos_column + n
+        self._by_lemma = self._prints + 2 * n
+        self._records = self._by_lemma + n
+        self._blob = _HEADER.size + 4 * n_words
+        self._strings: dict[int, str] = {}
+        self._partitions: dict[str, array] | None = None
+        self._generation = next(_GENERATIONS)
+
+    @classmethod
+    def open(cls, path: Path) -> Lexicon:
+        """Memory-map a compiled lexicon file read-only."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def string(self, sid: int) -> str:
+        """Decode string *sid* from the blob (memoized)."""
+        s = self._strings.get(sid)
+        if s is None:
+            start = self._blob + self._words[sid]
+            end = self._blob + self._words[sid + 1]
+            s = self._strings[sid] = str(self._mm[start:end], "utf-8")
+        return s
+
+    def lemma(self, i: int) -> str:
+        return self.string(self._words[self._lemmas + i])
+
+    def entry(self, i: int, generation: int | None = None) -> EntryView:
+        """Return entry *i*; *generation* is the one *i* was looked up in."""
+        if generation is None:
+            generation = self._generation
+        return EntryView(self, self._records + self._words[self._entries + i],
+                         generation)
+
+    def fingerprint(self, i: int) -> int:
+        """Return entry *i*'s content fingerprint (see ``entry_fingerprint``)."""
+        at = self._prints + 2 * i
+        return self._words[at] | self._words[at + 1] << 32
+
+    def swap(self, other: Lexicon) -> None:
+        """Exchange contents with *other*, in place.
+
+        Modules holding a reference to this object (``from data import
+        WORDS``) then see the other lexicon.  Both objects change
+        generation, so entry views taken before the swap raise
+        ``StaleViewError`` when read, even from another thread mid-swap;
+        partitions follow the swap.
+        """
+        self.__dict__, other.__dict__ = other.__dict__, self.__dict__
+
+    def _find(self, lemma: str) -> int:
+        """Binary-search the sorted lemma table; return entry number or -1."""
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = self._words[self._by_lemma + mid]
+            candidate = self.lemma(i)
+            if candidate < lemma:
+                lo = mid + 1
+            elif candidate > lemma:
+                hi = mid
+            else:
+                return i
+        return -1
+
+    def position(self, lemma: str) -> int:
+        """Return *lemma*'s entry number (its place in source order), or -1."""
+        return self._find(lemma)
+
+    def entries_of(self, pos: str) -> array:
+        """Return the entry numbers of part of speech *pos*, in source order.
+
+        The first call groups every entry by one scan of the ``pos``
+        column; no records are decoded.
+        """
+        if self._partitions is None:
+            groups: dict[int, array] = {}
+            column = self._words[self._pos_column:self._pos_column + self._n]
+            for i, sid in enumerate(column):
+                group = groups.get(sid)
+                if group is None:
+                    group = groups[sid] = array("I")
+                group.append(i)
+            self._partitions = {
+                self.string(sid): group for sid, group in groups.items()
+                if sid != _NO_POS
+            }
+        return self._partitions.get(pos, array("I"))
+
+    def partition(self, *pos: str) -> LexiconPartition:
+        """Return the entries whose ``pos`` is one of *pos*, as a mapping."""
+        return LexiconPartition(self, pos)
+
+    def __getitem__(self, lemma: str) -> EntryView:
+        generation = self._generation
+        i = self._find(lemma) if isinstance(lemma, str) else -1
+        if i < 0:
+            raise KeyError(lemma)
+        return self.entry(i, generation)
+
+    def __contains__(self, lemma) -> bool:
+        return isinstance(lemma, str) and self._find(lemma) >= 0
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self.lemma(i)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def items(self):
+        return _LexiconItems(self)
+
+    def values(self):
+        return _LexiconValues(self)
+
+
+def diff_lexicons(old: Lexicon, new: Lexicon,
+                  ) -> tuple[list[str], list[str], list[str]]:
+    """Return the ``(added, changed, removed)`` lemmas from *old* to *new*.
+
+    Entries are compared by fingerprint only; added and changed lemmas
+    are in *new*'s order, removed ones in *old*'s.
+    """
+    before = {old.lemma(i): old.fingerprint(i) for i in range(len(old))}
+    added, changed = [], []
+    for i in range(len(new)):
+        lemma = new.lemma(i)
+        fingerprint = before.pop(lemma, None)
+        if fingerprint is None:
+            added.append(lemma)
+        elif fingerprint != new.fingerprint(i):
+            changed.append(lemma)
+    return added, changed, list(before)
+
+
+class LexiconPartition(Mapping):
+    """The entries of some parts of speech: lemma → :class:`EntryView`.
+
+    Iteration follows source order.  Building a partition reads only the
+    lexicon's ``pos`` column; entries outside it are never decoded.
+    """
+
+    def __init__(self, lex: Lexicon, pos: tuple[str, ...]):
+        self._lex = lex
+        self.pos = pos
+        self._numbers: array | None = None
+        self._generation = 0
+
+    def _entries(self) -> array:
+        if self._numbers is None or self._generation != self._lex._generation:
+            self._generation = self._lex._generation
+            groups = [self._lex.entries_of(p) for p in self.pos]
+            if len(groups) == 1:
+                self._numbers = groups[0]
+            else:
+                self._numbers = array("I", sorted(
+                    i for group in groups for i in group))
+        return self._numbers
+
+    def _find(self, lemma) -> int:
+        i = self._lex._find(lemma) if isinstance(lemma, str) else -1
+        if i >= 0:
+            sid = self._lex._words[self._lex._pos_column + i]
+            if sid == _NO_POS or self._lex.string(sid) not in self.pos:
+                return -1
+        return i
+
+    def __getitem__(self, lemma: str) -> EntryView:
+        generation = self._lex._generation
+        i = self._find(lemma)
+        if i < 0:
+            raise KeyError(lemma)
+        return self._lex.entry(i, generation)
+
+    def __contains__(self, lemma) -> bool:
+        return self._find(lemma) >= 0
+
+    def __iter__(self):
+        lemma = self._lex.lemma
+        for i in self._entries():
+            yield lemma(i)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __repr__(self):
+        return f"LexiconPartition({', '.join(self.pos)}: {len(self)} entries)"
+
+
+# ---------------------------------------------------------------------------
+# Loader
+# ---------------------------------------------------------------------------
+
+def build_lexicon_file(path: Path = LEXICON_FILE) -> None:
+    """Compile ``words.WORDS`` into *path*."""
+    from words import WORDS
+    atomic_write(path, compile_lexicon(WORDS, file_digest(SOURCE_FILE)))
+
+
+def load_lexicon(path: Path = LEXICON_FILE) -> Lexicon:
+    """Map a compiled lexicon.
+
+    The default *path* is the ``words.py`` build, recompiled first if it
+    is stale: missing, from another format version, or compiled from a
+    different ``words.py``.  Any other path (an ``importer`` output, say)
+    is opened as it is; a missing or unreadable file raises.
+    """
+    if Path(path) != LEXICON_FILE:
+        return Lexicon.open(path)
+    digest = file_digest(SOURCE_FILE)
+    try:
+        lex = Lexicon.open(path)
+        if lex.digest == digest:
+            return lex
+    except (OSError, ValueError, struct.error):
+        pass
+    build_lexicon_file(path)
+    try:
+        return Lexicon.open(path)
+    except (OSError, ValueError, struct.error):
+        # Cache directory not writable: read an in-memory copy instead.
+        from words import WORDS
+        return Lexicon(compile_lexicon(WORDS, digest))
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import argparse
 import random
-import unicodedata
+from pathlib import Path
 
-from data import WORDS
+from accentuation import strip_diacritics
+from data import WORDS, reload_lexicon
+from lexicon import load_lexicon
 from vocabulary import (
     load_user_data, save_user_data, add_to_vocabulary,
     get_unlearned_words, get_due_flashcards, review_flashcard,
@@ -116,17 +119,9 @@ def review_flashcards(data: dict) -> None:
     prompt_input("Press Enter to return...")
 
 
-def _greek_sort_key(word: str) -> str:
-    """Return base letters only (no diacritics) for alphabetical sorting."""
-    return "".join(
-        c for c in unicodedata.normalize("NFD", word)
-        if unicodedata.category(c) != "Mn"
-    )
-
-
 def view_vocabulary(data: dict) -> None:
     """Display the user's learned vocabulary, allow selecting a word to view."""
-    vocabulary = sorted(data.get("vocabulary", []), key=_greek_sort_key)
+    vocabulary = sorted(data.get("vocabulary", []), key=strip_diacritics)
 
     while True:
         clear()
@@ -176,8 +171,16 @@ def view_vocabulary(data: dict) -> None:
             return
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Main application loop."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lexicon", type=Path, default=None,
+                        help="compiled lexicon to use instead of words.py "
+                             "(e.g. an importer.py output)")
+    args = parser.parse_args(argv)
+    if args.lexicon is not None:
+        reload_lexicon(load_lexicon(args.lexicon))
+
     data = load_user_data()
 
     while True:
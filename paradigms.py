@@ -0,0 +1,520 @@
+"""Paradigm engine: generate inflected forms from principal parts.
+
+A lexicon entry may give ``principal_parts`` instead of spelling out every
+form.  The cell keys match the hand-written ``forms`` tables
+(``nom_sg``, ``nom_sg_masc``, ``pres_act_ind_3sg``, ``pres_act_ptcp_…``),
+and any explicit ``forms`` on the entry override generated cells, which
+is how irregulars are handled.
+
+Principal parts by part of speech:
+  - noun (1st/2nd declension): nominative and genitive singular
+  - adjective (2-1-2): masculine, feminine and neuter nominative singular
+  - verb (thematic): present, future and aorist 1st singular; deponents
+    give middle forms (ἔρχομαι, ἐλεύσομαι, ἦλθον).  An optional fourth
+    part gives the imperfect when the augment is irregular (εἶχον).  The
+    present active participle is generated only for entries marked
+    ``"participles": True``, so a verb's cells are those its table had.
+
+Accents are computed, not stored: finite verbs take a recessive accent,
+nouns, adjectives and participles a persistent one.  Ambiguous α, ι, υ
+count as short unless written with a macron (U+0304) in a principal part
+or with a circumflex there; macrons never appear in generated forms.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from functools import lru_cache
+from typing import Mapping
+
+ACUTE = "\u0301"
+GRAVE = "\u0300"
+CIRCUMFLEX = "\u0342"
+MACRON = "\u0304"
+BREVE = "\u0306"
+DIAERESIS = "\u0308"
+SMOOTH = "\u0313"
+ROUGH = "\u0314"
+IOTA_SUB = "\u0345"
+
+VOWELS = set("αεηιουω")
+_DIPHTHONGS = {"αι", "ει", "οι", "υι", "αυ", "ευ", "ηυ", "ου"}
+
+
+# ---------------------------------------------------------------------------
+# Syllables and accent placement (NFD strings, accents removed)
+# ---------------------------------------------------------------------------
+
+def _bare(word: str) -> str:
+    """NFD *word* without accents; circumflexed α/ι/υ keep a macron."""
+    out: list[str] = []
+    for ch in unicodedata.normalize("NFD", word):
+        if ch in (ACUTE, GRAVE):
+            continue
+        if ch == CIRCUMFLEX:
+            base = next((c for c in reversed(out) if c in VOWELS), "")
+            if base in "αιυ":
+                out.append(MACRON)
+            continue
+        out.append(ch)
+    return "".join(out)
+
+
+def _nuclei(s: str) -> list[tuple[int, int, bool]]:
+    """Return (start, end, long) for each vowel nucleus of NFD string *s*."""
+    nuclei = []
+    i = 0
+    while i < len(s):
+        if s[i] not in VOWELS:
+            i += 1
+            continue
+        start = i
+        marks_end = i + 1
+        while marks_end < len(s) and unicodedata.combining(s[marks_end]):
+            marks_end += 1
+        marks = s[i + 1:marks_end]
+        # A diphthong: second vowel follows directly (breathing, if any,
+        # sits on it) and carries no diaeresis.
+        nxt = marks_end
+        if (not marks and nxt < len(s) and s[i] + s[nxt] in _DIPHTHONGS):
+            end = nxt + 1
+            while end < len(s) and unicodedata.combining(s[end]):
+                end += 1
+            if DIAERESIS not in s[nxt + 1:end]:
+                nuclei.append((start, end, True))
+                i = end
+                continue
+        long = (s[i] in "ηω" or MACRON in marks or IOTA_SUB in marks)
+        nuclei.append((start, marks_end, long))
+        i = marks_end
+    return nuclei
+
+
+def _ultima_long(s: str, nuclei: list[tuple[int, int, bool]]) -> bool:
+    """Length of the final syllable for accent purposes (final -αι/-οι short)."""
+    start, end, long = nuclei[-1]
+    tail = s[start:]
+    if tail in ("αι", "οι"):
+        return False
+    return long
+
+
+def _place(s: str, nucleus: tuple[int, int, bool], mark: str) -> str:
+    """Insert *mark* on the (last vowel of the) nucleus."""
+    start, end, _ = nucleus
+    # Accent goes after breathing/diaeresis but before iota subscript.
+    pos = end
+    while pos > start and s[pos - 1] in (IOTA_SUB, MACRON, BREVE):
+        pos -= 1
+    return s[:pos] + mark + s[pos:]
+
+
+def _finish(s: str) -> str:
+    return unicodedata.normalize(
+        "NFC", s.replace(MACRON, "").replace(BREVE, ""))
+
+
+def _accent_at(s: str, nuclei, index: int, oxytone_circumflex: bool) -> str:
+    """Accent nucleus *index*, choosing acute or circumflex by the rules."""
+    n = len(nuclei)
+    ult_long = _ultima_long(s, nuclei)
+    mark = ACUTE
+    if index == n - 2 and nuclei[index][2] and not ult_long:
+        mark = CIRCUMFLEX
+    elif index == n - 1 and oxytone_circumflex and nuclei[index][2]:
+        mark = CIRCUMFLEX
+    return _place(s, nuclei[index], mark)
+
+
+def recessive(s: str) -> str:
+    """Accent a bare NFD form as far back as the ultima allows."""
+    nuclei = _nuclei(s)
+    if not nuclei:
+        return _finish(s)
+    n = len(nuclei)
+    if n == 1:
+        index = 0
+    elif _ultima_long(s, nuclei):
+        index = n - 2
+    else:
+        index = max(n - 3, 0)
+    return _finish(_accent_at(s, nuclei, index, False))
+
+
+def persistent(s: str, from_start: int, oxytone_circumflex: bool = False) -> str:
+    """Keep the accent on syllable *from_start* (counted from the word's
+    start) unless the ultima forces it later.
+
+    *oxytone_circumflex* marks genitive/dative cells, where an accented
+    long ultima takes the circumflex.
+    """
+    nuclei = _nuclei(s)
+    if not nuclei:
+        return _finish(s)
+    n = len(nuclei)
+    earliest = max(n - (2 if _ultima_long(s, nuclei) else 3), 0)
+    index = min(max(from_start, earliest), n - 1)
+    return _finish(_accent_at(s, nuclei, index, oxytone_circumflex))
+
+
+def _accent_syllable(word: str) -> tuple[int, int, str]:
+    """Return (syllable from start, syllable count, mark) of *word*'s accent."""
+    d = unicodedata.normalize("NFD", word)
+    spans = _nuclei_with_marks(d)
+    for index, (start, end, _) in enumerate(spans):
+        for mark in (ACUTE, CIRCUMFLEX, GRAVE):
+            if mark in d[start:end]:
+                return index, len(spans), mark
+    return 0, len(spans), ""
+
+
+def _nuclei_with_marks(d: str) -> list[tuple[int, int, bool]]:
+    """Nuclei of an accented NFD string (accents are treated as marks)."""
+    plain = []
+    kept = []
+    for i, ch in enumerate(d):
+        if ch in (ACUTE, GRAVE, CIRCUMFLEX):
+            continue
+        plain.append(ch)
+        kept.append(i)
+    spans = []
+    for start, end, long in _nuclei("".join(plain)):
+        real_end = kept[end - 1] + 1
+        while real_end < len(d) and unicodedata.combining(d[real_end]):
+            real_end += 1
+        spans.append((kept[start], real_end, long))
+    return spans
+
+
+# ---------------------------------------------------------------------------
+# Endings
+# ---------------------------------------------------------------------------
+
+CASES = ("nom", "gen", "dat", "acc")
+_GEN_DAT = {"gen", "dat"}
+
+# Second declension, masculine/feminine and neuter.
+_DECL2 = {
+    "nom_sg": "ος", "gen_sg": "ου", "dat_sg": "ῳ", "acc_sg": "ον",
+    "voc_sg": "ε",
+    "nom_pl": "οι", "gen_pl": "ων", "dat_pl": "οις", "acc_pl": "ους",
+}
+_DECL2_NEUT = {
+    "nom_sg": "ον", "gen_sg": "ου", "dat_sg": "ῳ", "acc_sg": "ον",
+    "voc_sg": "ον",
+    "nom_pl": "α", "gen_pl": "ων", "dat_pl": "οις", "acc_pl": "α",
+}
+
+# First declension: η-type, long ᾱ ("pure"), short α with gen -ᾱς,
+# short α with gen -ης, and masculine -ης.
+_PL1 = {"nom_pl": "αι", "gen_pl": "ων", "dat_pl": "αις", "acc_pl": "ᾱς"}
+_DECL1 = {
+    "eta": {"nom_sg": "η", "gen_sg": "ης", "dat_sg": "ῃ", "acc_sg": "ην",
+            "voc_sg": "η", **_PL1},
+    "alpha_long": {"nom_sg": "ᾱ", "gen_sg": "ᾱς",
+                   "dat_sg": "ᾳ", "acc_sg": "ᾱν",
+                   "voc_sg": "ᾱ", **_PL1},
+    "alpha_short": {"nom_sg": "α", "gen_sg": "ᾱς", "dat_sg": "ᾳ",
+                    "acc_sg": "αν", "voc_sg": "α", **_PL1},
+    "alpha_eta": {"nom_sg": "α", "gen_sg": "ης", "dat_sg": "ῃ",
+                  "acc_sg": "αν", "voc_sg": "α", **_PL1},
+    "masc_es": {"nom_sg": "ης", "gen_sg": "ου", "dat_sg": "ῃ",
+                "acc_sg": "ην", "voc_sg": "α", **_PL1},
+}
+
+_PERSONS = ("1sg", "2sg", "3sg", "1pl", "2pl", "3pl")
+_ENDINGS = {
+    "pres_act": ("ω", "εις", "ει", "ομεν", "ετε", "ουσι"),
+    "past_act": ("ον", "ες", "ε", "ομεν", "ετε", "ον"),
+    "aor1_act": ("α", "ας", "ε", "αμεν", "ατε", "αν"),
+    "pres_mid": ("ομαι", "ῃ", "εται", "ομεθα", "εσθε", "ονται"),
+    "past_mid": ("ομην", "ου", "ετο", "ομεθα", "εσθε", "οντο"),
+    "aor1_mid": ("ᾱμην", "ω", "ατο", "ᾱμεθα", "ασθε", "αντο"),
+    "aor_pass": ("ην", "ης", "η", "ημεν", "ητε", "ησαν"),
+}
+
+_PTCP_MASC = ("ων", "οντος", "οντι", "οντα", "οντες", "οντων", "ουσι(ν)", "οντας")
+_PTCP_FEM = ("ουσα", "ουσης", "ουσῃ", "ουσαν",
+             "ουσαι", "ουσων", "ουσαις", "ουσᾱς")
+_PTCP_NEUT = ("ον", "οντος", "οντι", "ον", "οντα", "οντων", "ουσι(ν)", "οντα")
+
+
+def _nfd(table):
+    """Decompose ending tables so they concatenate with NFD stems."""
+    if isinstance(table, str):
+        return unicodedata.normalize("NFD", table)
+    if isinstance(table, tuple):
+        return tuple(_nfd(t) for t in table)
+    return {k: _nfd(v) for k, v in table.items()}
+
+
+_DECL2, _DECL2_NEUT, _DECL1, _ENDINGS = (
+    _nfd(_DECL2), _nfd(_DECL2_NEUT), _nfd(_DECL1), _nfd(_ENDINGS))
+_PTCP_MASC, _PTCP_FEM, _PTCP_NEUT = (
+    _nfd(_PTCP_MASC), _nfd(_PTCP_FEM), _nfd(_PTCP_NEUT))
+
+
+def _cells():
+    for number in ("sg", "pl"):
+        for case in CASES:
+            yield case, number
+
+
+def _strip_ending(word: str, endings: tuple[str, ...]) -> tuple[str, str]:
+    """Split bare NFD *word* into (stem, ending) for the longest match."""
+    bare = _bare(word)
+    for ending in sorted(endings, key=len, reverse=True):
+        plain = ending.replace(MACRON, "")
+        if bare.replace(MACRON, "").endswith(plain):
+            cut = len(bare)
+            # Walk back over len(plain) non-macron characters.
+            remaining = len(plain)
+            while remaining:
+                cut -= 1
+                if bare[cut] != MACRON:
+                    remaining -= 1
+            return bare[:cut], bare[cut:]
+    raise ValueError(f"Cannot find a known ending on {word!r}")
+
+
+def _with_nu(ending: str) -> tuple[str, str]:
+    """Split a ν-movable marker off an ending: ('ουσι', '(ν)')."""
+    if ending.endswith("(ν)"):
+        return ending[:-3], "(ν)"
+    return ending, ""
+
+
+# ---------------------------------------------------------------------------
+# Nouns and adjectives
+# ---------------------------------------------------------------------------
+
+def _first_decl_type(nom: str, gen: str, gender: str) -> str:
+    nom_b, gen_b = _bare(nom), _bare(gen)
+    if gender in ("masc", "masculine"):
+        return "masc_es"
+    if nom_b.endswith("η"):
+        return "eta"
+    if gen_b.replace(MACRON, "").endswith("ης"):
+        return "alpha_eta"
+    # Pure α: long unless the accent proves the nominative ending short.
+    index, count, mark = _accent_syllable(nom)
+    if MACRON in nom_b[-2:]:
+        return "alpha_long"
+    if index <= count - 3 or (index == count - 2 and mark == CIRCUMFLEX):
+        return "alpha_short"
+    return "alpha_long"
+
+
+def _decline(stem: str, endings: Mapping[str, str], accent_index: int,
+             oxytone: bool, first_declension: bool) -> dict[str, str]:
+    forms = {}
+    for key, ending in endings.items():
+        ending, nu = _with_nu(ending)
+        case = key.split("_")[0]
+        if first_declension and key == "gen_pl":
+            nuclei = _nuclei(stem + ending)
+            form = _finish(_place(stem + ending, nuclei[-1], CIRCUMFLEX))
+        else:
+            form = persistent(stem + ending, accent_index,
+                              oxytone and case in _GEN_DAT)
+        forms[key] = form + nu
+    return forms
+
+
+def _noun_forms(parts: tuple[str, ...], gender: str,
+                declension: int) -> dict[str, str]:
+    nom, gen = parts[0], parts[1]
+    index, count, _ = _accent_syllable(nom)
+    oxytone = index == count - 1
+    if declension == 2:
+        neuter = gender in ("neut", "neuter")
+        endings = _DECL2_NEUT if neuter else _DECL2
+        stem, _ = _strip_ending(nom, ("ος", "ον"))
+        return _decline(stem, endings, index, oxytone, False)
+    if declension == 1:
+        kind = _first_decl_type(nom, gen, gender)
+        endings = _DECL1[kind]
+        stem, _ = _strip_ending(nom, ("ης", "η", "ᾱ", "α"))
+        return _decline(stem, endings, index, oxytone, True)
+    raise ValueError(f"No paradigm for declension {declension!r}")
+
+
+def _adjective_forms(parts: tuple[str, ...]) -> dict[str, str]:
+    masc, fem, neut = parts
+    index, count, _ = _accent_syllable(masc)
+    oxytone = index == count - 1
+    stem, _ = _strip_ending(masc, ("ος",))
+    fem_kind = "eta" if _bare(fem).endswith("η") else "alpha_long"
+
+    by_gender = {
+        "masc": _decline(stem, _DECL2, index, oxytone, False),
+        "fem": _decline(stem, _DECL1[fem_kind], index, oxytone, False),
+        "neut": _decline(stem, _DECL2_NEUT, index, oxytone, False),
+    }
+    forms = {}
+    for gender, cells in by_gender.items():
+        for case, number in _cells():
+            forms[f"{case}_{number}_{gender}"] = cells[f"{case}_{number}"]
+    # Feminine genitive plural follows the masculine accent in 2-1-2 adjectives.
+    forms["gen_pl_fem"] = forms["gen_pl_masc"]
+    return forms
+
+
+# ---------------------------------------------------------------------------
+# Verbs
+# ---------------------------------------------------------------------------
+
+# Temporal augment of an initial vowel (unaccented NFD, breathing kept).
+_TEMPORAL = {
+    "αι": "ῃ", "οι": "ῳ", "αυ": "ηυ", "ευ": "ηυ",
+    "α": "η", "ε": "η", "ο": "ω", "ι": "ῑ", "υ": "ῡ",
+}
+
+
+def _default_augment(stem: str) -> str:
+    """Syllabic augment for consonant stems, temporal for vowel stems."""
+    if stem[0] not in VOWELS:
+        return "ε" + SMOOTH + stem
+    for initial in sorted(_TEMPORAL, key=len, reverse=True):
+        letters = [c for c in stem[:len(initial) + 2] if c in VOWELS]
+        if "".join(letters[:len(initial)]) == initial:
+            # Collect the initial vowels with their marks.
+            end = 0
+            seen = 0
+            while end < len(stem) and seen < len(initial):
+                if stem[end] in VOWELS:
+                    seen += 1
+                end += 1
+            while end < len(stem) and unicodedata.combining(stem[end]):
+                end += 1
+            breathing = ROUGH if ROUGH in stem[:end] else SMOOTH
+            new = _TEMPORAL[initial]
+            base, rest = new[0], new[1:]
+            return base + breathing + rest + stem[end:]
+    return stem
+
+
+def _augment_like(present_stem: str, future_stem: str, aorist_stem: str) -> str:
+    """Augment the present stem the way the aorist augments the future's.
+
+    Compares the future stem with the augmented aorist stem; when they
+    share a tail (ἐπιτρεψ / ἐπετρεψ) the differing heads give the augment
+    (ἐπι → ἐπε), applied to the present stem.  Otherwise the default
+    augment rules apply.
+    """
+    k = 0
+    while (k < min(len(future_stem), len(aorist_stem))
+           and future_stem[-1 - k] == aorist_stem[-1 - k]):
+        k += 1
+    if k:
+        fut_head = future_stem[:len(future_stem) - k]
+        aor_head = aorist_stem[:len(aorist_stem) - k]
+        if present_stem.startswith(fut_head):
+            return aor_head + present_stem[len(fut_head):]
+    return _default_augment(present_stem)
+
+
+def _conjugate(forms: dict, tense: str, voice: str, stem: str,
+               endings: tuple[str, ...]):
+    for pn, ending in zip(_PERSONS, endings):
+        forms[f"{tense}_{voice}_ind_{pn}"] = recessive(stem + ending)
+
+
+def _verb_forms(parts: tuple[str, ...], deponent: bool,
+                participles: bool) -> dict[str, str]:
+    present, future, aorist = parts[:3]
+    imperfect = parts[3] if len(parts) > 3 else None
+    forms: dict[str, str] = {}
+    if deponent:
+        pres_stem, _ = _strip_ending(present, ("ομαι",))
+        fut_stem, _ = _strip_ending(future, ("ομαι",))
+        aor_stem, aor_end = _strip_ending(aorist, ("αμην", "ομην", "ην", "ον"))
+        impf_stem = (_strip_ending(imperfect, ("ομην",))[0] if imperfect
+                     else _augment_like(pres_stem, fut_stem, aor_stem))
+        _conjugate(forms, "pres", "mid", pres_stem, _ENDINGS["pres_mid"])
+        _conjugate(forms, "impf", "mid", impf_stem, _ENDINGS["past_mid"])
+        _conjugate(forms, "fut", "mid", fut_stem, _ENDINGS["pres_mid"])
+        aor_endings = {"αμην": "aor1_mid", "ομην": "past_mid",
+                       "ην": "aor_pass", "ον": "past_act"}[aor_end]
+        _conjugate(forms, "aor", "mid", aor_stem, _ENDINGS[aor_endings])
+        return forms
+
+    pres_stem, _ = _strip_ending(present, ("ω",))
+    fut_stem, _ = _strip_ending(future, ("ω",))
+    aor_stem, aor_end = _strip_ending(aorist, ("α", "ον"))
+    second_aorist = aor_end == "ον"
+    impf_stem = (_strip_ending(imperfect, ("ον",))[0] if imperfect
+                 else _augment_like(pres_stem, fut_stem, aor_stem))
+
+    _conjugate(forms, "pres", "act", pres_stem, _ENDINGS["pres_act"])
+    _conjugate(forms, "impf", "act", impf_stem, _ENDINGS["past_act"])
+    _conjugate(forms, "fut", "act", fut_stem, _ENDINGS["pres_act"])
+    _conjugate(forms, "aor", "act", aor_stem,
+               _ENDINGS["past_act" if second_aorist else "aor1_act"])
+    forms["pres_act_inf"] = recessive(pres_stem + "ειν")
+    _conjugate(forms, "pres", "mid", pres_stem, _ENDINGS["pres_mid"])
+    _conjugate(forms, "impf", "mid", impf_stem, _ENDINGS["past_mid"])
+    _conjugate(forms, "fut", "mid", fut_stem, _ENDINGS["pres_mid"])
+    _conjugate(forms, "aor", "mid", aor_stem,
+               _ENDINGS["past_mid" if second_aorist else "aor1_mid"])
+    if not participles:
+        return forms
+
+    # Present active participle: accent persists on the stem syllable.
+    index, _, _ = _accent_syllable(present)
+    for gender, endings in (("masc", _PTCP_MASC), ("fem", _PTCP_FEM),
+                            ("neut", _PTCP_NEUT)):
+        for (case, number), ending in zip(_cells(), endings):
+            ending, nu = _with_nu(ending)
+            key = f"pres_act_ptcp_{case}_{number}_{gender}"
+            if gender == "fem" and case == "gen" and number == "pl":
+                word = pres_stem + ending
+                form = _finish(_place(word, _nuclei(word)[-1], CIRCUMFLEX))
+            else:
+                form = persistent(pres_stem + ending, index)
+            forms[key] = form + nu
+    return forms
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _generate(pos: str, parts: tuple[str, ...], gender: str,
+              declension: int, deponent: bool,
+              participles: bool) -> Mapping[str, str]:
+    if pos == "noun":
+        return _noun_forms(parts, gender, declension)
+    if pos == "adjective":
+        return _adjective_forms(parts)
+    if pos == "verb":
+        return _verb_forms(parts, deponent, participles)
+    raise ValueError(f"No paradigm for part of speech {pos!r}")
+
+
+def inflect(entry: Mapping) -> dict[str, str]:
+    """Generate the forms of *entry* from its ``principal_parts``.
+
+    Results are memoized per paradigm; the returned dict is a fresh copy.
+    """
+    return dict(_generate(
+        entry["pos"], tuple(entry["principal_parts"]),
+        entry.get("gender", ""), entry.get("declension", 0),
+        bool(entry.get("deponent", False)),
+        bool(entry.get("participles", False)),
+    ))
+
+
+def forms_of(entry: Mapping, overrides: Mapping[str, str] | None = None) -> dict[str, str]:
+    """Return generated forms merged with explicit *overrides*.
+
+    Entries without principal parts just return their ``forms``.
+    """
+    if "principal_parts" not in entry:
+        return dict(entry.get("forms", {}))
+    forms = inflect(entry)
+    if overrides is None:
+        overrides = entry.get("forms", {})
+    forms.update(overrides)
+    return forms
@@ -0,0 +1,365 @@
+"""Sentence prompts generated from the grammar and the learner's vocabulary.
+
+``iter_prompts(user_vocab)`` streams prompts in the ``PROMPTS`` schema
+(english, hint, roles).  Each one picks a clause pattern from
+``grammar.SENTENCE_PATTERNS`` (and ``INFP_PATTERNS`` for an infinitive),
+fills every role with a lemma the learner knows, checks that the forms
+it needs exist, and builds the English sentence from the first gloss of
+each lemma.  Prompts whose roles equal a hand-written prompt's, or one
+already streamed, are skipped.
+
+Which roles a verb takes comes from the hand-written prompts: a verb may
+have any combination of the object, dative, PP and infinitive it has
+there that a pattern allows.  Verbs no prompt uses take an object unless
+deponent (their constructions vary too much to guess) and are otherwise
+left out.  Only these frames and the learner's word pools are prepared
+up front; a prompt costs a few random choices and form lookups.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from answers import roles_key
+from data import (
+    GENDER_NORMALIZE, PROMPTS, WORDS, LexiconChange, form_of, lookup_form,
+    on_reload, translate_english,
+)
+from english import (
+    inflect_head, past_tense, plural, present_participle, third_person,
+)
+from grammar import INFP_PATTERNS, SENTENCE_PATTERNS
+
+ARTICLE = "ὁ"
+TENSES = ("pres", "impf", "fut", "aor")
+PRONOUNS = {
+    ("1", "sg"): "I", ("2", "sg"): "you", ("3", "sg"): "he",
+    ("1", "pl"): "we", ("2", "pl"): "you", ("3", "pl"): "they",
+}
+
+# Chances that a noun phrase is indefinite or carries an adjective or a
+# participle, and that a subject is plural.
+INDEF_RATE = 0.25
+ADJ_RATE = 0.3
+PARTICIPLE_RATE = 0.1
+PLURAL_RATE = 0.2
+
+# Consecutive duplicates after which a stream counts as exhausted.
+MAX_MISSES = 1000
+
+# Grammar role → key in a prompt's roles dict.
+_ROLE_KEYS = {"obj": "object", "iobj": "dative", "pp": "pp", "infp": "infinitive"}
+
+_FRAMES: dict[str, frozenset[str]] | None = None
+_PROMPT_KEYS: frozenset[str] | None = None
+
+
+def _build_frames() -> dict[str, frozenset[str]]:
+    frames: dict[str, set[str]] = {}
+
+    def note(keyword: str | None, used: set[str]) -> None:
+        for lemma in translate_english(keyword) if keyword else ():
+            frames.setdefault(lemma, set()).update(used)
+
+    for prompt in PROMPTS:
+        roles = prompt.get("roles") or {}
+        note(roles.get("verb"),
+             {role for role, key in _ROLE_KEYS.items() if roles.get(key)})
+        inf = roles.get("infinitive")
+        if inf:
+            note(inf.get("verb"), {role for role, key in
+                                   (("obj", "object"), ("pp", "pp"))
+                                   if inf.get(key)})
+    for lemma in WORDS.partition("verb"):
+        if lemma not in frames and not WORDS[lemma].get("deponent"):
+            frames[lemma] = {"obj"}
+    return {lemma: frozenset(used) for lemma, used in frames.items()}
+
+
+def get_verb_frames() -> dict[str, frozenset[str]]:
+    """Verb lemma → the grammar roles it may take (see the module docstring)."""
+    global _FRAMES
+    if _FRAMES is None:
+        _FRAMES = _build_frames()
+    return _FRAMES
+
+
+def _prompt_keys() -> frozenset[str]:
+    global _PROMPT_KEYS
+    if _PROMPT_KEYS is None:
+        _PROMPT_KEYS = frozenset(roles_key(p["roles"])
+                                 for p in PROMPTS if p.get("roles"))
+    return _PROMPT_KEYS
+
+
+@on_reload
+def _drop_frames(change: LexiconChange) -> None:
+    global _FRAMES
+    _FRAMES = None
+
+
+def _gloss(lemma: str) -> str:
+    return WORDS[lemma]["translations"][0]
+
+
+def _verb_form(lemma: str, **features: str) -> str | None:
+    """Active form of *lemma*, or the middle one for a deponent."""
+    form = form_of(lemma, voice="act", **features)
+    if form is None and WORDS[lemma].get("deponent"):
+        form = form_of(lemma, voice="mid", **features)
+    return form
+
+
+def _one_reading(lemma: str, form: str, person: str, number: str) -> bool:
+    """Whether *form* of *lemma* is finite in one person and number only
+    (not so ἔλυον, 1sg or 3pl); without a subject the grader could not
+    tell which one was meant."""
+    for other, _, features in lookup_form(form.replace("(ν)", "")):
+        if (other == lemma and features.get("mood") == "ind"
+                and (features.get("person"), features.get("number"))
+                != (person, number)):
+            return False
+    return True
+
+
+def _english_verb(gloss: str, tense: str, person: str, number: str) -> str:
+    if tense == "pres":
+        if person == "3" and number == "sg":
+            return inflect_head(gloss, third_person)
+        return gloss
+    if tense == "impf":
+        be = "was" if number == "sg" and person != "2" else "were"
+        return f"{be} {inflect_head(gloss, present_participle)}"
+    if tense == "fut":
+        return f"will {gloss}"
+    return inflect_head(gloss, past_tense)
+
+
+def _np_hint(label: str, case: str, np: dict) -> str:
+    notes = [case]
+    if np.get("indef"):
+        notes.append("no article")
+    if np.get("adj"):
+        notes.append("with adjective")
+    if np.get("participle"):
+        notes.append("with participle")
+    return f"{label} ({', '.join(notes)})"
+
+
+class PromptGenerator:
+    """Random prompts over one vocabulary; iterate for a stream of
+    unique ones."""
+
+    def __init__(self, user_vocab: list[str], rng: random.Random | None = None):
+        self.rng = rng or random.Random()
+        known = [lemma for lemma in dict.fromkeys(user_vocab) if lemma in WORDS]
+        by_pos: dict[str, list[str]] = {}
+        for lemma in known:
+            by_pos.setdefault(WORDS[lemma]["pos"], []).append(lemma)
+        self.article = ARTICLE in by_pos.get("article", ())
+        self.nouns = by_pos.get("noun", [])
+        # A neuter subject reads as an object just as well.
+        self.subjects = [n for n in self.nouns
+                         if GENDER_NORMALIZE.get(WORDS[n].get("gender", "")) != "neut"]
+        self.adjectives = by_pos.get("adjective", [])
+        self.preps = by_pos.get("preposition", []) if self.article else []
+        frames = get_verb_frames()
+        verbs = [v for v in by_pos.get("verb", []) if v in frames]
+        self.participles = verbs
+        # (verb, pattern roles) pairs the vocabulary can fill
+        self.clauses: list[tuple[str, tuple[str, ...]]] = []
+        self.infinitives: list[tuple[str, tuple[str, ...]]] = []
+        for verb in verbs:
+            for pattern in INFP_PATTERNS:
+                roles = self._fillable(verb, pattern, frames)
+                if roles is not None:
+                    self.infinitives.append((verb, roles))
+        for verb in verbs:
+            for pattern in SENTENCE_PATTERNS:
+                roles = self._fillable(verb, pattern, frames)
+                if roles is not None:
+                    self.clauses.append((verb, roles))
+        self.seen = set(_prompt_keys())
+
+    def _fillable(self, verb: str, pattern: list, frames: dict) -> tuple | None:
+        """The roles of *pattern* if *verb* and the vocabulary can fill it."""
+        roles = tuple(role for _, role in pattern if role != "verb")
+        for role in roles:
+            if role != "subj" and role not in frames[verb]:
+                return None
+            if role == "subj" and not self.subjects:
+                return None
+            if role in ("obj", "iobj") and not self.nouns:
+                return None
+            if role == "pp" and not (self.preps and self.nouns):
+                return None
+            if role == "infp" and not self.infinitives:
+                return None
+        return roles
+
+    def __iter__(self) -> Iterator[dict]:
+        misses = 0
+        while self.clauses and misses < MAX_MISSES:
+            prompt = self.sample()
+            key = roles_key(prompt["roles"]) if prompt else None
+            if key is None or key in self.seen:
+                misses += 1
+                continue
+            self.seen.add(key)
+            misses = 0
+            yield prompt
+
+    def sample(self) -> dict | None:
+        """One random prompt, or None if the draw needs a missing form.
+
+        It may repeat an earlier one; iterating skips those.
+        """
+        rng = self.rng
+        verb, pattern = rng.choice(self.clauses)
+        tense = rng.choice(TENSES)
+        roles: dict = {}
+        english: list[str] = []
+        hints: list[str] = []
+        if "subj" in pattern:
+            person = "3"
+            number = "pl" if rng.random() < PLURAL_RATE else "sg"
+            subject = self._noun_phrase("nom", number, self.subjects)
+            if subject is None:
+                return None
+            roles["subject"], subject_english = subject
+            english.append(subject_english)
+            hints.append(_np_hint("Subject", "nom", roles["subject"]))
+        else:
+            person, number = rng.choice(list(PRONOUNS))
+            english.append(PRONOUNS[person, number])
+
+        form = _verb_form(verb, tense=tense, mood="ind",
+                          person=person, number=number)
+        if form is None or ("subj" not in pattern
+                            and not _one_reading(verb, form, person, number)):
+            return None
+        roles.update(verb=_gloss(verb), tense=tense, voice="act")
+        if "subj" not in pattern:
+            roles.update(person=person, number=number)
+        elif number == "pl":
+            roles["number"] = number
+        english.append(_english_verb(_gloss(verb), tense, person, number))
+        deponent = (" — deponent, use middle form"
+                    if WORDS[verb].get("deponent") else "")
+        hints.append(f"verb ({person}{number} {tense} act{deponent})")
+
+        obj_case = WORDS[verb].get("object_case") or "acc"
+        for role, case, label in (("obj", obj_case, "object"),
+                                  ("iobj", "dat", "indirect object")):
+            if role in pattern:
+                np = self._noun_phrase(case, "sg")
+                if np is None:
+                    return None
+                roles[_ROLE_KEYS[role]], np_english = np
+                english.append(np_english if role == "obj" else f"to {np_english}")
+                hints.append(_np_hint(label, case, roles[_ROLE_KEYS[role]]))
+        if "pp" in pattern:
+            pp = self._prepositional_phrase()
+            if pp is None:
+                return None
+            roles["pp"], pp_english, pp_hint = pp
+            english.append(pp_english)
+            hints.append(pp_hint)
+        if "infp" in pattern:
+            inf = self._infinitive_phrase()
+            if inf is None:
+                return None
+            roles["infinitive"], inf_english, inf_hint = inf
+            english.append(inf_english)
+            hints.append(inf_hint)
+
+        sentence = " ".join(english)
+        hint = " + ".join(hints)
+        if "subj" not in pattern:
+            hint += " — no subject noun needed"
+        return {
+            "english": sentence[0].upper() + sentence[1:] + ".",
+            "hint": hint[0].upper() + hint[1:],
+            "roles": roles,
+        }
+
+    def _noun_phrase(self, case: str, number: str,
+                     nouns: list[str] | None = None) -> tuple[dict, str] | None:
+        """A noun phrase in *case* and *number*: (roles, English)."""
+        rng = self.rng
+        noun = rng.choice(nouns or self.nouns)
+        if form_of(noun, case=case, number=number) is None:
+            return None
+        noun_gloss = _gloss(noun)
+        words = [plural(noun_gloss) if number == "pl" else noun_gloss]
+        np: dict = {"noun": noun_gloss}
+        if not self.article or rng.random() < INDEF_RATE:
+            np["indef"] = True
+            if number == "sg":
+                words.insert(0, "an" if noun_gloss[0] in "aeiou" else "a")
+            return np, " ".join(words)
+
+        gender = GENDER_NORMALIZE.get(WORDS[noun].get("gender", ""))
+        roll = rng.random()
+        if self.adjectives and roll < ADJ_RATE:
+            adj = rng.choice(self.adjectives)
+            if form_of(adj, case=case, number=number, gender=gender) is None:
+                return None
+            np["adj"] = _gloss(adj)
+            words.insert(0, np["adj"])
+        elif roll > 1 - PARTICIPLE_RATE:
+            verb = rng.choice(self.participles)
+            if _verb_form(verb, tense="pres", mood="ptcp", case=case,
+                          number=number, gender=gender) is None:
+                return None
+            np["participle"] = {"verb": _gloss(verb), "tense": "pres",
+                                "voice": "act"}
+            words.insert(0, inflect_head(_gloss(verb), present_participle))
+        words.insert(0, "the")
+        return np, " ".join(words)
+
+    def _prepositional_phrase(self) -> tuple[dict, str, str] | None:
+        rng = self.rng
+        prep, noun = rng.choice(self.preps), rng.choice(self.nouns)
+        case = WORDS[prep].get("governs") or "acc"
+        if form_of(noun, case=case, number="sg") is None:
+            return None
+        pp = {"prep": _gloss(prep), "noun": _gloss(noun)}
+        return (pp, f"{pp['prep']} the {pp['noun']}",
+                f"preposition ({prep} + {case}) + noun")
+
+    def _infinitive_phrase(self) -> tuple[dict, str, str] | None:
+        verb, pattern = self.rng.choice(self.infinitives)
+        if _verb_form(verb, tense="pres", mood="inf") is None:
+            return None
+        inf: dict = {"verb": _gloss(verb)}
+        english = [f"to {_gloss(verb)}"]
+        hints = ["infinitive"]
+        if "obj" in pattern:
+            case = WORDS[verb].get("object_case") or "acc"
+            np = self._noun_phrase(case, "sg")
+            if np is None:
+                return None
+            inf["object"], np_english = np
+            english.append(np_english)
+            hints.append(_np_hint("object", case, inf["object"]))
+        if "pp" in pattern:
+            pp = self._prepositional_phrase()
+            if pp is None:
+                return None
+            inf["pp"], pp_english, pp_hint = pp
+            english.append(pp_english)
+            hints.append(pp_hint)
+        return inf, " ".join(english), " + ".join(hints)
+
+
+def iter_prompts(user_vocab: list[str],
+                 rng: random.Random | None = None) -> Iterator[dict]:
+    """Stream unique generated prompts that use only *user_vocab*.
+
+    The stream ends only when the vocabulary's prompts are (nearly)
+    exhausted: after ``MAX_MISSES`` draws in a row that repeat earlier
+    prompts or need forms the lexicon lacks.
+    """
+    return iter(PromptGenerator(user_vocab, rng))
@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
-from data import PROMPTS, WORDS, lookup_form, translate_english
-from grammar import check_sentence, POS_TO_SYMBOL
+import threading
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from answers import (
+    answers_pending, next_word, prepare_answers, reference_answers,
+    reference_tree,
+)
+from availability import get_available_prompts
+from data import (
+    LEXICON_LOCK, WORDS, LexiconChange, on_reload, translate_english,
+)
+from grammar import FlatTree, analyze_tokens, check_sentence
+from prompts import iter_prompts
 from accentuation import check_accentuation
+from completion import greek_completion, line_buffer
+from transliteration import to_greek
 from ui import (
     console, display_prompt, display_errors, display_success,
     display_parse_tree, display_sentence_tokens, display_word_list_compact,
@@ -12,123 +26,45 @@ from ui import (
 )
 
 
-def _collect_english_words(roles: dict) -> list[str]:
-    """Extract all English keywords from a roles dict."""
-    words: list[str] = []
-    if "verb" in roles:
-        words.append(roles["verb"])
-    for key in ("subject", "object", "dative"):
-        np = roles.get(key)
-        if isinstance(np, dict):
-            if "noun" in np:
-                words.append(np["noun"])
-            if "adj" in np:
-                words.append(np["adj"])
-            part = np.get("participle")
-            if isinstance(part, dict) and "verb" in part:
-                words.append(part["verb"])
-    pp = roles.get("pp")
-    if isinstance(pp, dict):
-        if "prep" in pp:
-            words.append(pp["prep"])
-        if "noun" in pp:
-            words.append(pp["noun"])
-    inf = roles.get("infinitive")
-    if isinstance(inf, dict):
-        if "verb" in inf:
-            words.append(inf["verb"])
-        inf_obj = inf.get("object")
-        if isinstance(inf_obj, dict) and "noun" in inf_obj:
-            words.append(inf_obj["noun"])
-        inf_pp = inf.get("pp")
-        if isinstance(inf_pp, dict):
-            if "prep" in inf_pp:
-                words.append(inf_pp["prep"])
-            if "noun" in inf_pp:
-                words.append(inf_pp["noun"])
-    return words
-
-
-def _needs_article(roles: dict) -> bool:
-    """Check if any NP in roles is definite (requires the article ὁ)."""
-    for key in ("subject", "object", "dative"):
-        np = roles.get(key)
-        if isinstance(np, dict) and not np.get("indef"):
-            return True
-    pp = roles.get("pp")
-    if isinstance(pp, dict) and "noun" in pp:
-        return True
-    inf = roles.get("infinitive")
-    if isinstance(inf, dict):
-        inf_obj = inf.get("object")
-        if isinstance(inf_obj, dict) and not inf_obj.get("indef"):
-            return True
-        inf_pp = inf.get("pp")
-        if isinstance(inf_pp, dict) and "noun" in inf_pp:
-            return True
-    return False
-
-
-def get_available_prompts(user_vocab: list[str]) -> list[dict]:
-    """Return prompts for which the user knows all required lemmas."""
-    vocab_set = set(user_vocab)
-    available = []
-    for prompt in PROMPTS:
-        roles = prompt.get("roles")
-        if not roles:
-            continue
-        ok = True
-        for eng in _collect_english_words(roles):
-            greek_lemmas = translate_english(eng)
-            if not greek_lemmas or not any(g in vocab_set for g in greek_lemmas):
-                ok = False
-                break
-        if ok and _needs_article(roles) and "ὁ" not in vocab_set:
-            ok = False
-        if ok:
-            available.append(prompt)
-    return available
-
-
 def tokenize_input(text: str) -> list[str]:
-    """Split input into tokens, handling punctuation."""
+    """Split input into tokens, handling punctuation.
+
+    ASCII words are read as Beta Code or Latin transliteration and
+    converted to Greek (see ``transliteration``).
+    """
     # Simple whitespace split; strip trailing punctuation
     tokens = []
     for word in text.split():
         cleaned = word.strip(".,;:!?·")
         if cleaned:
-            tokens.append(cleaned)
+            tokens.append(to_greek(cleaned))
     return tokens
 
 
-def _show_token_analysis(tokens: list[str]):
-    """Show each token with its possible POS analyses."""
-    token_analyses = []
-    for token in tokens:
-        analyses = lookup_form(token)
-        readings = []
-        for lemma, pos, feats in analyses:
-            symbol = POS_TO_SYMBOL.get(pos)
-            if symbol:
-                readings.append((symbol, feats))
-        token_analyses.append(readings)
+def _show_token_analysis(tokens: list[str], token_readings: list | None = None):
+    """Show each token with its possible POS analyses.
+
+    *token_readings* is the ``analyze_tokens`` result for *tokens*; it is
+    computed here when not supplied.
+    """
+    if token_readings is None:
+        token_readings = analyze_tokens(tokens)
 
-    display_sentence_tokens(tokens, token_analyses)
+    display_sentence_tokens(tokens, token_readings)
 
     # Show details for each token
-    for i, token in enumerate(tokens):
-        analyses = lookup_form(token)
-        if not analyses:
+    for token, readings in zip(tokens, token_readings):
+        if not readings:
             console.print(f"  [red]'{token}' — not recognized[/red]")
         else:
             parts = []
-            for lemma, pos, feats in analyses:
+            for reading in readings:
                 feat_strs = []
-                for k, v in feats.items():
+                for k, v in reading.features.items():
                     if k != "lemma":
                         feat_strs.append(f"{v}")
                 feat_str = ",".join(feat_strs) if feat_strs else ""
-                parts.append(f"{pos}({lemma}) [{feat_str}]")
+                parts.append(f"{reading.pos}({reading.lemma}) [{feat_str}]")
             console.print(f"  [dim]{token}: {' | '.join(parts)}[/dim]")
 
 
@@ -189,7 +125,10 @@ def extract_roles(tree) -> dict:
     Returns a dict with keys like "subject", "verb", "object", "pp".
     Roles are identified by case inflection, not by word order.
     For compound sentences (S Conj S), returns {"compound": True}.
+    Works on a ``ParseNode`` or directly on a ``FlatTree``.
     """
+    if isinstance(tree, FlatTree):
+        tree = tree.root()
     if tree.symbol != "S":
         return {}
 
@@ -236,322 +175,637 @@ def _meaning(lemma: str) -> str:
     return lemma
 
 
-def check_translation(actual: dict, expected: dict) -> tuple[bool, list[str]]:
-    """Compare extracted roles against expected roles.
+TENSE_NAMES = {"pres": "present", "impf": "imperfect",
+               "fut": "future", "aor": "aorist"}
+VOICE_NAMES = {"act": "active", "mid": "middle"}
+PERSON_NAMES = {"1": "1st", "2": "2nd", "3": "3rd"}
+NUMBER_NAMES = {"sg": "singular", "pl": "plural"}
 
-    Returns (match, list_of_mismatch_messages).
-    """
-    mismatches: list[str] = []
-
-    if actual.get("compound"):
-        mismatches.append("Expected a simple sentence, not a compound one")
-        return False, mismatches
-
-    # Check verb
-    exp_verb = expected.get("verb")
-    act_verb = actual.get("verb")
-    if exp_verb and act_verb not in translate_english(exp_verb):
-        mismatches.append(
-            f'Expected verb "{exp_verb}", '
-            f'got "{_meaning(act_verb)}" ({act_verb})' if act_verb
-            else f'Expected verb "{exp_verb}", but none found'
-        )
+# Clause-level NP roles and how messages name them.
+_NP_ROLES = (("subject", "a subject"), ("object", "an object"),
+             ("dative", "a dative"))
 
-    # Check tense
-    exp_tense = expected.get("tense")
-    act_tense = actual.get("tense")
-    if exp_tense and act_tense != exp_tense:
-        tense_names = {
-            "pres": "present", "impf": "imperfect",
-            "fut": "future", "aor": "aorist",
-        }
-        mismatches.append(
-            f'Expected {tense_names.get(exp_tense, exp_tense)} tense, '
-            f'got {tense_names.get(act_tense, act_tense)}'
-        )
 
-    # Check voice
-    exp_voice = expected.get("voice")
-    act_voice = actual.get("voice")
-    if exp_voice and act_voice != exp_voice:
-        # Deponent verbs use middle forms but translate as active
-        verb_lemma = actual.get("verb")
-        is_deponent = WORDS.get(verb_lemma, {}).get("deponent", False)
-        if is_deponent and exp_voice == "act" and act_voice == "mid":
-            pass  # accept middle form for deponent verb
-        else:
-            voice_names = {"act": "active", "mid": "middle"}
+class Gloss(NamedTuple):
+    """An expected English keyword and the Greek lemmas that satisfy it."""
+
+    keyword: str | None
+    lemmas: frozenset[str]
+
+
+def _gloss(keyword: str | None) -> Gloss | None:
+    return Gloss(keyword, translate_english(keyword)) if keyword else None
+
+
+@dataclass(frozen=True)
+class NPMatcher:
+    """Expected contents of one noun phrase, compiled from its roles dict."""
+
+    role: str
+    noun: Gloss | None
+    adj: Gloss | None
+    participle: Gloss | None
+    indef: bool
+
+    @classmethod
+    def compile(cls, role: str, np: dict) -> NPMatcher:
+        part = np.get("participle")
+        participle = None
+        if part:
+            participle = _gloss(part.get("verb")) or Gloss(None, frozenset())
+        return cls(role, _gloss(np.get("noun")), _gloss(np.get("adj")),
+                   participle, bool(np.get("indef")))
+
+    def check(self, actual_np: dict, mismatches: list[str]) -> None:
+        """Append a message per difference from *actual_np*."""
+        role = self.role
+        act_noun = actual_np.get("noun")
+        if self.noun and act_noun not in self.noun.lemmas:
             mismatches.append(
-                f'Expected {voice_names.get(exp_voice, exp_voice)} voice, '
-                f'got {voice_names.get(act_voice, act_voice)}'
+                f'In {role}: expected "{self.noun.keyword}", '
+                f'got "{_meaning(act_noun)}" ({act_noun})'
             )
 
-    # Check person
-    exp_person = expected.get("person")
-    act_person = actual.get("person")
-    if exp_person and act_person != exp_person:
-        person_names = {"1": "1st", "2": "2nd", "3": "3rd"}
-        mismatches.append(
-            f'Expected {person_names.get(exp_person, exp_person)} person, '
-            f'got {person_names.get(act_person, act_person)}'
-        )
-
-    # Check number
-    exp_number = expected.get("number")
-    act_number = actual.get("number")
-    if exp_number and act_number != exp_number:
-        number_names = {"sg": "singular", "pl": "plural"}
-        mismatches.append(
-            f'Expected {number_names.get(exp_number, exp_number)} number, '
-            f'got {number_names.get(act_number, act_number)}'
-        )
+        act_adj = actual_np.get("adj")
+        if self.adj:
+            if act_adj not in self.adj.lemmas:
+                exp_adj = self.adj.keyword
+                mismatches.append(
+                    f'In {role}: expected adjective "{exp_adj}", '
+                    f'got "{_meaning(act_adj)}" ({act_adj})' if act_adj
+                    else f'In {role}: expected adjective "{exp_adj}", but none found'
+                )
+        elif act_adj:
+            mismatches.append(
+                f'In {role}: unexpected adjective "{_meaning(act_adj)}" ({act_adj})'
+            )
 
-    # Check subject
-    exp_subj = expected.get("subject")
-    act_subj = actual.get("subject")
-    if exp_subj:
-        if not act_subj:
-            mismatches.append("Expected a subject noun phrase, but none found")
-        else:
-            _check_np_role("subject", exp_subj, act_subj, mismatches)
-    elif act_subj:
-        mismatches.append("Unexpected subject — the prompt doesn't have one")
-
-    # Check object
-    exp_obj = expected.get("object")
-    act_obj = actual.get("object")
-    if exp_obj:
-        if not act_obj:
-            mismatches.append("Expected an object noun phrase, but none found")
-        else:
-            _check_np_role("object", exp_obj, act_obj, mismatches)
-    elif act_obj:
-        mismatches.append("Unexpected object — the prompt doesn't have one")
-
-    # Check dative
-    exp_dat = expected.get("dative")
-    act_dat = actual.get("dative")
-    if exp_dat:
-        if not act_dat:
-            mismatches.append("Expected a dative noun phrase, but none found")
-        else:
-            _check_np_role("dative", exp_dat, act_dat, mismatches)
-    elif act_dat:
-        mismatches.append("Unexpected dative — the prompt doesn't have one")
-
-    # Check PP
-    exp_pp = expected.get("pp")
-    act_pp = actual.get("pp")
-    if exp_pp:
-        if not act_pp:
-            mismatches.append("Expected a prepositional phrase, but none found")
-        else:
-            exp_prep = exp_pp.get("prep")
-            act_prep = act_pp.get("prep")
-            if exp_prep and act_prep not in translate_english(exp_prep):
+        act_part = actual_np.get("participle")
+        if self.participle:
+            exp_part_verb = self.participle.keyword
+            if not act_part:
                 mismatches.append(
-                    f'Expected preposition "{exp_prep}", '
-                    f'got "{_meaning(act_prep)}" ({act_prep})'
+                    f'In {role}: expected participle of "{exp_part_verb}", '
+                    f'but none found'
                 )
-            exp_pp_noun = exp_pp.get("noun")
-            act_pp_noun = act_pp.get("noun")
-            if exp_pp_noun and act_pp_noun not in translate_english(exp_pp_noun):
+            elif act_part.get("lemma") not in self.participle.lemmas:
                 mismatches.append(
-                    f'In PP: expected noun "{exp_pp_noun}", '
-                    f'got "{_meaning(act_pp_noun)}" ({act_pp_noun})'
+                    f'In {role}: expected participle of "{exp_part_verb}", '
+                    f'got "{_meaning(act_part.get("lemma"))}" '
+                    f'({act_part.get("lemma")})'
                 )
-    elif act_pp:
-        mismatches.append("Unexpected prepositional phrase — the prompt doesn't have one")
-
-    # Check infinitive clause
-    exp_inf = expected.get("infinitive")
-    act_inf = actual.get("infinitive")
-    if exp_inf:
-        if not act_inf:
-            mismatches.append("Expected an infinitive clause, but none found")
-        else:
-            exp_inf_verb = exp_inf.get("verb")
-            act_inf_verb = act_inf.get("verb")
-            if exp_inf_verb and act_inf_verb not in translate_english(exp_inf_verb):
+        elif act_part:
+            mismatches.append(
+                f'In {role}: unexpected participle "{_meaning(act_part.get("lemma"))}" '
+                f'({act_part.get("lemma")})'
+            )
+
+        # Indefinite NPs must not have an article, definite NPs must
+        if self.indef:
+            if actual_np.get("has_article"):
                 mismatches.append(
-                    f'In infinitive: expected verb "{exp_inf_verb}", '
-                    f'got "{_meaning(act_inf_verb)}" ({act_inf_verb})' if act_inf_verb
-                    else f'In infinitive: expected verb "{exp_inf_verb}", but none found'
+                    f'In {role}: indefinite noun phrase should not have an article in Greek'
                 )
-            exp_inf_obj = exp_inf.get("object")
-            act_inf_obj = act_inf.get("object")
-            if exp_inf_obj:
-                if not act_inf_obj:
-                    mismatches.append("In infinitive: expected an object, but none found")
-                else:
-                    _check_np_role("infinitive object", exp_inf_obj, act_inf_obj, mismatches)
-            elif act_inf_obj:
-                mismatches.append("In infinitive: unexpected object")
-            exp_inf_pp = exp_inf.get("pp")
-            act_inf_pp = act_inf.get("pp")
-            if exp_inf_pp:
-                if not act_inf_pp:
-                    mismatches.append("In infinitive: expected a PP, but none found")
-                else:
-                    exp_inf_prep = exp_inf_pp.get("prep")
-                    act_inf_prep = act_inf_pp.get("prep")
-                    if exp_inf_prep and act_inf_prep not in translate_english(exp_inf_prep):
-                        mismatches.append(
-                            f'In infinitive: expected preposition "{exp_inf_prep}", '
-                            f'got "{_meaning(act_inf_prep)}" ({act_inf_prep})'
-                        )
-            elif act_inf_pp:
-                mismatches.append("In infinitive: unexpected prepositional phrase")
-    elif act_inf:
-        mismatches.append("Unexpected infinitive clause — the prompt doesn't have one")
-
-    return len(mismatches) == 0, mismatches
-
-
-def _check_np_role(role: str, expected_np: dict, actual_np: dict,
-                   mismatches: list[str]):
-    """Compare an expected NP (noun + optional adj) against actual."""
-    exp_noun = expected_np.get("noun")
-    act_noun = actual_np.get("noun")
-    if exp_noun and act_noun not in translate_english(exp_noun):
-        mismatches.append(
-            f'In {role}: expected "{exp_noun}", '
-            f'got "{_meaning(act_noun)}" ({act_noun})'
-        )
+        elif not actual_np.get("has_article"):
+            mismatches.append(
+                f'In {role}: definite noun phrase requires an article in Greek'
+            )
 
-    exp_adj = expected_np.get("adj")
-    act_adj = actual_np.get("adj")
-    if exp_adj and act_adj not in translate_english(exp_adj):
-        mismatches.append(
-            f'In {role}: expected adjective "{exp_adj}", '
-            f'got "{_meaning(act_adj)}" ({act_adj})' if act_adj
-            else f'In {role}: expected adjective "{exp_adj}", but none found'
-        )
-    elif not exp_adj and act_adj:
-        mismatches.append(
-            f'In {role}: unexpected adjective "{_meaning(act_adj)}" ({act_adj})'
+
+@dataclass(frozen=True)
+class InfinitiveMatcher:
+    verb: Gloss | None
+    object: NPMatcher | None
+    pp: bool
+    prep: Gloss | None
+
+
+@dataclass(frozen=True)
+class TranslationMatcher:
+    """A prompt's ``roles`` compiled for grading.
+
+    Keywords are resolved to lemma sets once, so grading is set
+    membership and comparisons of (interned) feature codes; message
+    strings are built only for mismatches.
+    """
+
+    verb: Gloss | None
+    tense: str | None
+    voice: str | None
+    person: str | None
+    number: str | None
+    nps: tuple[NPMatcher | None, ...]   # one per _NP_ROLES entry
+    pp: tuple[Gloss | None, Gloss | None] | None   # (prep, noun)
+    infinitive: InfinitiveMatcher | None
+
+    @classmethod
+    def compile(cls, expected: dict) -> TranslationMatcher:
+        nps = tuple(NPMatcher.compile(role, expected[role])
+                    if expected.get(role) else None
+                    for role, _ in _NP_ROLES)
+        pp = expected.get("pp")
+        inf = expected.get("infinitive")
+        infinitive = None
+        if inf:
+            inf_pp = inf.get("pp")
+            infinitive = InfinitiveMatcher(
+                _gloss(inf.get("verb")),
+                NPMatcher.compile("infinitive object", inf["object"])
+                if inf.get("object") else None,
+                bool(inf_pp), _gloss(inf_pp.get("prep")) if inf_pp else None,
+            )
+        return cls(
+            _gloss(expected.get("verb")), expected.get("tense") or None,
+            expected.get("voice") or None, expected.get("person") or None,
+            expected.get("number") or None, nps,
+            (_gloss(pp.get("prep")), _gloss(pp.get("noun"))) if pp else None,
+            infinitive,
         )
 
-    # Check participle
-    exp_part = expected_np.get("participle")
-    act_part = actual_np.get("participle")
-    if exp_part:
-        exp_part_verb = exp_part.get("verb")
-        if not act_part:
+    def check(self, actual: dict) -> tuple[bool, list[str]]:
+        """Compare extracted roles; see ``check_translation``."""
+        mismatches: list[str] = []
+
+        if actual.get("compound"):
+            mismatches.append("Expected a simple sentence, not a compound one")
+            return False, mismatches
+
+        act_verb = actual.get("verb")
+        if self.verb and act_verb not in self.verb.lemmas:
+            exp_verb = self.verb.keyword
             mismatches.append(
-                f'In {role}: expected participle of "{exp_part_verb}", '
-                f'but none found'
+                f'Expected verb "{exp_verb}", '
+                f'got "{_meaning(act_verb)}" ({act_verb})' if act_verb
+                else f'Expected verb "{exp_verb}", but none found'
             )
-        else:
-            if act_part.get("lemma") not in translate_english(exp_part_verb):
+
+        act_tense = actual.get("tense")
+        if self.tense and act_tense != self.tense:
+            mismatches.append(
+                f'Expected {TENSE_NAMES.get(self.tense, self.tense)} tense, '
+                f'got {TENSE_NAMES.get(act_tense, act_tense)}'
+            )
+
+        act_voice = actual.get("voice")
+        if self.voice and act_voice != self.voice:
+            # Deponent verbs use middle forms but translate as active
+            is_deponent = WORDS.get(act_verb, {}).get("deponent", False)
+            if not (is_deponent and self.voice == "act" and act_voice == "mid"):
                 mismatches.append(
-                    f'In {role}: expected participle of "{exp_part_verb}", '
-                    f'got "{_meaning(act_part.get("lemma"))}" '
-                    f'({act_part.get("lemma")})'
+                    f'Expected {VOICE_NAMES.get(self.voice, self.voice)} voice, '
+                    f'got {VOICE_NAMES.get(act_voice, act_voice)}'
                 )
-    elif act_part:
-        mismatches.append(
-            f'In {role}: unexpected participle "{_meaning(act_part.get("lemma"))}" '
-            f'({act_part.get("lemma")})'
-        )
 
-    # Check article: indefinite NPs must not have one, definite NPs must
-    if expected_np.get("indef"):
-        if actual_np.get("has_article"):
+        act_person = actual.get("person")
+        if self.person and act_person != self.person:
             mismatches.append(
-                f'In {role}: indefinite noun phrase should not have an article in Greek'
+                f'Expected {PERSON_NAMES.get(self.person, self.person)} person, '
+                f'got {PERSON_NAMES.get(act_person, act_person)}'
             )
-    else:
-        if not actual_np.get("has_article"):
+
+        act_number = actual.get("number")
+        if self.number and act_number != self.number:
             mismatches.append(
-                f'In {role}: definite noun phrase requires an article in Greek'
+                f'Expected {NUMBER_NAMES.get(self.number, self.number)} number, '
+                f'got {NUMBER_NAMES.get(act_number, act_number)}'
             )
 
+        for (role, named), matcher in zip(_NP_ROLES, self.nps):
+            act_np = actual.get(role)
+            if matcher:
+                if not act_np:
+                    mismatches.append(
+                        f"Expected {named} noun phrase, but none found")
+                else:
+                    matcher.check(act_np, mismatches)
+            elif act_np:
+                mismatches.append(
+                    f"Unexpected {role} — the prompt doesn't have one")
+
+        act_pp = actual.get("pp")
+        if self.pp:
+            if not act_pp:
+                mismatches.append("Expected a prepositional phrase, but none found")
+            else:
+                prep, noun = self.pp
+                act_prep = act_pp.get("prep")
+                if prep and act_prep not in prep.lemmas:
+                    mismatches.append(
+                        f'Expected preposition "{prep.keyword}", '
+                        f'got "{_meaning(act_prep)}" ({act_prep})'
+                    )
+                act_pp_noun = act_pp.get("noun")
+                if noun and act_pp_noun not in noun.lemmas:
+                    mismatches.append(
+                        f'In PP: expected noun "{noun.keyword}", '
+                        f'got "{_meaning(act_pp_noun)}" ({act_pp_noun})'
+                    )
+        elif act_pp:
+            mismatches.append("Unexpected prepositional phrase — the prompt doesn't have one")
+
+        act_inf = actual.get("infinitive")
+        inf = self.infinitive
+        if inf:
+            if not act_inf:
+                mismatches.append("Expected an infinitive clause, but none found")
+            else:
+                self._check_infinitive(inf, act_inf, mismatches)
+        elif act_inf:
+            mismatches.append("Unexpected infinitive clause — the prompt doesn't have one")
+
+        return len(mismatches) == 0, mismatches
+
+    @staticmethod
+    def _check_infinitive(inf: InfinitiveMatcher, act_inf: dict,
+                          mismatches: list[str]) -> None:
+        act_inf_verb = act_inf.get("verb")
+        if inf.verb and act_inf_verb not in inf.verb.lemmas:
+            exp_inf_verb = inf.verb.keyword
+            mismatches.append(
+                f'In infinitive: expected verb "{exp_inf_verb}", '
+                f'got "{_meaning(act_inf_verb)}" ({act_inf_verb})' if act_inf_verb
+                else f'In infinitive: expected verb "{exp_inf_verb}", but none found'
+            )
+        act_inf_obj = act_inf.get("object")
+        if inf.object:
+            if not act_inf_obj:
+                mismatches.append("In infinitive: expected an object, but none found")
+            else:
+                inf.object.check(act_inf_obj, mismatches)
+        elif act_inf_obj:
+            mismatches.append("In infinitive: unexpected object")
+        act_inf_pp = act_inf.get("pp")
+        if inf.pp:
+            if not act_inf_pp:
+                mismatches.append("In infinitive: expected a PP, but none found")
+            else:
+                act_inf_prep = act_inf_pp.get("prep")
+                if inf.prep and act_inf_prep not in inf.prep.lemmas:
+                    mismatches.append(
+                        f'In infinitive: expected preposition "{inf.prep.keyword}", '
+                        f'got "{_meaning(act_inf_prep)}" ({act_inf_prep})'
+                    )
+        elif act_inf_pp:
+            mismatches.append("In infinitive: unexpected prepositional phrase")
+
+
+# Compiled matchers by id of the roles dict; the dict is kept alongside
+# so its id cannot be reused while cached.
+_MATCHERS: dict[int, tuple[dict, TranslationMatcher]] = {}
+MAX_MATCHERS = 256
+
+
+def translation_matcher(expected: dict) -> TranslationMatcher:
+    """Return the compiled matcher for a roles dict, compiling it once."""
+    cached = _MATCHERS.get(id(expected))
+    if cached is None or cached[0] is not expected:
+        if len(_MATCHERS) >= MAX_MATCHERS:
+            _MATCHERS.clear()
+        cached = _MATCHERS[id(expected)] = (
+            expected, TranslationMatcher.compile(expected))
+    return cached[1]
+
+
+@on_reload
+def _drop_matchers(change: LexiconChange) -> None:
+    if change.glosses:
+        _MATCHERS.clear()
+
+
+def check_translation(actual: dict, expected: dict) -> tuple[bool, list[str]]:
+    """Compare extracted roles against expected roles.
+
+    Returns (match, list_of_mismatch_messages).
+    """
+    return translation_matcher(expected).check(actual)
+
+
+# How long the screen waits for a background analysis before drawing
+# without it (seconds).  Fast parses render in one pass; slow ones are
+# drawn above the Greek> prompt when they arrive, while the learner types.
+ANALYSIS_WAIT = 0.25
+# How often a pending analysis is checked while waiting for input.
+ANALYSIS_POLL = 0.05
+
+GREEK_PROMPT = "Greek> "
+
+
+@dataclass
+class SentenceAnalysis:
+    """Outcome of parsing and grading one token list."""
+
+    tokens: list[str]
+    success: bool
+    tree: object = None
+    errors: list[str] = field(default_factory=list)
+    translation_ok: bool = True
+    mismatches: list[str] = field(default_factory=list)
+    accent_ok: bool = False
+    accent_errors: list[str] = field(default_factory=list)
+
+    @property
+    def correct(self) -> bool:
+        return self.success and self.translation_ok and self.accent_ok
+
+
+def analyze_sentence(tokens: list[str], expected: dict | None,
+                     cancelled=None, token_readings=None) -> SentenceAnalysis:
+    """Grade *tokens* against *expected* roles.
+
+    A stored reference answer (see ``answers``) is accepted at once with
+    its stored parse tree; anything else goes through ``grade_sentence``.
+    """
+    tree = reference_tree(expected, tokens) if expected else None
+    if tree is not None:
+        return SentenceAnalysis(list(tokens), True, tree, accent_ok=True)
+    return grade_sentence(tokens, expected, cancelled, token_readings)
+
+
+def grade_sentence(tokens: list[str], expected: dict | None,
+                   cancelled=None, token_readings=None) -> SentenceAnalysis:
+    """Parse *tokens* and grade them against *expected* roles.
+
+    Runs the same checks the sentence loop shows: parse, role/translation
+    check, then sentential accentuation.
+    """
+    success, tree, errors = check_sentence(tokens, cancelled, token_readings)
+    analysis = SentenceAnalysis(list(tokens), success, tree, errors)
+    if not (success and tree):
+        return analysis
+    if expected:
+        actual_roles = extract_roles(tree)
+        analysis.translation_ok, analysis.mismatches = check_translation(
+            actual_roles, expected)
+        if not analysis.translation_ok:
+            return analysis
+    analysis.accent_ok, analysis.accent_errors = check_accentuation(tokens)
+    return analysis
+
+
+class AnalysisWorker:
+    """Background thread that analyses the sentence being built.
+
+    Each ``submit`` supersedes the previous request: an in-flight parse is
+    cancelled at its next checkpoint and stale results are discarded, so
+    ``wait`` only ever returns the analysis of the latest tokens.
+    """
+
+    def __init__(self, expected: dict | None):
+        self.expected = expected
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._request: tuple[int, list[str], list, threading.Event] | None = None
+        self._cancel: threading.Event | None = None
+        self._result: SentenceAnalysis | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, tokens: list[str], token_readings: list | None = None) -> None:
+        """Start analysing *tokens*, abandoning any earlier request.
+
+        *token_readings* (from ``analyze_tokens``) is shared with the
+        parser rather than looked up again on the worker thread.
+        """
+        with self._cond:
+            if self._cancel is not None:
+                self._cancel.set()
+            self._generation += 1
+            self._cancel = threading.Event()
+            self._result = None
+            self._request = (self._generation, list(tokens), token_readings,
+                             self._cancel)
+            self._cond.notify_all()
+
+    def cancel(self) -> None:
+        """Abandon the current request; ``wait`` returns None until the
+        next ``submit``."""
+        with self._cond:
+            if self._cancel is not None:
+                self._cancel.set()
+            self._generation += 1
+            self._cancel = None
+            self._request = None
+            self._result = None
+
+    def wait(self, timeout: float) -> SentenceAnalysis | None:
+        """Return the latest analysis, waiting up to *timeout* seconds."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._result is not None or self._closed, timeout)
+            return self._result
+
+    def close(self) -> None:
+        with self._cond:
+            if self._cancel is not None:
+                self._cancel.set()
+            self._closed = True
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._request is not None or self._closed)
+                if self._closed:
+                    return
+                generation, tokens, token_readings, cancel = self._request
+                self._request = None
+            try:
+                with LEXICON_LOCK:   # a reload waits for the parse
+                    analysis = analyze_sentence(tokens, self.expected,
+                                                cancel.is_set, token_readings)
+            except Exception as e:
+                # Report it in place of the result; the thread stays up
+                # for the next request.
+                analysis = SentenceAnalysis(
+                    list(tokens), False, errors=[f"Analysis failed: {e!r}"])
+            with self._cond:
+                if generation == self._generation and not cancel.is_set():
+                    self._result = analysis
+                    self._cond.notify_all()
+
+
+def _show_analysis(analysis: SentenceAnalysis) -> None:
+    """Render the parse tree and feedback panels for an analysis."""
+    if not (analysis.success and analysis.tree):
+        display_errors(analysis.errors)
+        return
+    display_parse_tree(analysis.tree)
+    if not analysis.translation_ok:
+        display_translation_mismatch(analysis.mismatches)
+    elif not analysis.accent_ok:
+        display_accent_feedback(analysis.accent_errors)
+
+
+def _show_above_prompt(analysis: SentenceAnalysis) -> None:
+    """Draw *analysis* in place of the ``Greek>`` line, then redraw the
+    prompt with the text typed so far."""
+    typed = line_buffer()
+    console.file.write("\r\x1b[2K")   # erase the prompt line
+    _show_analysis(analysis)
+    if analysis.correct:
+        display_success()
+        console.print("  [dim]Press Enter to continue...[/dim]")
+    console.print(f"[bold cyan]{GREEK_PROMPT}[/bold cyan]", end="")
+    console.file.write(typed)
+    console.file.flush()
+
+
+def _read_input(worker: AnalysisWorker, user_vocab: list[str],
+                pending: bool) -> tuple[str, SentenceAnalysis | None]:
+    """Read a line at the ``Greek>`` prompt, with completion.
+
+    With *pending*, the worker's result is drawn above the prompt as soon
+    as it arrives, without interrupting the typing.  Returns the line and
+    the analysis drawn meanwhile, if any.
+    """
+    shown: list[SentenceAnalysis] = []
+    done = threading.Event()
+    drawing = threading.Lock()
+
+    def watch() -> None:
+        while not done.is_set():
+            analysis = worker.wait(ANALYSIS_POLL)
+            if analysis is None:
+                continue
+            with drawing:
+                if not done.is_set():
+                    _show_above_prompt(analysis)
+                    shown.append(analysis)
+            return
+
+    if pending:
+        threading.Thread(target=watch, daemon=True).start()
+    try:
+        with greek_completion(user_vocab):
+            line = prompt_input(GREEK_PROMPT)
+    finally:
+        with drawing:
+            done.set()
+    return line, (shown[0] if shown else None)
+
+
+def _next_word_hint(prompt: dict, tokens: list[str]) -> str:
+    """The message shown for the 'hint' command."""
+    roles = prompt.get("roles")
+    if not roles:
+        return "No reference answer for this prompt."
+    prepare_answers(prompt)   # again, in case a reload dropped them
+    if answers_pending(roles):
+        return "The reference answers are not ready yet — try 'hint' again."
+    if reference_answers(roles) is None:
+        return "No reference answer for this prompt."
+    word = next_word(prompt["roles"], tokens)
+    if word is None:
+        return "No reference answer starts like this — try 'back' or 'clear'."
+    return f"Next word: {word}"
+
 
 def sentence_construction_loop(prompt: dict, user_vocab: list[str]) -> bool:
-    """Interactive loop for building a sentence. Returns True if completed."""
+    """Interactive loop for building a sentence. Returns True if completed.
+
+    Parsing and grading run on an ``AnalysisWorker``; token colors are
+    drawn immediately, and the parse tree and feedback of a slow analysis
+    are drawn above the ``Greek>`` prompt when they arrive, without
+    interrupting the learner's typing.  Tab completes Greek forms,
+    the learner's own words first; 'hint' shows the next word of a
+    reference answer (see ``answers``), built in the background for a
+    prompt that has none stored.
+    """
     current_tokens: list[str] = []
+    token_readings: list = []
+    word_hint = ""
+    worker = AnalysisWorker(prompt.get("roles"))
+    prepare_answers(prompt)   # a generated prompt has none stored
 
-    while True:
-        clear()
-        display_prompt(prompt["english"], prompt.get("hint", ""))
-
-        if prompt.get("note"):
-            console.print(f"  [italic yellow]Note: {prompt['note']}[/italic yellow]")
+    try:
+        while True:
+            analysis = None
+            clear()
+            display_prompt(prompt["english"], prompt.get("hint", ""))
 
-        console.print()
+            if prompt.get("note"):
+                console.print(f"  [italic yellow]Note: {prompt['note']}[/italic yellow]")
+            if word_hint:
+                console.print(f"  [italic cyan]{word_hint}[/italic cyan]")
 
-        # Show available vocabulary
-        console.print("[dim]  Available words:[/dim]")
-        display_word_list_compact(user_vocab)
-        console.print()
+            console.print()
 
-        # Show current sentence
-        if current_tokens:
-            console.print("  [bold]Your sentence:[/bold]")
-            _show_token_analysis(current_tokens)
+            # Show available vocabulary
+            console.print("[dim]  Available words:[/dim]")
+            display_word_list_compact(user_vocab)
             console.print()
 
-            # Try to parse
-            success, tree, errors = check_sentence(current_tokens)
-
-            if success and tree:
-                display_parse_tree(tree)
-                expected = prompt.get("roles")
-                if expected:
-                    actual_roles = extract_roles(tree)
-                    match, msgs = check_translation(actual_roles, expected)
-                    if match:
-                        accent_ok, accent_errors = check_accentuation(current_tokens)
-                        if accent_ok:
-                            display_success()
-                            prompt_input("Press Enter to continue...")
-                            return True
-                        else:
-                            display_accent_feedback(accent_errors)
-                    else:
-                        display_translation_mismatch(msgs)
+            # Show current sentence
+            if current_tokens:
+                console.print("  [bold]Your sentence:[/bold]")
+                _show_token_analysis(current_tokens, token_readings)
+                console.print()
+
+                analysis = worker.wait(ANALYSIS_WAIT)
+                if analysis is None:
+                    console.print(
+                        "  [dim]Analysing… the result will appear below.[/dim]"
+                    )
                 else:
-                    accent_ok, accent_errors = check_accentuation(current_tokens)
-                    if accent_ok:
+                    _show_analysis(analysis)
+                    if analysis.correct:
                         display_success()
                         prompt_input("Press Enter to continue...")
                         return True
-                    else:
-                        display_accent_feedback(accent_errors)
             else:
-                display_errors(errors)
-        else:
-            console.print("  [dim]Your sentence: (empty)[/dim]")
+                console.print("  [dim]Your sentence: (empty)[/dim]")
+
+            console.print()
+            console.print(
+                "  [dim]Commands: type Greek words | "
+                "'clear' to reset | 'back' to delete last | "
+                "'hint' for the next word | 'quit' to exit[/dim]"
+            )
+            user_input, shown = _read_input(
+                worker, user_vocab, bool(current_tokens) and analysis is None)
+            if shown is not None and shown.correct:
+                return True
+            user_input = user_input.strip()
+
+            word_hint = ""
+            if not user_input:
+                continue
+            elif user_input.lower() == "quit":
+                return False
+            elif user_input.lower() == "hint":
+                word_hint = _next_word_hint(prompt, current_tokens)
+                continue
+            elif user_input.lower() == "clear":
+                current_tokens = []
+            elif user_input.lower() == "back":
+                if current_tokens:
+                    current_tokens.pop()
+            else:
+                new_tokens = tokenize_input(user_input)
+                current_tokens.extend(new_tokens)
 
-        console.print()
-        console.print(
-            "  [dim]Commands: type Greek words | "
-            "'clear' to reset | 'back' to delete last | "
-            "'quit' to exit[/dim]"
-        )
-        user_input = prompt_input("Greek> ").strip()
-
-        if not user_input:
-            continue
-        elif user_input.lower() == "quit":
-            return False
-        elif user_input.lower() == "clear":
-            current_tokens = []
-        elif user_input.lower() == "back":
             if current_tokens:
-                current_tokens.pop()
-        else:
-            new_tokens = tokenize_input(user_input)
-            current_tokens.extend(new_tokens)
+                token_readings = analyze_tokens(current_tokens)
+                worker.submit(current_tokens, token_readings)
+            else:
+                worker.cancel()
+    finally:
+        worker.close()
 
 
 def run_sentence_mode(user_data: dict) -> None:
-    """Run the sentence construction mode."""
+    """Run the sentence construction mode.
+
+    Besides the hand-written prompts the learner can take a generated
+    one (see ``prompts``) built from their vocabulary.
+    """
     user_vocab = user_data.get("vocabulary", [])
     available = get_available_prompts(user_vocab)
+    generated = next(iter_prompts(user_vocab), None)
 
-    if not available:
+    if not available and generated is None:
         console.print(
             "\n[yellow]  You need to learn more words before building sentences![/yellow]"
         )
@@ -565,6 +819,8 @@ def run_sentence_mode(user_data: dict) -> None:
 
     for i, prompt in enumerate(available):
         console.print(f"  [{i + 1}] {prompt['english']}")
+    if generated is not None:
+        console.print(f"  [g] New: {generated['english']}")
     console.print(f"  [q] Return to menu")
     console.print()
 
@@ -573,9 +829,13 @@ def run_sentence_mode(user_data: dict) -> None:
         return
 
     try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(available):
-            completed = sentence_construction_loop(available[idx], user_vocab)
+        if choice.lower() == "g" and generated is not None:
+            chosen = generated
+        else:
+            idx = int(choice) - 1
+            chosen = available[idx] if 0 <= idx < len(available) else None
+        if chosen is not None:
+            completed = sentence_construction_loop(chosen, user_vocab)
             if completed:
                 user_data["sentences_completed"] = user_data.get("sentences_completed", 0) + 1
         else:
@@ -0,0 +1,164 @@
+"""Misspelling-tolerant lookup of surface forms.
+
+``DeletionIndex`` is a SymSpell-style index: every known form is stored
+under each string obtained by deleting up to ``max_distance`` characters
+from its first ``prefix_length`` characters.  A query generates the same
+deletions of its own prefix, so candidates come from a handful of dict
+lookups instead of an edit-distance scan over the whole lexicon; each
+candidate is then verified with a real (Damerau-Levenshtein) distance.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from accentuation import normalize_graves
+from data import LexiconChange, get_form_index, on_reload
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+SUGGESTION_LIMIT = 3
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance of *a* and *b*.
+
+    Insertions, deletions, substitutions and adjacent transpositions
+    each cost 1.  Only the diagonal band of width ``2 * limit + 1`` is
+    computed, and ``limit + 1`` is returned as soon as the distance is
+    known to exceed *limit*.
+    """
+    n, m = len(a), len(b)
+    if abs(n - m) > limit:
+        return limit + 1
+    big = limit + 1
+    prev2 = None
+    prev = [j if j <= limit else big for j in range(m + 1)]
+    for i in range(1, n + 1):
+        cur = [big] * (m + 1)
+        if i <= limit:
+            cur[0] = i
+        lo = max(1, i - limit)
+        hi = min(m, i + limit)
+        row_min = cur[0]
+        ai = a[i - 1]
+        for j in range(lo, hi + 1):
+            d = prev[j - 1] + (ai != b[j - 1])
+            if prev[j] + 1 < d:
+                d = prev[j] + 1
+            if cur[j - 1] + 1 < d:
+                d = cur[j - 1] + 1
+            if (prev2 is not None and j > 1 and ai == b[j - 2]
+                    and a[i - 2] == b[j - 1] and prev2[j - 2] + 1 < d):
+                d = prev2[j - 2] + 1
+            cur[j] = d
+            if d < row_min:
+                row_min = d
+        if row_min > limit:
+            return big
+        prev2, prev = prev, cur
+    return min(prev[m], big)
+
+
+def _deletes(word: str, distance: int) -> set[str]:
+    """*word* and every string reachable by deleting up to *distance* chars."""
+    result = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+class DeletionIndex:
+    """Precomputed deletion neighbourhoods of a set of forms.
+
+    ``forms`` is sorted when built; ``add`` appends and ``discard``
+    leaves a ``None`` hole, so ids stay valid.
+    """
+
+    def __init__(self, forms: Iterable[str], max_distance: int = MAX_DISTANCE,
+                 prefix_length: int = PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.forms: list[str | None] = sorted({normalize_graves(f)
+                                               for f in forms})
+        self._deletes: dict[str, list[int]] = {}
+        for i, form in enumerate(self.forms):
+            for key in _deletes(form[:prefix_length], max_distance):
+                self._deletes.setdefault(key, []).append(i)
+
+    def _find(self, form: str) -> int | None:
+        for i in self._deletes.get(form[:self.prefix_length], ()):
+            if self.forms[i] == form:
+                return i
+        return None
+
+    def add(self, form: str) -> None:
+        """Index *form* too (no-op if it is already indexed)."""
+        form = normalize_graves(form)
+        if self._find(form) is not None:
+            return
+        i = len(self.forms)
+        self.forms.append(form)
+        for key in _deletes(form[:self.prefix_length], self.max_distance):
+            self._deletes.setdefault(key, []).append(i)
+
+    def discard(self, form: str) -> None:
+        """Stop suggesting *form* (no-op if it is not indexed)."""
+        form = normalize_graves(form)
+        i = self._find(form)
+        if i is None:
+            return
+        self.forms[i] = None
+        for key in _deletes(form[:self.prefix_length], self.max_distance):
+            ids = self._deletes[key]
+            ids.remove(i)
+            if not ids:
+                del self._deletes[key]
+
+    def lookup(self, word: str, max_distance: int | None = None,
+               ) -> list[tuple[str, int]]:
+        """Return ``(form, distance)`` pairs within *max_distance* of *word*,
+        closest first (ties alphabetical)."""
+        if max_distance is None:
+            max_distance = self.max_distance
+        max_distance = min(max_distance, self.max_distance)
+        word = normalize_graves(word)
+        ids: set[int] = set()
+        for key in _deletes(word[:self.prefix_length], max_distance):
+            ids.update(self._deletes.get(key, ()))
+        found = []
+        for i in ids:
+            form = self.forms[i]
+            d = edit_distance(word, form, max_distance)
+            if d <= max_distance:
+                found.append((form, d))
+        found.sort(key=lambda pair: (pair[1], pair[0]))
+        return found
+
+
+_SPELLING_INDEX: DeletionIndex | None = None
+
+
+def get_spelling_index() -> DeletionIndex:
+    """Return the deletion index over all known forms, building it once."""
+    global _SPELLING_INDEX
+    if _SPELLING_INDEX is None:
+        _SPELLING_INDEX = DeletionIndex(get_form_index())
+    return _SPELLING_INDEX
+
+
+@on_reload
+def _update_spelling_index(change: LexiconChange) -> None:
+    if _SPELLING_INDEX is not None:
+        for form in change.forms_removed:
+            _SPELLING_INDEX.discard(form)
+        for form in change.forms_added:
+            _SPELLING_INDEX.add(form)
+
+
+def suggest_forms(word: str, limit: int = SUGGESTION_LIMIT) -> list[str]:
+    """Return up to *limit* known forms closest to a misspelled *word*."""
+    return [form for form, d in get_spelling_index().lookup(word)
+            if d > 0][:limit]
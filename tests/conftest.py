@@ -0,0 +1,21 @@
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# The modules live in the repository root, not in a package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def source():
+    """An editable copy of ``words.WORDS``; the real lexicon is restored
+    afterwards."""
+    import words
+    from data import get_english_to_greek, get_form_index, load_lexicon, reload_lexicon
+
+    get_form_index()
+    get_english_to_greek()
+    yield copy.deepcopy(words.WORDS)
+    reload_lexicon(load_lexicon())
@@ -0,0 +1,54 @@
+"""Reference-answer store: background builds for prompts it lacks."""
+
+import threading
+import time
+
+import pytest
+
+import answers
+from answers import (
+    answers_pending, candidate_sentences, prepare_answers, reference_answers,
+)
+from data import PROMPTS
+
+PROMPT = {"english": "The horse writes.",
+          "roles": {"subject": {"noun": "horse"}, "verb": "write",
+                    "tense": "pres", "voice": "act"}}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = {}
+    monkeypatch.setattr(answers, "_ANSWERS", store)
+    return store
+
+
+def test_prompt_without_answers_is_built_once(store, monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def build(prompts):
+        calls.append(prompts)
+        release.wait(5)
+        return {}
+
+    monkeypatch.setattr(answers, "build_reference_answers", build)
+    prepare_answers(PROMPT)
+    assert answers_pending(PROMPT["roles"])
+    prepare_answers(PROMPT)            # already running
+    release.set()
+    for _ in range(100):
+        if not answers_pending(PROMPT["roles"]):
+            break
+        time.sleep(0.02)
+
+    assert reference_answers(PROMPT["roles"]) is None
+    assert list(store.values()) == [None]
+    prepare_answers(PROMPT)            # known to have none
+    assert len(calls) == 1
+
+
+def test_candidates_realize_every_role():
+    roles = PROMPTS[0]["roles"]        # The man releases the horse.
+    first = next(candidate_sentences(roles))
+    assert first == ("ὁ", "ἄνθρωπος", "λύει", "τόν", "ἵππον")
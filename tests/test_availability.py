@@ -0,0 +1,70 @@
+"""Prompt availability bitsets must agree with a plain set scan."""
+
+import random
+
+import availability
+from availability import (
+    _collect_english_words, _needs_article, get_available_prompts,
+)
+from data import PROMPTS, WORDS, reload_lexicon, translate_english
+from lexicon import Lexicon, compile_lexicon
+from vocabulary import add_to_vocabulary
+
+
+def _scan(vocab: list[str]) -> list[dict]:
+    """Availability as computed before the bitsets."""
+    known = set(vocab)
+    return [prompt for prompt in PROMPTS if prompt.get("roles")
+            and all(not translate_english(eng).isdisjoint(known)
+                    for eng in _collect_english_words(prompt["roles"]))
+            and (not _needs_article(prompt["roles"]) or "ὁ" in known)]
+
+
+def test_random_vocabularies_match_a_scan():
+    rng = random.Random(0)
+    lemmas = list(WORDS)
+    for _ in range(200):
+        vocab = rng.sample(lemmas, rng.randint(0, len(lemmas)))
+        assert get_available_prompts(vocab) == _scan(vocab)
+
+
+def test_learning_updates_the_tracked_set():
+    rng = random.Random(1)
+    lemmas = list(WORDS)
+    rng.shuffle(lemmas)
+    user = {"vocabulary": [], "flashcard_progress": {}}
+    vocab = user["vocabulary"]
+    assert get_available_prompts(vocab) == []
+    tracker = availability._TRACKERS[id(vocab)][1]
+    seen = 0
+    for lemma in lemmas:
+        add_to_vocabulary(user, lemma)
+        assert availability._TRACKERS[id(vocab)][1] is tracker
+        available = get_available_prompts(vocab)
+        assert available == _scan(vocab), lemma
+        seen = max(seen, len(available))
+    assert seen == len(_scan(lemmas)) > 0
+
+
+def test_other_changes_rescan():
+    vocab = list(WORDS)
+    everything = get_available_prompts(vocab)
+    vocab.remove("ὁ")
+    assert get_available_prompts(vocab) == _scan(vocab) != everything
+    vocab.append("ὁ")
+    assert get_available_prompts(vocab) == everything
+
+
+def _compiled(source: dict, tag: str) -> Lexicon:
+    return Lexicon(compile_lexicon(source, tag))
+
+
+def test_gloss_changes_recompile(source):
+    vocab = list(WORDS)
+    before = get_available_prompts(vocab)
+    assert any("horse" in p["english"] for p in before)
+    source["ἵππος"]["translations"] = ["steed"]
+    reload_lexicon(_compiled(source, "steed"))
+    after = get_available_prompts(vocab)
+    assert after == _scan(vocab)
+    assert not any("horse" in p["english"] for p in after)
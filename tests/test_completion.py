@@ -0,0 +1,57 @@
+"""Prefix completion over the form index."""
+
+import pytest
+
+import completion
+from completion import PrefixIndex, get_prefix_index, vocabulary_rank
+from data import get_form_index, reload_lexicon
+from lexicon import Lexicon, compile_lexicon
+
+
+def test_forms_are_unique_sorted_and_grave_free():
+    index = PrefixIndex(["λόγος", "καὶ", "καί", "ἀγαθός"])
+    assert list(index) == ["καί", "λόγος", "ἀγαθός"]
+    assert len(index) == 3
+
+
+@pytest.mark.parametrize("prefix", ["λ", "λύ", "ἀγα", "τ", "ἵππ", "ξξ"])
+def test_complete_finds_every_form_with_the_prefix(prefix):
+    index = get_prefix_index()
+    expected = sorted(f for f in set(index) if f.startswith(prefix))
+    assert index.complete(prefix, limit=10**6) == expected
+
+
+def test_grave_prefix_completes_like_acute():
+    index = get_prefix_index()
+    assert index.complete("λὺ") == index.complete("λύ")
+    assert index.complete("λύ")
+
+
+def test_limit_and_rank():
+    index = PrefixIndex(["λύω", "λύει", "λύσω", "λόγος"])
+    assert index.complete("λ", limit=2) == ["λόγος", "λύει"]
+    assert index.complete("λ", rank=len) == ["λύω", "λύει", "λύσω", "λόγος"]
+
+
+def test_vocabulary_rank_puts_known_lemmas_first():
+    index = get_prefix_index()
+    rank = vocabulary_rank(["λόγος"])
+    matches = index.complete("λ", rank, limit=10**6)
+    forms = get_form_index()
+    known = [any(a[0] == "λόγος" for a in forms[f]) for f in matches]
+    assert known == sorted(known, reverse=True) and known[0]
+
+
+def _compiled(source: dict, tag: str) -> Lexicon:
+    return Lexicon(compile_lexicon(source, tag))
+
+
+def test_reload_rebuilds_only_when_forms_change(source):
+    index = get_prefix_index()
+    source["ἵππος"]["translations"] = ["steed"]
+    reload_lexicon(_compiled(source, "gloss"))
+    assert completion._PREFIX_INDEX is index
+
+    del source["λόγος"]
+    reload_lexicon(_compiled(source, "removed"))
+    assert "λόγος" not in get_prefix_index().complete("λόγ")
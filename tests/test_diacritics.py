@@ -0,0 +1,46 @@
+"""Diacritic variants: same letters as a known form, different marks."""
+
+import data
+from accentuation import strip_diacritics
+from data import (
+    get_form_index, load_lexicon, lookup_diacritic_variants, reload_lexicon,
+)
+from grammar import _unknown_word_message
+from lexicon import Lexicon, compile_lexicon
+
+
+def test_variants_share_letters_and_exclude_the_input():
+    assert lookup_diacritic_variants("ανθρωπος") == ("ἄνθρωπος",)
+    assert lookup_diacritic_variants("ἱππος") == ("ἵππος",)
+    assert lookup_diacritic_variants("λόγος") == ()
+    assert lookup_diacritic_variants("λογὸς") == ("λόγος",)
+    assert lookup_diacritic_variants("ξξξ") == ()
+
+
+def test_every_form_is_grouped_under_its_base_letters():
+    index = get_form_index()
+    grouped = [f for forms in data._BASE_INDEX.values() for f in forms]
+    assert sorted(grouped) == sorted(index)
+    for base, forms in data._BASE_INDEX.items():
+        assert all(strip_diacritics(f) == base for f in forms)
+
+
+def test_unknown_word_message_prefers_diacritics():
+    assert "Check the diacritics" in _unknown_word_message("ανθρωπος")
+    message = _unknown_word_message("ἄνθροπος")
+    assert message.startswith("Unknown word") and "ἄνθρωπος" in message
+
+
+def _compiled(source: dict, tag: str) -> Lexicon:
+    return Lexicon(compile_lexicon(source, tag))
+
+
+def test_reload_matches_a_fresh_base_index(source):
+    del source["λόγος"]
+    reload_lexicon(_compiled(source, "edit"))
+    assert lookup_diacritic_variants("λογος") == ()
+    incremental = {b: sorted(f) for b, f in data._BASE_INDEX.items()}
+    fresh = data._build_base_index(data._build_form_index())
+    assert incremental == {b: sorted(f) for b, f in fresh.items()}
+    reload_lexicon(load_lexicon())
+    assert lookup_diacritic_variants("λογος") == ("λόγος",)
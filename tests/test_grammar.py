@@ -0,0 +1,88 @@
+"""Flat parse trees round-trip through bytes and reject what they can't store."""
+
+import pytest
+
+pytest.importorskip("rich")   # sentences imports ui
+
+from answers import candidate_sentences, sentential_accents  # noqa: E402
+from data import PROMPTS  # noqa: E402
+from grammar import (  # noqa: E402
+    FlatNode, FlatTree, ParseNode, check_sentence, decode_tree, encode_tree,
+)
+from sentences import extract_roles  # noqa: E402
+from ui import display_parse_tree  # noqa: E402
+
+
+def _model_tree(prompt):
+    tokens = sentential_accents(next(candidate_sentences(prompt["roles"])))
+    ok, tree, errors = check_sentence(tokens)
+    assert ok, errors
+    return tree
+
+
+@pytest.mark.parametrize("prompt", PROMPTS[:5], ids=[p["english"] for p in PROMPTS[:5]])
+def test_round_trip_keeps_tree(prompt):
+    tree = _model_tree(prompt)
+    flat = FlatTree.from_bytes(encode_tree(tree).to_bytes())
+    decoded = decode_tree(flat)
+    assert repr(decoded) == repr(tree)
+    assert extract_roles(FlatNode(flat, 0)) == extract_roles(tree)
+
+    def features(node):
+        return [node.features] + [f for c in node.children for f in features(c)]
+    assert features(decoded) == features(tree)
+
+
+def test_flat_nodes_cover_their_tokens():
+    tree = _model_tree(PROMPTS[0])
+    flat = encode_tree(tree)
+
+    def walk(node, flat_node):
+        assert flat_node.symbol == node.symbol
+        assert flat_node.is_leaf() == node.is_leaf()
+        assert flat_node.token == node.token
+        start, end = flat_node.span
+        assert list(flat.tokens[start:end]) == leaves(node)
+        assert len(flat_node.children) == len(node.children)
+        for child, flat_child in zip(node.children, flat_node.children):
+            walk(child, flat_child)
+
+    def leaves(node):
+        return [node.token] if node.is_leaf() else [
+            t for c in node.children for t in leaves(c)]
+
+    walk(tree, flat.root())
+    assert len(flat) == len(flat.symbols)
+    assert len(flat.feature_table) <= len(flat)
+
+
+def test_flat_tree_displays_like_the_tree(capsys):
+    tree = _model_tree(PROMPTS[0])
+    display_parse_tree(tree)
+    expected = capsys.readouterr().out
+    display_parse_tree(encode_tree(tree))
+    assert capsys.readouterr().out == expected
+
+
+def test_flat_trees_compare_by_identity():
+    tree = encode_tree(ParseNode("N", {"case": "nom"}, token="ἵππος"))
+    twin = FlatTree.from_bytes(tree.to_bytes())
+    assert tree != twin
+    assert tree.to_bytes() == twin.to_bytes()
+    assert len({tree, twin}) == 2
+
+
+def test_feature_dicts_are_not_a_field():
+    tree = encode_tree(ParseNode("N", {"case": "nom"}, token="ἵππος"))
+    assert tree.features(0) == {"case": "nom"}
+    assert "_feature_dicts" not in repr(tree)
+
+
+@pytest.mark.parametrize("node", [
+    ParseNode("N", {"number": 1}, token="ἵππος"),
+    ParseNode("N", {"case": None}, token="ἵππος"),
+    ParseNode("N", {"case": "nom"}, token="ἵπ\0πος"),
+])
+def test_to_bytes_rejects_unstorable_strings(node):
+    with pytest.raises(ValueError):
+        encode_tree(node).to_bytes()
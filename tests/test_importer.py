@@ -0,0 +1,67 @@
+"""Streaming importer: bad records are reported, never abort the import."""
+
+import json
+
+import pytest
+
+from importer import import_lexicon, validate_record
+from lexicon import Lexicon, load_lexicon
+
+RECORDS = [
+    {"lemma": "λύω", "pos": "verb", "gloss": "loosen, release",
+     "forms": {"pres_act_ind_1sg": "λύω", "pres_act_ind_3sg": "λύει"}},
+    {"lemma": "ἵππος", "pos": "noun", "gloss": "horse", "gender": "masculine",
+     "forms": [["ἵππος", "n-s---mn-"], ["ἵππον", "n-s---ma-"]]},
+    {"lemma": "λόγος", "pos": "noun", "gloss": "word", "gender": "masculine",
+     "frequency": 3.5, "forms": {"nom_sg": "λόγος"}},
+    {"lemma": "καί", "pos": "conjunction", "gloss": "and"},
+]
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "small.jsonl"
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n"
+                            for r in RECORDS), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_unstorable_value_rejects_only_its_entry(source, tmp_path, workers):
+    out = tmp_path / "small.lexicon"
+    report = import_lexicon(source, out, workers=workers)
+    assert report.entries == 3
+    assert report.rejected_entries == 1
+    assert any("λόγος" in e and "frequency" in e for e in report.errors)
+
+    lex = Lexicon.open(out)
+    assert sorted(lex) == sorted(["λύω", "ἵππος", "καί"])
+    assert dict(lex["ἵππος"]["forms"])["acc_sg"] == "ἵππον"
+    assert lex["καί"]["forms"]["base"] == "καί"
+
+
+def test_bad_forms_are_dropped_with_an_error():
+    item, errors, rejected = validate_record(
+        {"lemma": "ἵππος", "pos": "noun", "gloss": "horse",
+         "gender": "masculine",
+         "forms": {"nom_sg": "ἵππος", "nom_du": "ἵππω"}})
+    assert item is not None and list(item[1]["forms"]) == ["nom_sg"]
+    assert rejected == 1 and "nom_du" in errors[0]
+
+
+def test_missing_gloss_rejects_the_entry():
+    item, errors, _ = validate_record({"lemma": "λύω", "pos": "verb"})
+    assert item is None and "missing gloss" in errors[0]
+
+
+def test_load_lexicon_opens_an_import_as_is(source, tmp_path):
+    out = tmp_path / "small.lexicon"
+    import_lexicon(source, out, workers=0)
+    before = (out.read_bytes(), out.stat().st_mode)
+
+    lex = load_lexicon(out)
+    assert sorted(lex) == sorted(["λύω", "ἵππος", "καί"])
+    assert (out.read_bytes(), out.stat().st_mode) == before
+
+    with pytest.raises(OSError):
+        load_lexicon(tmp_path / "missing.lexicon")
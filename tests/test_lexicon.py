@@ -0,0 +1,137 @@
+"""Compiled lexicon: views, partitions and swapping."""
+
+import pytest
+
+import lexicon
+import words
+from lexicon import (
+    Lexicon, StaleViewError, compile_lexicon, diff_lexicons, entry_fingerprint,
+    load_lexicon,
+)
+from paradigms import forms_of
+
+
+def _compiled(source: dict, tag: str = "test") -> Lexicon:
+    return Lexicon(compile_lexicon(source, tag))
+
+
+@pytest.fixture
+def pair():
+    source = dict(words.WORDS)
+    smaller = {lemma: entry for lemma, entry in source.items()
+               if lemma != "ἄνθρωπος"}
+    return _compiled(source, "full"), _compiled(smaller, "smaller")
+
+
+def test_views_taken_before_a_swap_raise(pair):
+    lex, other = pair
+    entry = lex["λύω"]
+    stored = lex["ἄνθρωπος"]["forms"]   # decoded from the file
+    generated = entry["forms"]          # generated from principal parts
+    assert generated["pres_act_ind_3sg"] == "λύει"
+    assert stored["gen_sg"] == "ἀνθρώπου"
+
+    lex.swap(other)
+    for read in (lambda: entry["pos"], lambda: generated["pres_act_ind_3sg"],
+                 lambda: len(generated), lambda: stored["gen_sg"],
+                 lambda: dict(generated)):
+        with pytest.raises(StaleViewError):
+            read()
+
+    assert "ἄνθρωπος" not in lex
+    assert lex["λύω"]["forms"]["pres_act_ind_3sg"] == "λύει"
+    assert other["ἄνθρωπος"]["forms"]["gen_sg"] == "ἀνθρώπου"
+
+
+def test_partitions_follow_a_swap(pair):
+    lex, other = pair
+    nouns = lex.partition("noun")
+    count = len(nouns)
+    assert "ἄνθρωπος" in nouns
+    lex.swap(other)
+    assert len(nouns) == count - 1
+    assert "ἄνθρωπος" not in nouns
+    assert nouns["ἵππος"]["pos"] == "noun"
+
+
+def _plain(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def test_compiled_entries_match_the_source():
+    lex = _compiled(words.WORDS)
+    assert list(lex) == list(words.WORDS)
+    for i, (lemma, source) in enumerate(words.WORDS.items()):
+        entry = lex[lemma]
+        # Principal-parts entries gain generated forms.
+        assert set(entry) == set(source) | {"forms"}, lemma
+        for key, value in source.items():
+            if key != "forms":
+                assert entry[key] == _plain(value), (lemma, key)
+                assert type(entry[key]) is type(_plain(value)), (lemma, key)
+        assert dict(entry["forms"]) == forms_of(source), lemma
+        assert lex.position(lemma) == i
+        assert lex.fingerprint(i) == entry_fingerprint(source)
+
+
+def test_stored_value_types_round_trip():
+    source = {
+        "α": {"pos": "noun", "declension": 0, "big": 2**32 - 1,
+              "deponent": False, "translations": [], "forms": {}},
+        "β": {"pos": "noun", "translations": ["one", "two"],
+              "forms": {"nom_sg": "β"}, "participles": True},
+        "γ": {"meaning": "no pos"},
+    }
+    lex = _compiled(source)
+    for lemma, entry in source.items():
+        assert {k: _plain(v) for k, v in entry.items()} == {
+            k: (dict(v) if k == "forms" else v) for k, v in lex[lemma].items()}
+    assert "δ" not in lex and lex.position("δ") == -1
+    with pytest.raises(KeyError):
+        lex["δ"]
+    assert list(lex.entries_of("noun")) == [0, 1]
+    assert list(lex.partition("noun")) == ["α", "β"]
+    assert "γ" not in lex.partition("noun")
+
+
+def test_partitions_are_in_source_order():
+    lex = _compiled(words.WORDS)
+    by_pos: dict[str, list[str]] = {}
+    for lemma, entry in words.WORDS.items():
+        by_pos.setdefault(entry["pos"], []).append(lemma)
+    for pos, lemmas in by_pos.items():
+        assert [lex.lemma(i) for i in lex.entries_of(pos)] == lemmas
+        assert list(lex.partition(pos)) == lemmas
+    mixed = lex.partition("noun", "adjective")
+    assert list(mixed) == [l for l, e in words.WORDS.items()
+                           if e["pos"] in ("noun", "adjective")]
+    assert "λύω" not in mixed
+    with pytest.raises(KeyError):
+        mixed["λύω"]
+    assert len(lex.partition("interjection")) == 0
+
+
+def test_diff_lexicons():
+    source = dict(words.WORDS)
+    changed = dict(source)
+    del changed["ἄνθρωπος"]
+    changed["λύω"] = {**source["λύω"], "meaning": "release"}
+    changed["νέος"] = {"pos": "adjective", "meaning": "new", "forms": {}}
+    assert diff_lexicons(_compiled(source), _compiled(changed)) == (
+        ["νέος"], ["λύω"], ["ἄνθρωπος"])
+
+
+def test_rejects_other_formats():
+    blob = bytearray(compile_lexicon(words.WORDS, "test"))
+    blob[:4] = b"XXXX"
+    with pytest.raises(ValueError):
+        Lexicon(bytes(blob))
+
+
+def test_stale_build_is_recompiled(tmp_path, monkeypatch):
+    path = tmp_path / "lexicon.bin"
+    monkeypatch.setattr(lexicon, "LEXICON_FILE", path)
+    path.write_bytes(compile_lexicon({"α": {"pos": "noun"}}, "old digest"))
+    lex = load_lexicon(path)
+    assert list(lex) == list(words.WORDS)
+    assert load_lexicon(path).digest == lex.digest
@@ -0,0 +1,88 @@
+"""The paradigm engine must reproduce the hand-written tables it replaced.
+
+``data/paradigm_tables.json`` holds the ``forms`` tables the lexicon
+spelled out before entries switched to principal parts.  Generation has
+to give exactly those cells and spellings: an extra cell is a new
+homograph for the parser.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import words
+from data import WORDS, lookup_form
+from paradigms import MACRON, forms_of, inflect
+
+TABLES = json.loads((Path(__file__).parent / "data" / "paradigm_tables.json")
+                    .read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("lemma", sorted(TABLES))
+def test_generated_forms_match_the_old_table(lemma):
+    assert forms_of(words.WORDS[lemma]) == TABLES[lemma]
+    assert dict(WORDS[lemma]["forms"]) == TABLES[lemma]
+
+
+def test_participles_only_where_asked_for():
+    with_participles = {lemma for lemma, entry in words.WORDS.items()
+                        if entry.get("participles")}
+    for lemma in TABLES:
+        has = any("_ptcp_" in key for key in WORDS[lemma]["forms"])
+        assert has == (lemma in with_participles), lemma
+    assert len(lookup_form("παιδεύουσι")) == 1
+
+
+
+@pytest.mark.parametrize("entry, expected", [
+    # Short final alpha: recessive nominative, accent pulled to the penult.
+    ({"pos": "noun", "gender": "feminine", "declension": 1,
+      "principal_parts": ["θάλαττα", "θαλάττης"]},
+     {"nom_sg": "θάλαττα", "acc_sg": "θάλατταν", "dat_sg": "θαλάττῃ",
+      "gen_pl": "θαλαττῶν", "nom_pl": "θάλατται"}),
+    # A macron marks the alpha long; it is not written in the output.
+    ({"pos": "noun", "gender": "feminine", "declension": 1,
+      "principal_parts": ["χώρᾱ", "χώρᾱς"]},
+     {"nom_sg": "χώρα", "gen_sg": "χώρας", "dat_sg": "χώρᾳ",
+      "nom_pl": "χῶραι", "gen_pl": "χωρῶν"}),
+    ({"pos": "noun", "gender": "neuter", "declension": 2,
+      "principal_parts": ["δῶρον", "δώρου"]},
+     {"nom_sg": "δῶρον", "dat_sg": "δώρῳ", "nom_pl": "δῶρα",
+      "gen_pl": "δώρων"}),
+    ({"pos": "adjective", "principal_parts": ["καλός", "καλή", "καλόν"]},
+     {"gen_sg_masc": "καλοῦ", "gen_pl_fem": "καλῶν", "dat_pl_fem": "καλαῖς",
+      "nom_pl_neut": "καλά"}),
+    ({"pos": "verb", "principal_parts": ["παύω", "παύσω", "ἔπαυσα"]},
+     {"pres_act_ind_3sg": "παύει", "impf_act_ind_1pl": "ἐπαύομεν",
+      "aor_act_ind_3sg": "ἔπαυσε", "pres_mid_ind_2sg": "παύῃ",
+      "aor_mid_ind_1sg": "ἐπαυσάμην", "pres_act_inf": "παύειν"}),
+], ids=["θάλαττα", "χώρα", "δῶρον", "καλός", "παύω"])
+def test_new_lemmas_inflect(entry, expected):
+    forms = inflect(entry)
+    assert {key: forms.get(key) for key in expected} == expected
+    assert not any(MACRON in form for form in forms.values())
+
+
+def test_participles_flag_adds_only_participle_cells():
+    entry = {"pos": "verb", "principal_parts": ["παύω", "παύσω", "ἔπαυσα"]}
+    plain = inflect(entry)
+    full = inflect({**entry, "participles": True})
+    added = set(full) - set(plain)
+    assert added and all("_ptcp_" in key for key in added)
+    assert {key: full[key] for key in plain} == plain
+    assert full["pres_act_ptcp_nom_sg_masc"] == "παύων"
+
+
+def test_overrides_replace_generated_cells():
+    entry = {"pos": "verb", "principal_parts": ["παύω", "παύσω", "ἔπαυσα"],
+             "forms": {"aor_act_ind_3sg": "ἔπαυσεν"}}
+    forms = forms_of(entry)
+    assert forms["aor_act_ind_3sg"] == "ἔπαυσεν"
+    assert forms_of(entry, {})["aor_act_ind_3sg"] == "ἔπαυσε"
+    assert forms_of({"pos": "preposition", "forms": {"": "ἐν"}}) == {"": "ἐν"}
+
+
+def test_unknown_part_of_speech_raises():
+    with pytest.raises(ValueError):
+        inflect({"pos": "preposition", "principal_parts": ["ἐν"]})
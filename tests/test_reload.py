@@ -0,0 +1,72 @@
+"""Hot reload: incremental index updates must match a fresh build."""
+
+import copy
+
+import data
+from data import WORDS, lookup_form, reload_lexicon
+from lexicon import Lexicon, compile_lexicon
+
+
+def _compiled(source: dict, tag: str) -> Lexicon:
+    return Lexicon(compile_lexicon(source, tag))
+
+
+def test_reload_updates_lookups(source):
+    source["ἵππος"]["translations"] = ["steed"]
+    del source["λόγος"]
+    change = reload_lexicon(_compiled(source, "edit"))
+    assert change.changed == ("ἵππος",) and change.removed == ("λόγος",)
+    assert lookup_form("λόγος") == []
+    assert data.translate_english("steed") == {"ἵππος"}
+    assert not data.translate_english("horse")
+
+
+def test_reload_keeps_analyses_in_lemma_order(source):
+    # A later homograph of ἵππος, then an edit to ἵππος itself: its
+    # analyses must stay ahead of the newcomer's, as in a fresh build.
+    twin = dict(copy.deepcopy(source["ἵππος"]), lemma="ἵππος²",
+                translations=["horse"])
+    source["ἵππος²"] = twin
+    reload_lexicon(_compiled(source, "twin"))
+    source["ἵππος"]["meaning"] = "a horse"
+    change = reload_lexicon(_compiled(source, "edit"))
+    assert change.changed == ("ἵππος",)
+
+    assert [a[0] for a in lookup_form("ἵππον")] == ["ἵππος", "ἵππος²"]
+    assert data._FORM_INDEX == data._build_form_index()
+    assert data._ENGLISH_TO_GREEK == data._build_english_to_greek()
+    assert len(WORDS) == len(source)
+
+
+def test_mixed_edits_match_a_fresh_build(source):
+    data.get_reading_index()
+    seen = []
+    data.on_reload(seen.append)
+    try:
+        # Add a verb, make ἵππος the mare, remove an adjective.
+        source["παύω"] = {"lemma": "παύω", "pos": "verb", "meaning": "I stop",
+                          "translations": ["stop"], "conjugation": "thematic",
+                          "principal_parts": ["παύω", "παύσω", "ἔπαυσα"]}
+        source["ἵππος"]["gender"] = "feminine"
+        source["ἵππος"]["translations"] = ["mare"]
+        del source["ἀγαθός"]
+        change = reload_lexicon(_compiled(source, "mixed"))
+    finally:
+        data._RELOAD_LISTENERS.remove(seen.append)
+
+    assert seen == [change]
+    assert change.added == ("παύω",)
+    assert change.changed == ("ἵππος",)
+    assert change.removed == ("ἀγαθός",)
+    assert "παύει" in change.forms_added and "ἀγαθόν" in change.forms_removed
+    assert "ἵππον" in change.forms_changed
+    assert {"stop", "mare", "horse", "good"} <= change.glosses
+
+    assert data._FORM_INDEX == data._build_form_index()
+    assert data._ENGLISH_TO_GREEK == data._build_english_to_greek()
+    assert data._READING_INDEX == data._build_reading_index()
+    assert data.form_of("παύω", tense="pres", voice="act", mood="ind",
+                        person="3", number="sg") == "παύει"
+    assert data.form_of("ἀγαθός", case="nom", number="sg",
+                        gender="masc") is None
+    assert {a[2]["gender"] for a in lookup_form("ἵππον")} == {"fem"}
@@ -0,0 +1,34 @@
+"""Every built-in prompt's model answer must keep grading as correct.
+
+New forms in the lexicon (generated participles, say) add homographs the
+parser has to disambiguate; this catches one that breaks a prompt.
+"""
+
+import pytest
+
+pytest.importorskip("rich")   # sentences imports ui
+
+import answers  # noqa: E402
+from answers import candidate_sentences, roles_key, sentential_accents  # noqa: E402
+from data import PROMPTS  # noqa: E402
+from sentences import analyze_sentence, grade_sentence  # noqa: E402
+
+
+@pytest.mark.parametrize("prompt", PROMPTS, ids=[p["english"] for p in PROMPTS])
+def test_model_answer_is_correct(prompt):
+    roles = prompt["roles"]
+    candidate = next(candidate_sentences(roles), None)
+    assert candidate is not None, "no Greek realizes the prompt's roles"
+    tokens = sentential_accents(candidate)
+    analysis = grade_sentence(tokens, roles)
+    assert analysis.correct, (" ".join(tokens), analysis.errors)
+
+
+def test_stored_answer_is_shown_with_its_tree(monkeypatch):
+    prompt = PROMPTS[0]
+    store = answers.build_reference_answers([prompt])
+    monkeypatch.setattr(answers, "_ANSWERS", store)
+    model = store[roles_key(prompt["roles"])].model.split()
+    analysis = analyze_sentence(model, prompt["roles"])
+    assert analysis.correct
+    assert analysis.tree is not None
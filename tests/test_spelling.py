@@ -0,0 +1,93 @@
+"""Misspelling suggestions: the deletion index must agree with a scan."""
+
+import random
+
+import spelling
+from data import get_form_index, reload_lexicon
+from lexicon import Lexicon, compile_lexicon
+from spelling import DeletionIndex, edit_distance, get_spelling_index, suggest_forms
+
+LETTERS = "αβγδεζηθικλμνξοπρστυφχψωάέίόύήώ"
+
+
+def _osa(a: str, b: str) -> int:
+    """Unbanded optimal string alignment distance, for reference."""
+    d = [[i + j if not i * j else 0 for j in range(len(b) + 1)]
+         for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1,
+                          d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+
+def _misspell(rng: random.Random, word: str) -> str:
+    w = list(word)
+    for _ in range(rng.randint(0, 3)):
+        op, i = rng.randrange(4), rng.randrange(len(w) + 1)
+        if op == 0:
+            w.insert(i, rng.choice(LETTERS))
+        elif op == 1 and i < len(w):
+            del w[i]
+        elif op == 2 and i < len(w):
+            w[i] = rng.choice(LETTERS)
+        elif op == 3 and i + 1 < len(w):
+            w[i], w[i + 1] = w[i + 1], w[i]
+    return "".join(w)
+
+
+def test_edit_distance_matches_reference():
+    rng = random.Random(0)
+    forms = list(get_form_index())
+    for _ in range(500):
+        a, b = _misspell(rng, rng.choice(forms)), rng.choice(forms)
+        for limit in (1, 2, 3):
+            assert edit_distance(a, b, limit) == min(_osa(a, b), limit + 1)
+    assert edit_distance("λόγος", "λγόος", 2) == 1   # transposition
+
+
+def test_lookup_matches_a_full_scan():
+    rng = random.Random(1)
+    forms = list(get_form_index())
+    index = DeletionIndex(forms)
+    for _ in range(200):
+        word = _misspell(rng, rng.choice(forms))
+        scan = sorted(((f, d) for f in index.forms
+                       if (d := edit_distance(word, f, 2)) <= 2),
+                      key=lambda pair: (pair[1], pair[0]))
+        assert index.lookup(word) == scan, word
+
+
+def test_add_and_discard():
+    index = DeletionIndex(["λόγος", "λόγου"])
+    index.discard("λόγου")
+    index.discard("λόγου")
+    assert index.lookup("λόγοω") == [("λόγος", 1)]
+    index.add("λόγου")
+    index.add("λόγου")
+    assert index.lookup("λόγοω") == [("λόγος", 1), ("λόγου", 1)]
+    assert index.lookup("λόγοω", max_distance=0) == []
+
+
+def test_suggestions_exclude_the_word_itself():
+    assert suggest_forms("ἄνθροπος")[0] == "ἄνθρωπος"
+    assert "ἄνθρωπος" not in suggest_forms("ἄνθρωπος")
+    assert len(suggest_forms("ἄνθρωπος", limit=2)) == 2
+
+
+def _compiled(source: dict, tag: str) -> Lexicon:
+    return Lexicon(compile_lexicon(source, tag))
+
+
+def test_reload_updates_the_index_in_place(source):
+    index = get_spelling_index()
+    del source["λόγος"]
+    source["λόγιος"] = {"lemma": "λόγιος", "pos": "adjective",
+                        "meaning": "eloquent", "translations": ["eloquent"],
+                        "principal_parts": ["λόγιος", "λογία", "λόγιον"]}
+    reload_lexicon(_compiled(source, "edit"))
+    assert spelling._SPELLING_INDEX is index
+    live = sorted(f for f in index.forms if f is not None)
+    assert live == DeletionIndex(get_form_index()).forms
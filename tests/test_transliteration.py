@@ -0,0 +1,91 @@
+"""ASCII input: exact Beta Code, and Latin-scheme input that never
+resolves to a wrong unaccented form."""
+
+import unicodedata
+
+import pytest
+
+import transliteration
+from data import get_form_index, reload_lexicon
+from grammar import _unknown_word_message
+from lexicon import Lexicon, compile_lexicon
+from transliteration import (
+    BETA_LETTERS, BETA_MARKS, ascii_key, beta_to_greek, get_key_index,
+    is_ascii_word, latin_to_greek, to_greek, transliteration_candidates,
+)
+
+_TO_BETA = {greek: beta for beta, greek in {**BETA_LETTERS, **BETA_MARKS}.items()}
+_TO_BETA["ς"] = "s"
+
+
+def _beta(form: str) -> str:
+    return "".join(_TO_BETA[c] for c in unicodedata.normalize("NFD", form))
+
+
+def test_unique_match_becomes_the_form():
+    assert to_greek("anthropos") == "ἄνθρωπος"
+    assert to_greek("ho") == "ὁ"
+
+
+def test_beta_code_is_exact():
+    assert to_greek("a)/nqrwpos") == "ἄνθρωπος"
+
+
+def test_candidates_differing_in_accent_settle_eta():
+    # ψυχή or ψυχῇ: the letters agree, so ε becomes η; accents are the
+    # learner's to add.
+    assert set(transliteration_candidates("psuche")) == {"ψυχή", "ψυχῇ"}
+    assert to_greek("psuche") == "ψυχη"
+    assert "ψυχή" in _unknown_word_message("ψυχη")
+
+
+def test_candidates_differing_in_letters_stay_unresolved():
+    # τόν / τῶν and ἵππον / ἵππων differ in ο/ω.
+    for token, forms in (("ton", {"τόν", "τῶν"}),
+                         ("hippon", {"ἵππον", "ἵππων"})):
+        assert set(transliteration_candidates(token)) == forms
+        assert to_greek(token) == token
+        message = _unknown_word_message(token)
+        assert all(form in message for form in forms)
+
+
+def test_unknown_word_is_converted_letter_for_letter():
+    assert transliteration_candidates("xyzon") == ()
+    assert to_greek("xyzon") == "ξυζον"
+
+
+def test_every_known_form_round_trips_through_beta_code():
+    for form in get_form_index():
+        assert beta_to_greek(_beta(form)) == form, form
+        assert to_greek(_beta(form)) == form, form
+
+
+@pytest.mark.parametrize("latin, greek", [
+    ("hippos", "ἱππος"), ("oikos", "οἰκος"), ("eis", "εἰς"),
+    ("anthropos", "ἀνθροπος"), ("psuche", "ψυχε"), ("ēchō", "ἠχω"),
+    ("thalatta", "θαλαττα"),
+])
+def test_latin_scheme_letters_and_breathings(latin, greek):
+    assert latin_to_greek(latin) == greek
+
+
+def test_greek_tokens_pass_through():
+    assert not is_ascii_word("λόγος")
+    assert is_ascii_word("ēchō")
+    assert to_greek("λόγος") == "λόγος"
+
+
+def _compiled(source: dict, tag: str) -> Lexicon:
+    return Lexicon(compile_lexicon(source, tag))
+
+
+def test_reload_matches_a_fresh_key_index(source):
+    get_key_index()
+    del source["λόγος"]
+    reload_lexicon(_compiled(source, "edit"))
+    assert transliteration_candidates("logos") == ()
+    incremental = {k: sorted(v) for k, v in get_key_index().items()}
+    transliteration._KEY_INDEX = None
+    fresh = {k: sorted(v) for k, v in get_key_index().items()}
+    assert incremental == fresh
+    assert all(ascii_key(f) == k for k, forms in fresh.items() for f in forms)
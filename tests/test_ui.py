@@ -0,0 +1,26 @@
+"""Flashcards read one entry's forms without building the form index."""
+
+import pytest
+
+pytest.importorskip("rich")
+
+import data  # noqa: E402
+import ui  # noqa: E402
+
+
+def test_lemma_forms_match_form_of():
+    data.get_form_index()
+    for lemma in data.WORDS:
+        lid = data.lemma_id(lemma)
+        expected = {packed: form for (i, packed), form
+                    in data._FORWARD_INDEX.items() if i == lid}
+        assert data.lemma_forms(lemma) == expected, lemma
+
+
+@pytest.mark.parametrize("lemma", ["ἄνθρωπος", "λύω", "ἀγαθός", "ὁ", "ἐν"])
+def test_flashcard_does_not_build_form_index(monkeypatch, capsys, lemma):
+    monkeypatch.setattr(data, "_FORM_INDEX", None)
+    monkeypatch.setattr(data, "get_form_index", lambda: pytest.fail("index built"))
+    ui.display_flashcard(lemma, revealed=True)
+    assert data._FORM_INDEX is None
+    assert capsys.readouterr().out
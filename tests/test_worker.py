@@ -0,0 +1,84 @@
+"""The background analysis worker and the prompt it draws its results under."""
+
+import time
+
+import pytest
+
+pytest.importorskip("rich")   # sentences imports ui
+
+import sentences  # noqa: E402
+from data import PROMPTS  # noqa: E402
+
+
+def test_worker_reports_errors_and_keeps_running(monkeypatch):
+    real = sentences.analyze_sentence
+    calls = []
+
+    def flaky(tokens, *args):
+        calls.append(tokens)
+        if len(calls) == 1:
+            raise RuntimeError("parser bug")
+        return real(tokens, *args)
+
+    monkeypatch.setattr(sentences, "analyze_sentence", flaky)
+    worker = sentences.AnalysisWorker(PROMPTS[0]["roles"])
+    try:
+        worker.submit(["ὁ"])
+        failed = worker.wait(5)
+        assert failed is not None and not failed.correct
+        assert "parser bug" in failed.errors[0]
+
+        worker.submit(["ὁ", "ἄνθρωπος", "λύει", "τὸν", "ἵππον"])
+        analysis = worker.wait(5)
+        assert analysis is not None and analysis.correct
+    finally:
+        worker.close()
+
+
+def test_cancel_discards_the_pending_result():
+    worker = sentences.AnalysisWorker(None)
+    try:
+        worker.submit(["ὁ", "ἄνθρωπος"])
+        worker.cancel()
+        assert worker.wait(0.2) is None
+    finally:
+        worker.close()
+
+
+def test_result_is_drawn_above_the_active_prompt(monkeypatch):
+    drawn = []
+    monkeypatch.setattr(sentences, "_show_above_prompt", drawn.append)
+
+    def typing(prompt_text):
+        # The prompt is up (and readline active) while the parse runs.
+        assert prompt_text == sentences.GREEK_PROMPT
+        for _ in range(100):
+            if drawn:
+                break
+            time.sleep(0.05)
+        return "back"
+
+    monkeypatch.setattr(sentences, "prompt_input", typing)
+    worker = sentences.AnalysisWorker(PROMPTS[0]["roles"])
+    try:
+        worker.submit(["ὁ", "ἄνθρωπος", "λύει", "τὸν", "ἵππον"])
+        line, shown = sentences._read_input(worker, [], pending=True)
+    finally:
+        worker.close()
+    assert line == "back"
+    assert shown is drawn[0] and shown.correct
+
+
+def test_nothing_is_drawn_after_the_line_is_entered(monkeypatch):
+    drawn = []
+    monkeypatch.setattr(sentences, "_show_above_prompt", drawn.append)
+    monkeypatch.setattr(sentences, "prompt_input", lambda prompt_text: "quit")
+    worker = sentences.AnalysisWorker(PROMPTS[0]["roles"])
+    try:
+        line, shown = sentences._read_input(worker, [], pending=True)
+        worker.submit(["ὁ", "ἄνθρωπος"])
+        worker.wait(5)
+        time.sleep(2 * sentences.ANALYSIS_POLL)
+    finally:
+        worker.close()
+    assert (line, shown, drawn) == ("quit", None, [])
@@ -0,0 +1,174 @@
+"""ASCII input: Beta Code and a simple Latin transliteration.
+
+Beta Code (lowercase TLG conventions, ``*`` for capitals) is exact:
+``a)/nqrwpos`` → ἄνθρωπος.  The Latin scheme (``anthropos``, ``hippos``,
+``psuche``) carries no accents, so it is resolved through a key index:
+every known form is filed under its ASCII key, and a token whose key
+matches exactly one form becomes that form.  When several forms match
+and differ only in accents, the token takes their letters (η and ω
+settled) and the accents are left to the parser's diacritic feedback;
+when they differ in letters too (``hippon``: ἵππον or ἵππων) the token
+stays as typed and the parser lists the candidates.  A token matching
+no form is converted letter for letter and left to the spelling
+feedback.
+
+Both converters are single passes over precompiled tables, cheap enough
+to run on every keystroke.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+from accentuation import strip_diacritics
+from data import LexiconChange, get_form_index, on_reload
+
+BETA_LETTERS = {
+    "a": "α", "b": "β", "g": "γ", "d": "δ", "e": "ε", "z": "ζ", "h": "η",
+    "q": "θ", "i": "ι", "k": "κ", "l": "λ", "m": "μ", "n": "ν", "c": "ξ",
+    "o": "ο", "p": "π", "r": "ρ", "s": "σ", "t": "τ", "u": "υ", "f": "φ",
+    "x": "χ", "y": "ψ", "w": "ω",
+}
+BETA_MARKS = {
+    ")": "\u0313", "(": "\u0314", "/": "\u0301", "\\": "\u0300",
+    "=": "\u0342", "|": "\u0345", "+": "\u0308",
+}
+
+# Longest match first: digraphs before single letters.
+LATIN_LETTERS = {
+    "th": "θ", "ph": "φ", "ch": "χ", "kh": "χ", "ps": "ψ", "ks": "ξ",
+    "rh": "ρ",
+    "a": "α", "b": "β", "g": "γ", "d": "δ", "e": "ε", "ē": "η", "ê": "η",
+    "z": "ζ", "h": "η", "i": "ι", "k": "κ", "c": "κ", "l": "λ", "m": "μ",
+    "n": "ν", "x": "ξ", "o": "ο", "ō": "ω", "ô": "ω", "w": "ω", "p": "π",
+    "r": "ρ", "s": "σ", "t": "τ", "u": "υ", "y": "υ", "f": "φ",
+}
+KEY_LETTERS = {
+    "α": "a", "β": "b", "γ": "g", "δ": "d", "ε": "e", "ζ": "z", "η": "e",
+    "θ": "th", "ι": "i", "κ": "k", "λ": "l", "μ": "m", "ν": "n", "ξ": "x",
+    "ο": "o", "π": "p", "ρ": "r", "σ": "s", "ς": "s", "τ": "t", "υ": "u",
+    "φ": "ph", "χ": "ch", "ψ": "ps", "ω": "o",
+}
+
+_BETA_TOKEN = re.compile(r"\*?[)(/\\=|+]*[a-z][)(/\\=|+]*", re.IGNORECASE)
+_BETA_SIGNS = set(BETA_MARKS) | {"*"}
+_LATIN = re.compile("|".join(sorted(map(re.escape, LATIN_LETTERS),
+                                    key=len, reverse=True)))
+_FINAL_SIGMA = re.compile(r"σ(?![\u0300-\u036f\u0370-\u03ff\u1f00-\u1fff])")
+_KEY_TABLE = str.maketrans(KEY_LETTERS)
+
+
+def _final_sigma(text: str) -> str:
+    return _FINAL_SIGMA.sub("ς", text)
+
+
+def is_ascii_word(token: str) -> bool:
+    """True when *token* has ASCII letters to transliterate."""
+    if any(c in "ēêōô" for c in token):
+        return True
+    return token.isascii() and any(c.isalpha() for c in token)
+
+
+def beta_to_greek(text: str) -> str:
+    """Convert Beta Code to NFC Greek."""
+    def letter(match: re.Match) -> str:
+        chunk = match.group()
+        base = BETA_LETTERS.get(chunk.lstrip("*)(/\\=|+")[0].lower(), "")
+        if chunk.startswith("*"):
+            base = base.upper()
+        return base + "".join(BETA_MARKS[c] for c in chunk if c in BETA_MARKS)
+
+    greek = _BETA_TOKEN.sub(letter, text)
+    return unicodedata.normalize("NFC", _final_sigma(greek))
+
+
+def latin_to_greek(text: str) -> str:
+    """Convert the Latin scheme to unaccented NFC Greek.
+
+    An initial ``h`` before a vowel is a rough breathing; other vowels at
+    the start of a word take a smooth breathing.
+    """
+    text = text.lower()
+    rough = text.startswith("h") and len(text) > 1 and text[1] in "aeiouyēêōôw"
+    greek = _LATIN.sub(lambda m: LATIN_LETTERS[m.group()],
+                       text[1:] if rough else text)
+    if greek and greek[0] in "αεηιουω":
+        # Breathing goes on the second vowel of an initial diphthong.
+        at = 2 if greek[:2] in ("αι", "ει", "οι", "υι", "αυ", "ευ", "ηυ",
+                                "ου") else 1
+        greek = greek[:at] + ("\u0314" if rough else "\u0313") + greek[at:]
+    return unicodedata.normalize("NFC", _final_sigma(greek))
+
+
+def ascii_key(word: str) -> str:
+    """Lossy ASCII key of a Greek word: no diacritics, η/ε and ω/ο merged."""
+    return strip_diacritics(word).lower().translate(_KEY_TABLE)
+
+
+_KEY_INDEX: dict[str, tuple[str, ...]] | None = None
+
+
+def get_key_index() -> dict[str, tuple[str, ...]]:
+    """Return ASCII key → known forms, building it once from the form index."""
+    global _KEY_INDEX
+    if _KEY_INDEX is None:
+        groups: dict[str, list[str]] = {}
+        for form in get_form_index():
+            groups.setdefault(ascii_key(form), []).append(form)
+        _KEY_INDEX = {key: tuple(forms) for key, forms in groups.items()}
+    return _KEY_INDEX
+
+
+@on_reload
+def _update_key_index(change: LexiconChange) -> None:
+    if _KEY_INDEX is None:
+        return
+    for form in change.forms_removed:
+        key = ascii_key(form)
+        rest = tuple(f for f in _KEY_INDEX.get(key, ()) if f != form)
+        if rest:
+            _KEY_INDEX[key] = rest
+        else:
+            _KEY_INDEX.pop(key, None)
+    for form in change.forms_added:
+        key = ascii_key(form)
+        _KEY_INDEX[key] = _KEY_INDEX.get(key, ()) + (form,)
+
+
+def transliteration_candidates(token: str) -> tuple[str, ...]:
+    """Return the known forms a Latin-scheme *token* could stand for."""
+    return get_key_index().get(ascii_key(latin_to_greek(token)), ())
+
+
+def _spell_as(greek: str, letters: str) -> str:
+    """*greek* with its base letters replaced by *letters*, marks kept."""
+    decomposed = unicodedata.normalize("NFD", greek)
+    if sum(not unicodedata.combining(c) for c in decomposed) != len(letters):
+        return letters
+    replacements = iter(letters)
+    return unicodedata.normalize("NFC", "".join(
+        c if unicodedata.combining(c) else next(replacements)
+        for c in decomposed))
+
+
+def to_greek(token: str) -> str:
+    """Turn an ASCII *token* into Greek; Greek tokens pass through.
+
+    A Latin-scheme token matching known forms that differ in letters is
+    returned unchanged (see ``transliteration_candidates``).
+    """
+    if not is_ascii_word(token):
+        return token
+    if any(c in _BETA_SIGNS for c in token):
+        return beta_to_greek(token)
+    candidates = transliteration_candidates(token)
+    if len(candidates) == 1:
+        return candidates[0]
+    greek = latin_to_greek(token)
+    if not candidates:
+        return greek
+    spellings = {strip_diacritics(form) for form in candidates}
+    if len(spellings) == 1:
+        return _spell_as(greek, spellings.pop())
+    return token
@@ -9,8 +9,8 @@ from rich.text import Text
 from rich.columns import Columns
 from rich import box
 
-from data import WORDS
-from grammar import ParseNode
+from data import WORDS, lemma_forms, pack_features
+from grammar import FlatNode, FlatTree, ParseNode
 
 console = Console()
 
@@ -111,8 +111,13 @@ def display_flashcard(lemma: str, revealed: bool = False, in_vocabulary: bool =
         header_text.append(str(header))
         header_text.append(f'\n\n  "{meaning}"', style="bold green")
 
-        # Build forms table
-        forms = entry.get("forms", {})
+        # Build forms table from the entry alone: a flashcard session
+        # should not pay for the whole form index.
+        forms = lemma_forms(lemma)
+
+        def cell(**features: str) -> str | None:
+            return forms.get(pack_features(features))
+
         cases = ["nom", "gen", "dat", "acc"]
 
         if pos == "noun":
@@ -124,9 +129,9 @@ def display_flashcard(lemma: str, revealed: bool = False, in_vocabulary: bool =
                 if number == "pl":
                     tbl.add_row("", "")
                 for case in cases:
-                    key = f"{case}_{number}"
-                    if key in forms:
-                        tbl.add_row(f"{case}.{number}", forms[key])
+                    form = cell(case=case, number=number)
+                    if form:
+                        tbl.add_row(f"{case}.{number}", form)
 
         elif pos == "verb":
             tenses = ["pres", "impf", "fut", "aor"]
@@ -144,14 +149,18 @@ def display_flashcard(lemma: str, revealed: bool = False, in_vocabulary: bool =
                     for person in ("1", "2", "3"):
                         row = [f"{person}{number}"]
                         for t in tenses:
-                            key = f"{t}_{voice_key}_ind_{person}{number}"
-                            row.append(forms.get(key, ""))
+                            row.append(cell(
+                                tense=t, voice=voice_key, mood="ind",
+                                person=person, number=number,
+                            ) or "")
                         voice_tbl.add_row(*row)
                 verb_tables.append((voice_label, voice_tbl))
             # Participle forms (nom.sg for masc/fem/neut)
-            ptcp_m = forms.get("pres_act_ptcp_nom_sg_masc", "")
-            ptcp_f = forms.get("pres_act_ptcp_nom_sg_fem", "")
-            ptcp_n = forms.get("pres_act_ptcp_nom_sg_neut", "")
+            ptcp_m, ptcp_f, ptcp_n = (
+                cell(tense="pres", voice="act", mood="ptcp",
+                     case="nom", number="sg", gender=gender) or ""
+                for gender in ("masc", "fem", "neut")
+            )
             if ptcp_m:
                 ptcp_tbl = Table(show_header=True, box=None, padding=(0, 1),
                                  pad_edge=False)
@@ -173,9 +182,11 @@ def display_flashcard(lemma: str, revealed: bool = False, in_vocabulary: bool =
                 if number == "pl":
                     tbl.add_row("", "", "", "")
                 for case in cases:
-                    masc = forms.get(f"{case}_{number}_masc", "")
-                    fem = forms.get(f"{case}_{number}_fem", "")
-                    neut = forms.get(f"{case}_{number}_neut", "")
+                    masc, fem, neut = (
+                        cell(case=case, number=number,
+                             gender=gender) or ""
+                        for gender in ("masc", "fem", "neut")
+                    )
                     if masc or fem or neut:
                         tbl.add_row(f"{case}.{number}", masc, fem, neut)
         else:
@@ -230,7 +241,7 @@ def _format_features_short(features: dict) -> str:
     return ",".join(parts)
 
 
-def _build_tree_renderable(node: ParseNode):
+def _build_tree_renderable(node: ParseNode | FlatNode):
     """Recursively build a Rich renderable for a parse tree node."""
     feat_str = _format_features_short(node.features)
     color = COLORS.get(node.symbol, "white")
@@ -262,10 +273,16 @@ def _build_tree_renderable(node: ParseNode):
     )
 
 
-def display_parse_tree(tree: ParseNode, indent: int = 0):
-    """Display a parse tree with colored nested boxes."""
+def display_parse_tree(tree: ParseNode | FlatTree, indent: int = 0):
+    """Display a parse tree with colored nested boxes.
+
+    Accepts either a ``ParseNode`` or its flat encoding; flat trees are
+    walked in place through ``FlatNode`` views.
+    """
     if tree is None:
         return
+    if isinstance(tree, FlatTree):
+        tree = tree.root()
 
     renderable = _build_tree_renderable(tree)
     # Use heavy box for the outermost S node
@@ -7,6 +7,7 @@ import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from availability import note_learned
 from data import WORDS
 
 DATA_FILE = Path(__file__).parent / "user_data.json"
@@ -37,6 +38,7 @@ def add_to_vocabulary(data: dict, lemma: str) -> bool:
     """Add a lemma to the user's vocabulary. Returns True if newly added."""
     if lemma not in data["vocabulary"]:
         data["vocabulary"].append(lemma)
+        note_learned(data["vocabulary"], lemma)
         data["flashcard_progress"][lemma] = {
             "box": 1,
             "next_review": datetime.now().strftime("%Y-%m-%d"),
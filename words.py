@@ -0,0 +1,460 @@
+"""Source lexicon for Ancient Greek: word entries keyed by lemma.
+
+This is the editable source of truth.  At runtime the app reads the
+compiled binary form (see ``lexicon``), which is rebuilt automatically
+whenever this file changes.
+"""
+
+from __future__ import annotations
+
+# ---------------------------------------------------------------------------
+# Word entries keyed by lemma
+# ---------------------------------------------------------------------------
+
+WORDS: dict[str, dict] = {
+    # ── Articles ──────────────────────────────────────────────────────────
+    "ὁ": {
+        "lemma": "ὁ",
+        "pos": "article",
+        "meaning": "the",
+        "translations": ["the"],
+        "forms": {
+            # masculine
+            "nom_sg_masc": "ὁ",
+            "gen_sg_masc": "τοῦ",
+            "dat_sg_masc": "τῷ",
+            "acc_sg_masc": "τόν",
+            "nom_pl_masc": "οἱ",
+            "gen_pl_masc": "τῶν",
+            "dat_pl_masc": "τοῖς",
+            "acc_pl_masc": "τούς",
+            # feminine
+            "nom_sg_fem": "ἡ",
+            "gen_sg_fem": "τῆς",
+            "dat_sg_fem": "τῇ",
+            "acc_sg_fem": "τήν",
+            "nom_pl_fem": "αἱ",
+            "gen_pl_fem": "τῶν",
+            "dat_pl_fem": "ταῖς",
+            "acc_pl_fem": "τάς",
+            # neuter
+            "nom_sg_neut": "τό",
+            "gen_sg_neut": "τοῦ",
+            "dat_sg_neut": "τῷ",
+            "acc_sg_neut": "τό",
+            "nom_pl_neut": "τά",
+            "gen_pl_neut": "τῶν",
+            "dat_pl_neut": "τοῖς",
+            "acc_pl_neut": "τά",
+        },
+    },
+
+    # ── Nouns ─────────────────────────────────────────────────────────────
+    "ἄνθρωπος": {
+        "lemma": "ἄνθρωπος",
+        "pos": "noun",
+        "meaning": "man, human being",
+        "translations": ["man", "human"],
+        "gender": "masculine",
+        "declension": 2,
+        "principal_parts": ["ἄνθρωπος", "ἀνθρώπου"],
+    },
+    "ἵππος": {
+        "lemma": "ἵππος",
+        "pos": "noun",
+        "meaning": "horse",
+        "translations": ["horse"],
+        "gender": "masculine",
+        "declension": 2,
+        "principal_parts": ["ἵππος", "ἵππου"],
+    },
+    "λόγος": {
+        "lemma": "λόγος",
+        "pos": "noun",
+        "meaning": "word, speech, reason",
+        "translations": ["word", "speech", "reason"],
+        "gender": "masculine",
+        "declension": 2,
+        "principal_parts": ["λόγος", "λόγου"],
+    },
+    "δῶρον": {
+        "lemma": "δῶρον",
+        "pos": "noun",
+        "meaning": "gift",
+        "translations": ["gift"],
+        "gender": "neuter",
+        "declension": 2,
+        "principal_parts": ["δῶρον", "δώρου"],
+    },
+    "θεός": {
+        "lemma": "θεός",
+        "pos": "noun",
+        "meaning": "god",
+        "translations": ["god"],
+        "gender": "masculine",
+        "declension": 2,
+        "principal_parts": ["θεός", "θεοῦ"],
+    },
+    "στρατιώτης": {
+        "lemma": "στρατιώτης",
+        "pos": "noun",
+        "meaning": "soldier",
+        "translations": ["soldier"],
+        "gender": "masculine",
+        "declension": 1,
+        "principal_parts": ["στρατιώτης", "στρατιώτου"],
+    },
+    "ψυχή": {
+        "lemma": "ψυχή",
+        "pos": "noun",
+        "meaning": "soul, spirit",
+        "translations": ["soul", "spirit"],
+        "gender": "feminine",
+        "declension": 1,
+        "principal_parts": ["ψυχή", "ψυχῆς"],
+    },
+    "θάλαττα": {
+        "lemma": "θάλαττα",
+        "pos": "noun",
+        "meaning": "sea",
+        "translations": ["sea"],
+        "gender": "feminine",
+        "declension": 1,
+        "principal_parts": ["θάλαττα", "θαλάττης"],
+    },
+    "ἀλήθεια": {
+        "lemma": "ἀλήθεια",
+        "pos": "noun",
+        "meaning": "truth",
+        "translations": ["truth"],
+        "gender": "feminine",
+        "declension": 1,
+        "principal_parts": ["ἀλήθεια", "ἀληθείας"],
+    },
+    "οἰκία": {
+        "lemma": "οἰκία",
+        "pos": "noun",
+        "meaning": "house",
+        "translations": ["house"],
+        "gender": "feminine",
+        "declension": 1,
+        "principal_parts": ["οἰκία", "οἰκίας"],
+    },
+    "παιδίον": {
+        "lemma": "παιδίον",
+        "pos": "noun",
+        "meaning": "child",
+        "translations": ["child"],
+        "gender": "neuter",
+        "declension": 2,
+        "principal_parts": ["παιδίον", "παιδίου"],
+    },
+    "βιβλίον": {
+        "lemma": "βιβλίον",
+        "pos": "noun",
+        "meaning": "book",
+        "translations": ["book"],
+        "gender": "neuter",
+        "declension": 2,
+        "principal_parts": ["βιβλίον", "βιβλίου"],
+    },
+    "πόλεμος": {
+        "lemma": "πόλεμος",
+        "pos": "noun",
+        "meaning": "war",
+        "translations": ["war"],
+        "gender": "masculine",
+        "declension": 2,
+        "principal_parts": ["πόλεμος", "πολέμου"],
+    },
+    "εἰρήνη": {
+        "lemma": "εἰρήνη",
+        "pos": "noun",
+        "meaning": "peace",
+        "translations": ["peace"],
+        "gender": "feminine",
+        "declension": 1,
+        "principal_parts": ["εἰρήνη", "εἰρήνης"],
+    },
+    "νῆσος": {
+        "lemma": "νῆσος",
+        "pos": "noun",
+        "meaning": "island",
+        "translations": ["island"],
+        "gender": "feminine",
+        "declension": 2,
+        "principal_parts": ["νῆσος", "νήσου"],
+    },
+
+    # ── Verbs ─────────────────────────────────────────────────────────────
+    "λύω": {
+        "lemma": "λύω",
+        "pos": "verb",
+        "meaning": "I loosen, release",
+        "translations": ["loosen", "release", "ransom"],
+        "conjugation": "thematic",
+        "principal_parts": ["λῡ́ω", "λύσω", "ἔλυσα"],
+        "participles": True,
+    },
+    "γράφω": {
+        "lemma": "γράφω",
+        "pos": "verb",
+        "meaning": "I write",
+        "translations": ["write"],
+        "conjugation": "thematic",
+        "principal_parts": ["γράφω", "γράψω", "ἔγραψα"],
+        "participles": True,
+    },
+    "παιδεύω": {
+        "lemma": "παιδεύω",
+        "pos": "verb",
+        "meaning": "I teach, educate",
+        "translations": ["teach", "educate"],
+        "conjugation": "thematic",
+        "principal_parts": ["παιδεύω", "παιδεύσω", "ἐπαίδευσα"],
+    },
+    "πέμπω": {
+        "lemma": "πέμπω",
+        "pos": "verb",
+        "meaning": "I send",
+        "translations": ["send"],
+        "conjugation": "thematic",
+        "principal_parts": ["πέμπω", "πέμψω", "ἔπεμψα"],
+        "participles": True,
+    },
+    "φέρω": {
+        "lemma": "φέρω",
+        "pos": "verb",
+        "meaning": "I carry, bear",
+        "translations": ["carry", "bear"],
+        "conjugation": "thematic",
+        "principal_parts": ["φέρω", "οἴσω", "ἤνεγκα"],
+    },
+    "ἄγω": {
+        "lemma": "ἄγω",
+        "pos": "verb",
+        "meaning": "I lead",
+        "translations": ["lead"],
+        "conjugation": "thematic",
+        "principal_parts": ["ἄγω", "ἄξω", "ἤγαγον"],
+    },
+    "λέγω": {
+        "lemma": "λέγω",
+        "pos": "verb",
+        "meaning": "I say, speak",
+        "translations": ["say", "speak"],
+        "conjugation": "thematic",
+        "principal_parts": ["λέγω", "λέξω", "ἔλεξα"],
+    },
+    "ἔχω": {
+        "lemma": "ἔχω",
+        "pos": "verb",
+        "meaning": "I have, hold",
+        "translations": ["have", "hold"],
+        "conjugation": "thematic",
+        "principal_parts": ["ἔχω", "ἕξω", "ἔσχον", "εἶχον"],
+    },
+    "βλέπω": {
+        "lemma": "βλέπω",
+        "pos": "verb",
+        "meaning": "I see, look",
+        "translations": ["see", "look"],
+        "conjugation": "thematic",
+        "principal_parts": ["βλέπω", "βλέψω", "ἔβλεψα"],
+    },
+    "διδάσκω": {
+        "lemma": "διδάσκω",
+        "pos": "verb",
+        "meaning": "I teach",
+        "translations": ["teach"],
+        "conjugation": "thematic",
+        "principal_parts": ["διδάσκω", "διδάξω", "ἐδίδαξα"],
+    },
+
+    # ── Verbs with non-accusative objects ─────────────────────────────────
+    "ἀκούω": {
+        "lemma": "ἀκούω",
+        "pos": "verb",
+        "meaning": "I hear, listen to",
+        "translations": ["hear", "listen"],
+        "conjugation": "thematic",
+        "object_case": "gen",
+        "principal_parts": ["ἀκούω", "ἀκούσω", "ἤκουσα"],
+    },
+    "ἐπιτρέπω": {
+        "lemma": "ἐπιτρέπω",
+        "pos": "verb",
+        "meaning": "I permit, allow",
+        "translations": ["permit", "allow"],
+        "conjugation": "thematic",
+        "object_case": "dat",
+        "principal_parts": ["ἐπιτρέπω", "ἐπιτρέψω", "ἐπέτρεψα"],
+    },
+
+    # ── Deponent verbs ───────────────────────────────────────────────────
+    "ἔρχομαι": {
+        "lemma": "ἔρχομαι",
+        "pos": "verb",
+        "meaning": "I go, come",
+        "translations": ["go", "come"],
+        "conjugation": "thematic",
+        "deponent": True,
+        "principal_parts": ["ἔρχομαι", "ἐλεύσομαι", "ἦλθον"],
+    },
+    "γίγνομαι": {
+        "lemma": "γίγνομαι",
+        "pos": "verb",
+        "meaning": "I become",
+        "translations": ["become"],
+        "conjugation": "thematic",
+        "deponent": True,
+        "principal_parts": ["γίγνομαι", "γενήσομαι", "ἐγενόμην"],
+    },
+    "βούλομαι": {
+        "lemma": "βούλομαι",
+        "pos": "verb",
+        "meaning": "I wish, want",
+        "translations": ["wish", "want"],
+        "conjugation": "thematic",
+        "deponent": True,
+        "principal_parts": ["βούλομαι", "βουλήσομαι", "ἐβουλήθην"],
+    },
+    "δέχομαι": {
+        "lemma": "δέχομαι",
+        "pos": "verb",
+        "meaning": "I receive",
+        "translations": ["receive"],
+        "conjugation": "thematic",
+        "deponent": True,
+        "principal_parts": ["δέχομαι", "δέξομαι", "ἐδεξάμην"],
+    },
+
+    # ── Adjectives ────────────────────────────────────────────────────────
+    "ἀγαθός": {
+        "lemma": "ἀγαθός",
+        "pos": "adjective",
+        "meaning": "good, noble",
+        "translations": ["good", "noble"],
+        "principal_parts": ["ἀγαθός", "ἀγαθή", "ἀγαθόν"],
+    },
+    "κακός": {
+        "lemma": "κακός",
+        "pos": "adjective",
+        "meaning": "bad, evil",
+        "translations": ["bad", "evil"],
+        "principal_parts": ["κακός", "κακή", "κακόν"],
+    },
+    "καλός": {
+        "lemma": "καλός",
+        "pos": "adjective",
+        "meaning": "beautiful, fine",
+        "translations": ["beautiful", "fine"],
+        "principal_parts": ["καλός", "καλή", "καλόν"],
+    },
+    "σοφός": {
+        "lemma": "σοφός",
+        "pos": "adjective",
+        "meaning": "wise",
+        "translations": ["wise"],
+        "principal_parts": ["σοφός", "σοφή", "σοφόν"],
+    },
+    "μικρός": {
+        "lemma": "μικρός",
+        "pos": "adjective",
+        "meaning": "small, little",
+        "translations": ["small", "little"],
+        "principal_parts": ["μικρός", "μικρά", "μικρόν"],
+    },
+    "μέγας": {
+        "lemma": "μέγας",
+        "pos": "adjective",
+        "meaning": "great, large",
+        "translations": ["great", "large"],
+        "forms": {
+            "nom_sg_masc": "μέγας",  "gen_sg_masc": "μεγάλου",
+            "dat_sg_masc": "μεγάλῳ", "acc_sg_masc": "μέγαν",
+            "nom_pl_masc": "μεγάλοι", "gen_pl_masc": "μεγάλων",
+            "dat_pl_masc": "μεγάλοις", "acc_pl_masc": "μεγάλους",
+            "nom_sg_fem": "μεγάλη",  "gen_sg_fem": "μεγάλης",
+            "dat_sg_fem": "μεγάλῃ",  "acc_sg_fem": "μεγάλην",
+            "nom_pl_fem": "μεγάλαι", "gen_pl_fem": "μεγάλων",
+            "dat_pl_fem": "μεγάλαις", "acc_pl_fem": "μεγάλας",
+            "nom_sg_neut": "μέγα",   "gen_sg_neut": "μεγάλου",
+            "dat_sg_neut": "μεγάλῳ", "acc_sg_neut": "μέγα",
+            "nom_pl_neut": "μεγάλα", "gen_pl_neut": "μεγάλων",
+            "dat_pl_neut": "μεγάλοις", "acc_pl_neut": "μεγάλα",
+        },
+    },
+    "δίκαιος": {
+        "lemma": "δίκαιος",
+        "pos": "adjective",
+        "meaning": "just, righteous",
+        "translations": ["just", "righteous"],
+        "principal_parts": ["δίκαιος", "δικαία", "δίκαιον"],
+    },
+    "ἄξιος": {
+        "lemma": "ἄξιος",
+        "pos": "adjective",
+        "meaning": "worthy, deserving",
+        "translations": ["worthy", "deserving"],
+        "principal_parts": ["ἄξιος", "ἀξία", "ἄξιον"],
+    },
+
+    # ── Prepositions ──────────────────────────────────────────────────────
+    "ἐν": {
+        "lemma": "ἐν",
+        "pos": "preposition",
+        "meaning": "in (+ dative)",
+        "translations": ["in"],
+        "governs": "dat",
+        "forms": {"base": "ἐν"},
+    },
+    "εἰς": {
+        "lemma": "εἰς",
+        "pos": "preposition",
+        "meaning": "into, to (+ accusative)",
+        "translations": ["into"],
+        "governs": "acc",
+        "forms": {"base": "εἰς"},
+    },
+    "ἐκ": {
+        "lemma": "ἐκ",
+        "pos": "preposition",
+        "meaning": "out of, from (+ genitive)",
+        "translations": ["out of"],
+        "governs": "gen",
+        "forms": {"base": "ἐκ"},
+    },
+    "πρός": {
+        "lemma": "πρός",
+        "pos": "preposition",
+        "meaning": "to, toward (+ accusative)",
+        "translations": ["toward"],
+        "governs": "acc",
+        "forms": {"base": "πρός"},
+    },
+    "ἀπό": {
+        "lemma": "ἀπό",
+        "pos": "preposition",
+        "meaning": "from, away from (+ genitive)",
+        "translations": ["away from"],
+        "governs": "gen",
+        "forms": {"base": "ἀπό"},
+    },
+
+    # ── Conjunctions ──────────────────────────────────────────────────────
+    "καί": {
+        "lemma": "καί",
+        "pos": "conjunction",
+        "meaning": "and",
+        "translations": ["and"],
+        "forms": {"base": "καί"},
+    },
+    "ἀλλά": {
+        "lemma": "ἀλλά",
+        "pos": "conjunction",
+        "meaning": "but",
+        "translations": ["but"],
+        "forms": {"base": "ἀλλά"},
+    },
+}